@@ -0,0 +1,52 @@
+"""
+Compare the numeric and symbolic solvers used by context reduction.
+
+For each size, random square systems with a few free parameters are solved
+with the LAPACK path and with sympy. The script prints the mean time per
+system and the largest difference between the solutions.
+"""
+import time
+
+import numpy as np
+
+from pacti.iocontract import Var
+from pacti.terms.polyhedra.polyhedra import PolyhedralTerm, PolyhedralTermList
+
+n_parameters = 3
+n_systems = 20
+rng = np.random.default_rng(0)
+
+
+def random_system(n_vars: int) -> tuple:
+    variables = [Var(f"x{i}") for i in range(n_vars)]
+    parameters = [Var(f"p{i}") for i in range(n_parameters)]
+    matrix = rng.uniform(-10, 10, (n_vars, n_vars + n_parameters)).round(3)
+    vector = rng.uniform(-10, 10, n_vars).round(3)
+    context = PolyhedralTermList.polytope_to_termlist(matrix, vector, variables + parameters)
+    return context, variables
+
+
+def timed(solver, systems: list) -> tuple:
+    start = time.perf_counter()
+    solutions = [solver(context, variables) for context, variables in systems]
+    return (time.perf_counter() - start) / len(systems), solutions
+
+
+def difference(numeric: dict, symbolic: dict) -> float:
+    largest = 0.0
+    for var, term in numeric.items():
+        other = symbolic[var]
+        largest = max(largest, abs(term.constant - other.constant))
+        for param in set(term.vars) | set(other.vars):
+            largest = max(largest, abs(term.get_coefficient(param) - other.get_coefficient(param)))
+    return largest
+
+
+print(f"{'size':>4} {'numeric (ms)':>13} {'sympy (ms)':>11} {'speedup':>8} {'max diff':>9}")
+for size in range(1, 7):
+    systems = [random_system(size) for _ in range(n_systems)]
+    numeric_time, numeric = timed(PolyhedralTerm._solve_numerically, systems)
+    symbolic_time, symbolic = timed(PolyhedralTerm._solve_symbolically, systems)
+    error = max(difference(num, sym) for num, sym in zip(numeric, symbolic))
+    speedup = symbolic_time / numeric_time
+    print(f"{size:>4} {numeric_time * 1e3:>13.3f} {symbolic_time * 1e3:>11.3f} {speedup:>8.1f} {error:>9.1e}")
@@ -7,6 +7,8 @@ from typing import Dict, List, Optional, Tuple, TypedDict, Union
 from pacti.iocontract import IoContract, IoContractCompound, NestedTermList, TacticStatistics, Var
 from pacti.terms.polyhedra import serializer
 from pacti.terms.polyhedra.polyhedra import PolyhedralTerm, PolyhedralTermList
+from pacti.utils.errors import IncompatibleArgsError
+from pacti.utils.lists import OrderedSet, list_intersection, list_union
 
 numeric = Union[int, float]
 ser_pt = Dict[str, Union[float, Dict[str, float]]]
@@ -18,23 +20,82 @@ ser_contract = TypedDict(
 TACTICS_ORDER = [1, 2, 3, 4, 5]  # noqa: WPS407
 
 
+def _rename_in_io_lists(inputvars: List[Var], outputvars: List[Var], source_var: Var, target_var: Var) -> None:
+    # same bookkeeping as IoContract.rename_variable, done in place
+    if source_var == target_var:
+        return
+    for this_list, that_list in ((inputvars, outputvars), (outputvars, inputvars)):
+        if source_var in this_list:
+            if target_var in that_list:
+                raise IncompatibleArgsError("Making variable %s both an input and output" % (target_var))
+            elif target_var not in this_list:
+                this_list[this_list.index(source_var)] = target_var
+            else:
+                this_list.remove(source_var)
+            return
+
+
 class PolyhedralIoContract(IoContract):
     """IO Contracts with assumptions and guarantees expressed as polyhedral constraints."""
 
-    def rename_variables(self, variable_mappings: List[Tuple[str, str]]) -> PolyhedralIoContract:
+    def rename_variables(
+        self, variable_mappings: List[Tuple[str, str]], simultaneous: bool = False
+    ) -> PolyhedralIoContract:
         """
         Rename variables in a contract.
 
+        The constraints of the contract are rewritten in a single pass, and
+        the guarantees are not simplified again unless the renaming merges
+        variables of the contract.
+
         Args:
-            variable_mappings: Variables to be replaced.
+            variable_mappings: Variables to be replaced, given as pairs `(source, target)`.
+            simultaneous: If False, the mappings are applied one after the
+                other, as successive calls to `rename_variable`. If True, they
+                are applied at the same time, which allows swapping or permuting
+                variables.
 
         Returns:
             A contract with `source_var` replaced by `target_var`.
+
+        Raises:
+            IncompatibleArgsError: The mappings are inconsistent or make a
+                variable both an input and an output.
         """
-        new_contract = self.copy()
-        for mapping in variable_mappings:
-            new_contract = new_contract.rename_variable(Var(mapping[0]), Var(mapping[1]))
-        return new_contract
+        inputvars = self.inputvars.copy()
+        outputvars = self.outputvars.copy()
+        renaming: Dict[Var, Var] = {}
+        if simultaneous:
+            for source_name, target_name in variable_mappings:
+                source_var, target_var = Var(source_name), Var(target_name)
+                if renaming.get(source_var, target_var) != target_var:
+                    raise IncompatibleArgsError("Variable %s is renamed more than once" % (source_var))
+                renaming[source_var] = target_var
+            inputvars = list(OrderedSet(renaming.get(var, var) for var in inputvars))
+            outputvars = list(OrderedSet(renaming.get(var, var) for var in outputvars))
+            if list_intersection(inputvars, outputvars):
+                raise IncompatibleArgsError(
+                    "Making variables %s both inputs and outputs" % (list_intersection(inputvars, outputvars))
+                )
+        else:
+            for source_name, target_name in variable_mappings:
+                source_var, target_var = Var(source_name), Var(target_name)
+                _rename_in_io_lists(inputvars, outputvars, source_var, target_var)
+                # compose the mapping with the renamings seen so far
+                for var, renamed_var in renaming.items():  # noqa: VNE002
+                    if renamed_var == source_var:
+                        renaming[var] = target_var
+                renaming.setdefault(source_var, target_var)
+        renaming = {var: target for var, target in renaming.items() if var != target}
+        assumptions = self.a.rename_variables(renaming)
+        guarantees = self._g.rename_variables(renaming)
+        that = PolyhedralIoContract(assumptions, guarantees, inputvars, outputvars)
+        # renaming preserves redundancy unless variables are merged
+        contract_vars = list_union(self.vars, list_union(self.a.vars, self._g.vars))
+        new_vars = [renaming.get(var, var) for var in contract_vars]
+        if len(set(new_vars)) == len(new_vars):
+            return that._with_state_of(self)  # noqa: WPS437
+        return that
 
     def to_machine_dict(self) -> ser_contract:
         """
@@ -309,7 +370,7 @@ class PolyhedralIoContract(IoContract):
         new_expr = expr + " <= 0"
         variables = serializer.polyhedral_termlist_from_string(new_expr)[0].variables
         constraints: PolyhedralTermList = self.a | self.g
-        return constraints.optimize(objective=variables, maximize=maximize)
+        return constraints.optimize(objective=dict(variables), maximize=maximize)
 
     def get_variable_bounds(
         self, var: str
@@ -323,9 +384,8 @@ class PolyhedralIoContract(IoContract):
         Returns:
             The minimum and maximum values for the variable in the context of the contract.
         """
-        maximum = self.optimize(var, maximize=True)
-        minimum = self.optimize(var, maximize=False)
-        return minimum, maximum
+        constraints: PolyhedralTermList = self.a | self.g
+        return constraints.get_variable_bounds(Var(var))
 
 
 class NestedPolyhedra(NestedTermList):
@@ -6,7 +6,7 @@ import logging
 from typing import Dict, Generic, List, TypeVar, Union
 
 from pacti.iocontract.iocontract import TermList_t, Var
-from pacti.utils.lists import list_diff, list_intersection, list_union
+from pacti.utils.lists import OrderedSet, list_diff, list_intersection, list_union
 
 NestedTermlist_t = TypeVar("NestedTermlist_t", bound="NestedTermList")
 IoContractCompound_t = TypeVar("IoContractCompound_t", bound="IoContractCompound")
@@ -113,10 +113,10 @@ class NestedTermList:
         Returns:
             List of variables referenced in nested termlist.
         """
-        varlist: List[Var] = []
+        varset: OrderedSet[Var] = OrderedSet()
         for tl in self.nested_termlist:
-            varlist = list_union(varlist, tl.vars)
-        return varlist
+            varset.update(tl.vars)
+        return varset.to_list()
 
     def copy(self: NestedTermlist_t, force_empty_intersection: bool) -> NestedTermlist_t:
         """
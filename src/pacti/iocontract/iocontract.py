@@ -17,13 +17,14 @@ Term and TermList with specific constraint formalisms.
 """
 from __future__ import annotations
 
-import copy
+import hashlib
+import itertools
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Generic, List, Optional, Tuple, TypeVar
+from typing import Any, ClassVar, Dict, Generic, List, Optional, Tuple, TypeVar
 
 from pacti.utils.errors import IncompatibleArgsError
-from pacti.utils.lists import list_diff, list_intersection, list_union, lists_equal
+from pacti.utils.lists import OrderedSet, ReadOnlyList, list_diff, list_intersection, list_union, lists_equal
 
 Var_t = TypeVar("Var_t", bound="Var")
 Term_t = TypeVar("Term_t", bound="Term")
@@ -39,16 +40,39 @@ class Var:
     Variables used in system modeling.
 
     Variables allow us to name an entity for which we want to write constraints.
+    Variables are interned: constructing a variable with a name that is already
+    in use returns the existing instance. Thus, two variables are equal if and
+    only if they are the same object.
     """
 
-    def __init__(self, varname: str):
+    __slots__ = ("_name", "_hash", "_id")
+    _name: str
+    _hash: int
+    _id: int
+
+    _intern_table: ClassVar[Dict[str, Var]] = {}
+    _id_counter = itertools.count()
+
+    def __new__(cls, varname: str) -> Var:  # noqa: WPS231
         """
         Constructor for Var.
 
         Args:
             varname: The name of the variable.
+
+        Returns:
+            The unique variable with the given name.
         """
-        self._name = str(varname)
+        name = str(varname)
+        instance = cls._intern_table.get(name)
+        if instance is None:
+            instance = super().__new__(cls)
+            instance._name = name  # noqa: WPS437
+            instance._hash = hash(name)  # noqa: WPS437
+            instance._id = next(cls._id_counter)  # noqa: WPS437
+            # another thread may have interned the name in the meantime
+            instance = cls._intern_table.setdefault(name, instance)
+        return instance
 
     @property
     def name(self) -> str:
@@ -59,19 +83,38 @@ class Var:
         """
         return self._name
 
+    @property
+    def id(self) -> int:  # noqa: A003
+        """A process-wide integer identifier of the variable.
+
+        Returns:
+            The identifier of the variable.
+        """
+        return self._id
+
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, type(self)):
+        if not isinstance(other, Var):
             raise ValueError()
-        return self.name == other.name
+        return self is other
 
     def __str__(self) -> str:
-        return self.name
+        return self._name
 
     def __hash__(self) -> int:
-        return hash(self.name)
+        return self._hash
 
     def __repr__(self) -> str:
-        return "<Var {0}>".format(self.name)
+        return "<Var {0}>".format(self._name)
+
+    def __reduce__(self) -> Tuple[Any, Tuple[str]]:
+        # unpickling goes through the intern table
+        return (Var, (self._name,))
+
+    def __copy__(self) -> Var:
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Var:
+        return self
 
 
 class Term(ABC):
@@ -151,10 +194,40 @@ class TermList(ABC):
         Args:
             term_list: A list of terms contained by TermList.
         """
-        if term_list:
-            self.terms = term_list.copy()
-        else:
-            self.terms = []
+        # cached list of variables and variable-to-column map; they are
+        # computed on demand and cleared whenever the terms change
+        self._vars_cache: Optional[List[Var]] = None
+        self._var_index_cache: Optional[Dict[Var, int]] = None
+        self._terms = ReadOnlyList(term_list or [])
+
+    @property
+    def terms(self) -> List[Any]:
+        """
+        The terms contained in the termlist.
+
+        The returned list cannot be modified in place. Use the setter or the
+        methods `add_terms`, `remove_term`, and `replace_term` instead, so
+        that cached information about the termlist is kept up to date.
+
+        Returns:
+            The list of terms.
+        """
+        return self._terms
+
+    @terms.setter
+    def terms(self, terms: List[Any]) -> None:
+        self._terms = ReadOnlyList(terms)
+        self._terms_changed()
+
+    def _terms_changed(self) -> None:
+        self._vars_cache = None
+        self._var_index_cache = None
+
+    def _compute_vars(self) -> List[Var]:
+        varset: OrderedSet[Var] = OrderedSet()
+        for t in self.terms:
+            varset.update(t.vars)
+        return varset.to_list()
 
     @property
     def vars(self) -> List[Var]:  # noqa: A003
@@ -163,10 +236,59 @@ class TermList(ABC):
         Returns:
             List of variables referenced in the term.
         """
-        varlist: List[Var] = []
-        for t in self.terms:
-            varlist = list_union(varlist, t.vars)
-        return varlist
+        if self._vars_cache is None:
+            self._vars_cache = self._compute_vars()
+        return list(self._vars_cache)
+
+    @property
+    def var_index(self) -> Dict[Var, int]:
+        """Map from the variables of the termlist to their position in `vars`.
+
+        Returns:
+            The position of each variable in the list of variables.
+        """
+        if self._var_index_cache is None:
+            self._var_index_cache = {var: col for col, var in enumerate(self.vars)}  # noqa: VNE002
+        return self._var_index_cache
+
+    def add_terms(self, terms: List[Any]) -> None:
+        """
+        Append terms at the end of the termlist.
+
+        Args:
+            terms: The terms to append.
+        """
+        new_terms = list(terms)
+        variables = self._vars_cache
+        list.extend(self.terms, new_terms)
+        self._terms_changed()
+        if variables is not None:
+            # new variables can only appear after the existing ones
+            varset = OrderedSet(variables)
+            for t in new_terms:
+                varset.update(t.vars)
+            self._vars_cache = varset.to_list()
+
+    def remove_term(self, term: Term) -> None:
+        """
+        Remove the first occurrence of a term from the termlist.
+
+        Args:
+            term: The term to remove.
+        """
+        list.remove(self.terms, term)
+        self._terms_changed()
+
+    def replace_term(self, index: int, term: Term) -> None:
+        """
+        Replace the term at a given position of the termlist.
+
+        Args:
+            index: The position of the term to replace.
+            term: The new term.
+        """
+        list.__setitem__(self.terms, index, term)
+        self._terms_changed()
 
     def __str__(self) -> str:
         if self.terms:
@@ -195,6 +317,9 @@ class TermList(ABC):
                 terms.append(t)
         return type(self)(terms)
 
+    # The result of the set operators can be modified in place, so it is built
+    # from copies of the operands; subclasses with immutable terms share them
+    # in their copies.
     def __and__(self: TermList_t, other: TermList_t) -> TermList_t:
         return type(self)(list_intersection(self.copy().terms, other.copy().terms))
 
@@ -211,6 +336,23 @@ class TermList(ABC):
     def __hash__(self) -> int:
         ...
 
+    def fingerprint(self, ordered: bool = False) -> bytes:
+        """
+        A digest of the terms of the termlist that is the same in every process.
+
+        Subclasses may provide faster digests that agree with their notion of equality.
+
+        Args:
+            ordered: Whether the digest should depend on the order of the terms.
+
+        Returns:
+            A digest of the printed terms.
+        """
+        term_strings = [str(term) for term in self.terms]
+        if not ordered:
+            term_strings.sort()
+        return hashlib.blake2b("\n".join(term_strings).encode(), digest_size=16).digest()
+
     def copy(self: TermList_t) -> TermList_t:
         """
         Makes copy of termlist.
@@ -358,7 +500,9 @@ class IoContract(Generic[TermList_t]):
 
         a(TermList): Contract assumptions.
 
-        g(TermList): Contract guarantees.
+        g(TermList): Contract guarantees. When the contract is created with
+            `simplify=True`, the guarantees are simplified with respect to the
+            assumptions the first time they are accessed.
     """
 
     def __init__(
@@ -378,9 +522,11 @@ class IoContract(Generic[TermList_t]):
             input_vars: The input variables of the contract.
             output_vars: The output variables of the contract.
             simplify: Whether to simplify the guarantees with respect to the assumptions.
+                The simplification is deferred until the guarantees are accessed.
 
         Raises:
             IncompatibleArgsError: Arguments provided does not produce a valid IO contract.
+            ValueError: The guarantees are to be simplified but are unsatisfiable under the assumptions.
         """
         # make sure the input and output variables have no repeated entries
         if len(input_vars) != len(set(input_vars)):
@@ -412,18 +558,85 @@ class IoContract(Generic[TermList_t]):
                 "inputs nor outputs: %s. Inputs: %s. Outputs: %s. Guarantees: %s"
                 % (list_diff(guarantees.vars, list_union(input_vars, output_vars)), input_vars, output_vars, guarantees)
             )
+        # the simplification is deferred, but not the error it would raise
+        if simplify and (guarantees | assumptions).is_empty():
+            raise ValueError(
+                "The constraints \n{}\n".format(guarantees) + "are unsatisfiable in context \n{}".format(assumptions)
+            )
 
-        self.a: TermList_t = assumptions.copy()
+        self._a: TermList_t = assumptions.copy()
+        self._g: TermList_t = guarantees.copy()
         self.inputvars = input_vars.copy()
         self.outputvars = output_vars.copy()
-        if simplify:
-            self.g = guarantees.simplify(self.a)
-        else:
-            self.g = guarantees.copy()
+        # whether the guarantees are known to be simplified with respect to
+        # the current assumptions, and whether they should be simplified
+        # before they are observed
+        self._g_simplified = False
+        self._simplify_pending = simplify
+
+    @property
+    def a(self) -> TermList_t:
+        """
+        The assumptions of the contract.
+
+        Returns:
+            Contract assumptions.
+        """
+        return self._a
+
+    @a.setter
+    def a(self, assumptions: TermList_t) -> None:
+        # a pending simplification refers to the old assumptions
+        self._resolve_simplification()
+        self._a = assumptions
+        self._g_simplified = False
+
+    @property
+    def g(self) -> TermList_t:
+        """
+        The guarantees of the contract.
+
+        Returns:
+            Contract guarantees.
+        """
+        self._resolve_simplification()
+        return self._g
+
+    @g.setter
+    def g(self, guarantees: TermList_t) -> None:
+        self._g = guarantees
+        self._g_simplified = False
+        self._simplify_pending = False
+
+    @property
+    def simplified(self) -> bool:
+        """
+        Whether the guarantees are known to be simplified with respect to the assumptions.
+
+        Returns:
+            True if no redundant guarantees remain given the assumptions.
+        """
+        return self._g_simplified
+
+    def _resolve_simplification(self) -> None:
+        if self._simplify_pending and not self._g_simplified:
+            self._g = self._g.simplify(self._a)
+            self._g_simplified = True
+        self._simplify_pending = False
+
+    def _with_state_of(self: IoContract_t, other: IoContract[Any]) -> IoContract_t:
+        # carry over the simplification state of a contract whose guarantees
+        # have the same redundancy as ours
+        self._g_simplified = other._g_simplified  # noqa: WPS437
+        self._simplify_pending = other._simplify_pending  # noqa: WPS437
+        return self
 
     def simplify(self) -> None:
         """Simplifies guarantees given assumptions."""
-        self.g = self.g.simplify(self.a)
+        if not self._g_simplified:
+            self._g = self._g.simplify(self._a)
+            self._g_simplified = True
+        self._simplify_pending = False
 
     @property
     def vars(self) -> List[Var]:  # noqa: A003
@@ -463,7 +676,26 @@ class IoContract(Generic[TermList_t]):
         )
 
     def __hash__(self) -> int:
-        return hash((tuple(self.inputvars), tuple(self.outputvars), self.a, self.g))
+        return int.from_bytes(self.fingerprint[:8], "little", signed=True)
+
+    @property
+    def fingerprint(self) -> bytes:
+        """
+        A digest of the contract that is the same in every process.
+
+        It combines the names of the input and output variables with the
+        cached digests of the assumptions and guarantees.
+
+        Returns:
+            A digest of the contract.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for variables in (self.inputvars, self.outputvars):
+            digest.update("\0".join(var.name for var in variables).encode())  # noqa: VNE002
+            digest.update(b"\1")
+        digest.update(self.a.fingerprint())
+        digest.update(self.g.fingerprint())
+        return digest.digest()
 
     def rename_variable(  # noqa: WPS231 too much cognitive complexity
         self: IoContract_t, source_var: Var, target_var: Var
@@ -484,7 +716,9 @@ class IoContract(Generic[TermList_t]):
         inputvars = self.inputvars.copy()
         outputvars = self.outputvars.copy()
         assumptions = self.a.copy()
-        guarantees = self.g.copy()
+        guarantees = self._g.copy()
+        # renaming into a fresh variable does not change redundancy
+        fresh_target = target_var not in list_union(self.vars, list_union(self.a.vars, self._g.vars))
         if source_var != target_var:
             if source_var in inputvars:
                 if target_var in outputvars:
@@ -504,7 +738,10 @@ class IoContract(Generic[TermList_t]):
                     outputvars.remove(source_var)
                 assumptions = assumptions.rename_variable(source_var, target_var)
                 guarantees = guarantees.rename_variable(source_var, target_var)
-        return type(self)(assumptions, guarantees, inputvars, outputvars)
+        that = type(self)(assumptions, guarantees, inputvars, outputvars)
+        if fresh_target:
+            return that._with_state_of(self)  # noqa: WPS437
+        return that
 
     def copy(self: IoContract_t) -> IoContract_t:
         """
@@ -516,8 +753,8 @@ class IoContract(Generic[TermList_t]):
         inputvars = self.inputvars.copy()
         outputvars = self.outputvars.copy()
         assumptions = self.a.copy()
-        guarantees = self.g.copy()
-        return type(self)(assumptions, guarantees, inputvars, outputvars)
+        guarantees = self._g.copy()
+        return type(self)(assumptions, guarantees, inputvars, outputvars)._with_state_of(self)  # noqa: WPS437
 
     def __le__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
@@ -828,7 +1065,7 @@ class IoContract(Generic[TermList_t]):
         tactics_used: List[TacticStatistics] = []
         # get assumptions
         logging.debug("Computing quotient assumptions")
-        assumptions = copy.deepcopy(self.a)
+        assumptions = self.a.copy()
         empty_context = type(assumptions)([])
         if assumptions.refines(other.a):
             logging.debug("Extending top-level assumptions with divisor's guarantees")
@@ -841,13 +1078,13 @@ class IoContract(Generic[TermList_t]):
 
         # get guarantees
         logging.debug("Computing quotient guarantees")
-        guarantees: TermList_t = self.g
+        guarantees: TermList_t = self.g.copy()
         logging.debug("Using existing guarantees to aid system-level guarantees")
         try:  # noqa: WPS229
             (guarantees, used) = guarantees.elim_vars_by_refining(other.g | other.a, intvars, simplify, tactics_order)
             tactics_used.append(used)
         except ValueError:
-            guarantees = self.g
+            guarantees = self.g.copy()
         logging.debug("Guarantees are %s" % (guarantees))
         logging.debug("Using system-level assumptions to aid quotient guarantees")
         guarantees = guarantees | other.a
@@ -7,25 +7,841 @@ $x_i$ are variables and the $a_i$ and $c$ are constants.
 """
 from __future__ import annotations
 
+import bisect
+import hashlib
 import logging
 import time
-from typing import Any, Dict, List, Optional, Tuple, Union
+from fractions import Fraction
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Set, Tuple, TypeVar, Union, cast
 
 import numpy as np
 import sympy
-from scipy.optimize import linprog
+from scipy.sparse import csr_matrix, issparse, spmatrix
+from scipy.sparse import hstack as sparse_hstack
+from scipy.sparse import vstack as sparse_vstack
 
 import pacti.terms.polyhedra.serializer as serializer  # noqa: I250, WPS301
+from pacti.__version__ import __version__
 from pacti.iocontract import TacticStatistics, Term, TermList, Var
-from pacti.utils.lists import list_diff, list_intersection, list_union
+from pacti.utils.cache import LruCache, PersistentCache
+from pacti.utils.lists import ReadOnlyList, list_diff, list_intersection, list_union
+from pacti.utils.lp import (
+    LpSession,
+    executor_workers,
+    small_lps_supported,
+    solve_lp,
+    solve_lps,
+    solve_small_lps,
+    solver_settings,
+)
 
 numeric = Union[int, float]
+matrix_t = Union[np.ndarray, spmatrix]
+# variables of the columns, index pointers, column indices, coefficients and constants of the rows in CSR format
+row_view_t = Tuple[List[Var], np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+# result of a query answered up to a renaming of its variables
+query_result_t = TypeVar("query_result_t")
+
+
+class _SlotRows(NamedTuple):
+    """
+    A termlist of a cached query result, stored without the names of its variables.
+
+    The rows are kept in CSR format. Each column is given by the slot of its
+    variable in the query, or by the variable itself if it has no slot.
+    """
+
+    columns: Tuple[Union[int, Var], ...]
+    indptr: np.ndarray
+    indices: np.ndarray
+    data: np.ndarray
+    constants: np.ndarray
 
 TACTICS_ORDER = [1, 2, 3, 4, 5]  # noqa: WPS407
 
+# Tactic relaxing all the terms that other tactics could not transform at
+# once, by Fourier-Motzkin elimination. It is used by elim_vars_by_relaxing
+# when it appears in the tactics order. It is left out of TACTICS_ORDER: its
+# cost can grow exponentially with the number of variables eliminated, and
+# the terms it relaxes are otherwise dropped, so enabling it changes the
+# terms that compositions produce.
+PROJECTION_TACTIC = 7
+# The projection is abandoned when it has more rows than this
+PROJECTION_MAX_TERMS = 500  # noqa: WPS432
+# Redundant rows are removed with LPs whenever the rows grow by this factor
+PROJECTION_PRUNE_FACTOR = 2
+# Coefficients below this magnitude left by the elimination are set to zero
+PROJECTION_TOLERANCE = 1e-12
+
+# Tactic eliminating variables by substitution from the equalities (pairs of
+# opposite terms) of the termlist and its context before the other tactics
+# run. It is used when it appears in the tactics order. It is left out of
+# TACTICS_ORDER because it drops the equalities it uses and the terms that
+# substitution leaves without variables, which callers of the default tactics
+# get back in the transformed termlist. Callers opt in by adding it to the
+# tactics order.
+EQUALITY_TACTIC = 8
+
+# Constraint matrices with at least this many entries and at most this
+# fraction of nonzero entries are handled in sparse (CSR) format.
+SPARSE_MATRIX_MIN_ENTRIES = 5000  # noqa: WPS432
+SPARSE_MATRIX_MAX_DENSITY = 0.3  # noqa: WPS432
+
+
+# Redundancy removal switches to an output-sensitive method for polytopes with
+# at least this many rows. Polytopes without an interior ball of radius larger
+# than INTERIOR_RADIUS_TOLERANCE are always handled row by row.
+OUTPUT_SENSITIVE_REDUCTION_MIN_ROWS = 20  # noqa: WPS432
+# Fewer independent linear programs than this are solved in the calling
+# thread even with a pool executor, whose dispatch would cost more than it saves
+PARALLEL_MIN_LPS = 32  # noqa: WPS432
+INTERIOR_RADIUS_TOLERANCE = 1e-6  # noqa: WPS432
+RAY_TIE_TOLERANCE = 1e-9  # noqa: WPS432
+# Batched solves whose optimum is this close to the tested bound are confirmed with an LP
+SMALL_LP_TIE_TOLERANCE = 1e-9  # noqa: WPS432
+# Hit-and-run steps sampled to refute a containment before solving per-row LPs
+REFUTATION_SAMPLES = 16  # noqa: WPS432
+REFUTATION_TOLERANCE = 1e-9  # noqa: WPS432
+# Samples at the ends of a chord are moved inside by this fraction of their distance to the current point
+REFUTATION_CHORD_MARGIN = 1e-6  # noqa: WPS432
+# Chords along unbounded directions are cut at this distance, relative to the starting point
+REFUTATION_MAX_STEP = 1e3  # noqa: WPS432
+
+# Systems of equations whose condition number exceeds this bound are solved
+# with sympy instead of a floating-point factorization
+SOLVE_MAX_CONDITION = 1e10
+# sympy.solve works with the decimal expansion of floats to this many digits;
+# numeric solutions are only used when the system and its solution are not
+# changed by rounding to them, so that both solvers agree
+SOLVE_SIGNIFICANT_DIGITS = 15
+
+# Size of the digests identifying terms, termlists and contracts
+FINGERPRINT_BYTES = 16  # noqa: WPS432
+# Size of the integers and floats hashed by the digests
+FINGERPRINT_WORD_BYTES = 8
+
+# Results of is_empty, simplify, refines, optimize and variable elimination,
+# shared by all term lists. Queries are keyed up to a renaming of their
+# variables, so renamed copies of a termlist share their results. The keys
+# include the LP backend and the tunables of this module, so changing them
+# never returns results computed under other settings. Disable the cache
+# with `query_cache.enabled = False` and empty it with `query_cache.clear()`.
+QUERY_CACHE_SIZE = 4096  # noqa: WPS432
+query_cache = LruCache(QUERY_CACHE_SIZE)
+# Optional store of the same results on disk; see use_persistent_cache.
+# Bump the format whenever the stored results change meaning.
+PERSISTENT_CACHE_FORMAT = 7
+persistent_cache: Optional[PersistentCache] = None
+
+# Results of the per-term tactics found by the tactics in LOCAL_TACTICS alone,
+# keyed by the term, the helper terms that contain a variable to eliminate or
+# no variable, the variables to eliminate, the direction, the order of the
+# tactics and the solver settings. A result is thus reused by eliminations
+# whose other helper terms differ. Disable the cache with
+# `transform_cache.enabled = False` and empty it with `transform_cache.clear()`.
+TRANSFORM_CACHE_SIZE = 8192  # noqa: WPS432
+transform_cache = LruCache(TRANSFORM_CACHE_SIZE)
+# Tactics that only read the helper terms which contain a variable to eliminate
+# or no variable. Tactic 5 solves an LP over all the helper terms.
+LOCAL_TACTICS = frozenset((1, 2, 3, 4, 6))
+
+
+def use_persistent_cache(path: Optional[str]) -> None:
+    """
+    Keep the results of polyhedral queries in a file shared across processes and runs.
+
+    The file is versioned with the version of pacti, so upgrading the library
+    discards the results stored by previous releases. As in memory, the stored
+    results are keyed on the LP backend and the tunables of this module, so
+    processes with other settings do not share them. The results are stored
+    as JSON data, and reading them back runs no code from the file.
+
+    Args:
+        path: The SQLite file storing the results, or None to stop using it.
+    """
+    global persistent_cache  # noqa: WPS420
+    version = "{0}/{1}".format(__version__, PERSISTENT_CACHE_FORMAT)
+    persistent_cache = None if path is None else PersistentCache(path, version)  # noqa: WPS442
+
+
+def _canonical(key: Any) -> Any:
+    """
+    Turn a query key into nested tuples of builtin values that are the same in every process.
+
+    Args:
+        key: A query key made of tuples, frozensets, terms, variables and builtin values.
+
+    Returns:
+        A canonical form of the key. Sets become sorted tuples.
+    """
+    if isinstance(key, PolyhedralTerm):
+        coefficients = sorted((var.name, float(coeff)) for var, coeff in key.variables.items())  # noqa: VNE002
+        return ("term", tuple(coefficients), float(key.constant))
+    if isinstance(key, Var):
+        return ("var", key.name)
+    if isinstance(key, frozenset):
+        return ("set", tuple(sorted((_canonical(item) for item in key), key=repr)))
+    if isinstance(key, tuple):
+        return tuple(_canonical(item) for item in key)
+    return key
+
+
+def _query_settings() -> Tuple[Any, ...]:
+    """
+    The settings that the results of the cached queries depend on.
+
+    Returns:
+        The settings of the linear programs followed by the tunables of this module.
+    """
+    return (
+        solver_settings(),
+        PROJECTION_MAX_TERMS,
+        PROJECTION_PRUNE_FACTOR,
+        PROJECTION_TOLERANCE,
+        SPARSE_MATRIX_MIN_ENTRIES,
+        SPARSE_MATRIX_MAX_DENSITY,
+        OUTPUT_SENSITIVE_REDUCTION_MIN_ROWS,
+        INTERIOR_RADIUS_TOLERANCE,
+        RAY_TIE_TOLERANCE,
+        SMALL_LP_TIE_TOLERANCE,
+        REFUTATION_SAMPLES,
+        REFUTATION_TOLERANCE,
+        REFUTATION_CHORD_MARGIN,
+        REFUTATION_MAX_STEP,
+        SOLVE_MAX_CONDITION,
+        SOLVE_SIGNIFICANT_DIGITS,
+    )
+
+
+def _cached_query(key: Tuple[Any, ...], compute: Callable[[], Any]) -> Any:
+    """
+    Answer a query from the caches, or compute it and store its result.
+
+    Args:
+        key: The query kind followed by its operands.
+        compute: Computes the result of the query.
+
+    Returns:
+        The result of the query. Callers copy mutable results.
+    """
+    settings = _query_settings()
+    hit, result = query_cache.lookup((settings, key))
+    if hit:
+        return result
+    store = persistent_cache
+    digest = ""
+    if store is not None:
+        digest = hashlib.sha256(repr(_canonical((settings, key))).encode()).hexdigest()
+        hit, data = store.lookup(digest)
+        if hit:
+            result = _result_from_data(data)
+            query_cache.store((settings, key), result)
+            return result
+    result = compute()
+    query_cache.store((settings, key), result)
+    if store is not None:
+        store.store(digest, _result_to_data(result))
+    return result
+
+
+def _result_to_data(result: Any) -> Any:
+    """
+    Turn the result of a query into JSON data for the persistent cache.
+
+    Args:
+        result: A result made of rows, tuples, lists and numbers.
+
+    Returns:
+        The result with its rows and tuples tagged in dictionaries and its arrays as lists.
+    """
+    if isinstance(result, _SlotRows):
+        columns = [{"var": column.name} if isinstance(column, Var) else int(column) for column in result.columns]
+        arrays = [result.indptr, result.indices, result.data, result.constants]
+        return {"rows": [columns] + [np.asarray(array).tolist() for array in arrays]}
+    if isinstance(result, tuple):
+        return {"tuple": [_result_to_data(item) for item in result]}
+    if isinstance(result, list):
+        return [_result_to_data(item) for item in result]
+    if isinstance(result, np.generic):
+        return result.item()
+    return result
+
+
+def _result_from_data(data: Any) -> Any:
+    """
+    Rebuild the result of a query from the data read from the persistent cache.
+
+    Args:
+        data: The data returned by _result_to_data.
+
+    Returns:
+        The result of the query.
+    """
+    if isinstance(data, dict) and "rows" in data:
+        columns, indptr, indices, coefficients, constants = data["rows"]
+        return _SlotRows(
+            tuple(Var(column["var"]) if isinstance(column, dict) else column for column in columns),
+            np.array(indptr, dtype=np.int64),
+            np.array(indices, dtype=np.int64),
+            np.array(coefficients, dtype=float),
+            np.array(constants, dtype=float),
+        )
+    if isinstance(data, dict):
+        return tuple(_result_from_data(item) for item in data["tuple"])
+    if isinstance(data, list):
+        return [_result_from_data(item) for item in data]
+    return data
+
+
+def _variable_slots(operands: Tuple[PolyhedralTermList, ...], extra: Tuple[Var, ...], ordered: bool) -> List[Var]:
+    """
+    Assign positional slots to the variables of the operands of a query.
+
+    Variables are ordered by where they occur: the operand, the coefficient
+    and the shape of each row containing them, and the position of the row
+    if the order of the terms matters. Names only break ties.
+
+    Args:
+        operands: The termlists of the query.
+        extra: Further variables of the query, in order.
+        ordered: Whether the query depends on the order of the terms.
+
+    Returns:
+        The variables of the query in the order of their slots.
+    """
+    occurrences: Dict[Var, List[Tuple[int, Tuple[Any, ...]]]] = {}
+    for operand_index, operand in enumerate(operands):
+        for var, var_occurrences in operand._occurrences(ordered).items():  # noqa: WPS437, VNE002
+            occurrences.setdefault(var, []).append((operand_index, var_occurrences))
+    positions: Dict[Var, List[int]] = {}
+    for position, var in enumerate(extra):  # noqa: VNE002
+        positions.setdefault(var, []).append(position)
+        occurrences.setdefault(var, [])
+    return sorted(occurrences, key=lambda var: (occurrences[var], positions.get(var, []), var.name))  # noqa: VNE002
+
+
+def _result_to_slots(result: Any, slot_index: Mapping[Var, int]) -> Any:
+    if isinstance(result, PolyhedralTermList):
+        columns, indptr, indices, data, constants = result._rows()  # noqa: WPS437
+        return _SlotRows(tuple(slot_index.get(var, var) for var in columns), indptr, indices, data, constants)
+    if isinstance(result, tuple):
+        return tuple(_result_to_slots(item, slot_index) for item in result)
+    return result
+
+
+def _result_from_slots(result: Any, slot_order: List[Var]) -> Any:
+    if isinstance(result, _SlotRows):
+        variables = [column if isinstance(column, Var) else slot_order[column] for column in result.columns]
+        shape = (len(result.constants), len(variables))
+        matrix = csr_matrix((result.data, result.indices, result.indptr), shape=shape, copy=True)
+        sparse = _use_sparse_format(shape[0] * shape[1], matrix.nnz)
+        return PolyhedralTermList.polytope_to_termlist(_to_format(matrix, sparse), result.constants.copy(), variables)
+    if isinstance(result, tuple):
+        return tuple(_result_from_slots(item, slot_order) for item in result)
+    return result
+
+
+def _cached_query_up_to_renaming(  # noqa: WPS211
+    kind: str,
+    operands: Tuple[PolyhedralTermList, ...],
+    compute: Callable[[], query_result_t],
+    ordered: bool = False,
+    extra: Tuple[Var, ...] = (),
+    options: Tuple[Any, ...] = (),
+) -> query_result_t:
+    """
+    Answer a query whose result does not depend on the names of its variables.
+
+    The operands are keyed by a canonical form that abstracts the names of the
+    variables into positional slots. The canonical form is computed from the
+    rows of the operands, without materializing their terms or renaming them.
+    The termlists of the result are cached as rows whose columns are slot
+    indices, and rebuilt with the variables of the caller, so a query on a
+    renamed copy of the operands is answered without being computed again.
+
+    Args:
+        kind: The kind of the query.
+        operands: The termlists of the query.
+        compute: Computes the result of the query for the given operands.
+        ordered: Whether the query depends on the order of the terms.
+        extra: Further variables of the query, in order.
+        options: Further arguments of the query.
+
+    Returns:
+        The result of the query. Termlists in the result are fresh objects.
+    """
+    slot_order = _variable_slots(operands, extra, ordered)
+    slot_index = {var: slot for slot, var in enumerate(slot_order)}  # noqa: VNE002
+    canonical = tuple(operand._slot_fingerprint(slot_index, ordered) for operand in operands)  # noqa: WPS437
+    key = (kind, canonical, tuple(slot_index[var] for var in extra), options)  # noqa: VNE002
+    result = _cached_query(key, lambda: _result_to_slots(compute(), slot_index))
+    renamed: query_result_t = _result_from_slots(result, slot_order)
+    return renamed
+
+
+def _has_significant_digits(values: np.ndarray) -> bool:
+    """
+    Tell whether numbers are not changed by rounding them to SOLVE_SIGNIFICANT_DIGITS significant digits.
+
+    Args:
+        values: An array of numbers.
+
+    Returns:
+        True if every number is equal to its rounding.
+    """
+    return all(float("{0:.{1}g}".format(value, SOLVE_SIGNIFICANT_DIGITS)) == value for value in values.flat)
+
+
+def _exact_residuals(a: np.ndarray, b: np.ndarray, x: np.ndarray) -> List[Fraction]:
+    return [
+        abs(Fraction(b[i]) - sum(Fraction(coeff) * Fraction(x_j) for coeff, x_j in zip(a[i], x)))  # noqa: WPS221
+        for i in range(len(b))
+    ]
+
+
+def _use_sparse_format(n_entries: int, n_nonzero: int) -> bool:
+    return n_entries >= SPARSE_MATRIX_MIN_ENTRIES and n_nonzero <= SPARSE_MATRIX_MAX_DENSITY * n_entries
+
+
+def _to_format(matrix: matrix_t, sparse: bool) -> matrix_t:
+    if sparse and not issparse(matrix):
+        return csr_matrix(matrix)
+    if not sparse and issparse(matrix):
+        return cast(spmatrix, matrix).toarray()
+    return matrix
+
+
+def _dense_row(matrix: matrix_t, row: int) -> np.ndarray:
+    if issparse(matrix):
+        return np.ravel(cast(spmatrix, matrix)[[row], :].toarray())
+    return np.array(matrix[row, :])
+
+
+def _stack_rows(top: matrix_t, bottom: matrix_t) -> matrix_t:
+    if issparse(top) or issparse(bottom):
+        return sparse_vstack([top, bottom], format="csr")
+    return np.concatenate((top, bottom), axis=0)
+
+
+def _canonical_rows(matrix: matrix_t, vector: np.ndarray) -> Tuple[List[Optional[bytes]], np.ndarray]:
+    """
+    Normalize the rows of a matrix-vector pair so that parallel rows can be hashed.
+
+    Each row is divided by the absolute value of its first nonzero entry, so
+    rows that are positive multiples of each other get the same key.
+
+    Args:
+        matrix: The matrix of the constraints.
+        vector: The vector of the constraints.
+
+    Returns:
+        A tuple consisting of (i) a hashable key for the direction of each row,
+            or None for rows that are zero, and (ii) the normalized vector.
+    """
+    n = matrix.shape[0]
+    keys: List[Optional[bytes]] = [None] * n
+    bounds = np.array(vector, dtype=float)
+    if issparse(matrix):
+        mat = csr_matrix(matrix)
+        mat.eliminate_zeros()
+        mat.sort_indices()
+        for i in range(n):
+            row = slice(mat.indptr[i], mat.indptr[i + 1])
+            data = mat.data[row]
+            if data.size:
+                scale = abs(data[0])
+                keys[i] = mat.indices[row].tobytes() + (data / scale + 0.0).tobytes()
+                bounds[i] /= scale
+        return keys, bounds
+    nonzero = matrix != 0
+    has_entries = np.any(nonzero, axis=1)
+    scales = np.abs(matrix[np.arange(n), np.argmax(nonzero, axis=1)])
+    scales[~has_entries] = 1
+    # adding 0.0 turns negative zeros into positive ones
+    normalized = matrix / scales[:, None] + 0.0
+    for i in np.flatnonzero(has_entries).tolist():
+        keys[i] = normalized[i].tobytes()
+    return keys, bounds / scales
+
+
+def _parallel_redundant_rows(
+    a: matrix_t, b: np.ndarray, a_help: Optional[matrix_t] = None, b_help: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Find the rows of a polytope implied by a single parallel row.
+
+    A row is implied by another row pointing in the same direction with a
+    bound at least as tight. Among rows of the polytope with the same
+    direction and bound, the last one is kept. Rows of the context are never
+    removed.
+
+    Args:
+        a: Matrix of the polytope.
+        b: Vector of the polytope.
+        a_help: Matrix of the context polytope.
+        b_help: Vector of the context polytope.
+
+    Returns:
+        A boolean mask of the rows of the polytope that can be removed.
+    """
+    keys, bounds = _canonical_rows(a, b)
+    tightest: Dict[bytes, int] = {}
+    for i, key in enumerate(keys):
+        if key is not None and (key not in tightest or bounds[i] <= bounds[tightest[key]]):
+            tightest[key] = i
+    redundant = np.array([key is not None and tightest[key] != i for i, key in enumerate(keys)], dtype=bool)
+    if a_help is not None and b_help is not None:
+        help_keys, help_bounds = _canonical_rows(a_help, b_help)
+        for key, bound in zip(help_keys, help_bounds):
+            if key in tightest and bound <= bounds[tightest[key]]:
+                redundant[tightest.pop(key)] = True
+    return redundant
+
+
+def _dominated_rows(a: matrix_t, b: np.ndarray, a_by: matrix_t, b_by: np.ndarray) -> np.ndarray:
+    """
+    Find the rows of a polytope that are implied by a single row of another one.
+
+    A row is implied by a row with the same direction and a bound that is
+    not larger. A zero row is implied when its bound is nonnegative.
+
+    Args:
+        a: Matrix of the polytope whose rows are checked.
+        b: Vector of the polytope whose rows are checked.
+        a_by: Matrix of the implying polytope, in the same format as a.
+        b_by: Vector of the implying polytope.
+
+    Returns:
+        A boolean mask of the rows of the first polytope implied by a row of the second.
+    """
+    keys, bounds = _canonical_rows(a, b)
+    by_keys, by_bounds = _canonical_rows(a_by, b_by)
+    tightest: Dict[bytes, float] = {}
+    for key, bound in zip(by_keys, by_bounds):
+        if key is not None and (key not in tightest or bound < tightest[key]):
+            tightest[key] = bound
+    dominated = np.zeros(len(keys), dtype=bool)
+    for i, key in enumerate(keys):
+        if key is None:
+            dominated[i] = bounds[i] >= 0
+        else:
+            dominated[i] = key in tightest and tightest[key] <= bounds[i]
+    return dominated
+
+
+def _fourier_motzkin(  # noqa: WPS210
+    a: np.ndarray, b: np.ndarray, columns: List[int], max_rows: int
+) -> Tuple[np.ndarray, np.ndarray, List[FrozenSet[int]]]:
+    """
+    Eliminate columns from a polytope by Fourier-Motzkin elimination.
+
+    Each row remembers the set of original rows it combines. After
+    eliminating k columns, a row combining more than k + 1 original rows is
+    redundant (Chernikov's rule, Imbert's first acceleration theorem) and is
+    never generated. Parallel rows are merged after every step, and redundant
+    rows are removed with LPs whenever the number of rows has grown by
+    PROJECTION_PRUNE_FACTOR.
+
+    Args:
+        a: Dense matrix of the polytope.
+        b: Vector of the polytope.
+        columns: The columns to eliminate.
+        max_rows: The maximum number of rows of the intermediate polytopes.
+
+    Returns:
+        A tuple consisting of (i) the matrix of the projection, whose
+            eliminated columns are zero, (ii) its vector, and (iii) for each
+            row, the set of indices of the original rows it combines.
+
+    Raises:
+        ValueError: The polytope is empty or the projection has too many rows.
+    """
+    histories = [frozenset([i]) for i in range(len(b))]
+    prune_at = PROJECTION_PRUNE_FACTOR * max(len(b), 1)
+    remaining = list(columns)
+    for eliminated in range(1, len(columns) + 1):
+        # eliminate first the column generating the fewest rows
+        n_pos = np.sum(a[:, remaining] > 0, axis=0)
+        n_neg = np.sum(a[:, remaining] < 0, axis=0)
+        col = remaining.pop(int(np.argmin(n_pos * n_neg - n_pos - n_neg)))
+        coeffs = a[:, col]
+        pairs = [
+            (pos, neg)
+            for pos in np.flatnonzero(coeffs > 0)
+            for neg in np.flatnonzero(coeffs < 0)
+            if len(histories[pos] | histories[neg]) <= eliminated + 1
+        ]
+        kept = np.flatnonzero(coeffs == 0)
+        new_a, new_b = a[kept], b[kept]
+        new_histories = [histories[i] for i in kept] + [histories[pos] | histories[neg] for pos, neg in pairs]
+        if pairs:
+            pos_rows, neg_rows = (np.array(rows) for rows in zip(*pairs))
+            pos_scale, neg_scale = 1 / coeffs[pos_rows], -1 / coeffs[neg_rows]
+            combined = a[pos_rows] * pos_scale[:, None] + a[neg_rows] * neg_scale[:, None]
+            combined[:, col] = 0
+            combined[np.abs(combined) < PROJECTION_TOLERANCE] = 0
+            new_a = np.concatenate((new_a, combined))
+            new_b = np.concatenate((new_b, b[pos_rows] * pos_scale + b[neg_rows] * neg_scale))
+        zero = ~np.any(new_a, axis=1)
+        if np.any(new_b[zero] < 0):
+            raise ValueError("The polytope is empty")
+        keep = ~zero & ~_parallel_redundant_rows(new_a, new_b)
+        a, b = new_a[keep], new_b[keep]
+        histories = [history for history, kept_row in zip(new_histories, keep) if kept_row]
+        if len(b) > prune_at:
+            kept_rows, bounds = PolyhedralTermList._reduce_polytope_rows(a, b)  # noqa: WPS437
+            a, b = a[kept_rows], bounds[kept_rows]
+            histories = [histories[i] for i in kept_rows]
+            prune_at = max(prune_at, PROJECTION_PRUNE_FACTOR * len(b))
+        if len(b) > max_rows:
+            raise ValueError("The projection has more than {0} rows".format(max_rows))
+    return a, b, histories
+
+
+def _equality_pairs(terms: List[PolyhedralTerm]) -> List[Tuple[int, int]]:
+    """
+    Find the pairs of opposite terms of a list, which together state an equality.
+
+    Args:
+        terms: The terms.
+
+    Returns:
+        The pairs of indices of opposite terms. Each term is in at most one pair.
+    """
+    unpaired: Dict[PolyhedralTerm, int] = {}
+    pairs = []
+    for i, term in enumerate(terms):
+        opposite = unpaired.pop(term.multiply(-1), None)
+        if opposite is None:
+            unpaired.setdefault(term, i)
+        else:
+            pairs.append((opposite, i))
+    return pairs
+
+
+def _rows_left(rows: List[int], removed: List[int]) -> List[int]:
+    """
+    Renumber the positions of rows after other rows are removed.
+
+    Args:
+        rows: Positions of rows, in increasing order.
+        removed: Positions of the removed rows, in increasing order.
+
+    Returns:
+        The new positions of the rows that were not removed.
+    """
+    left = []
+    for row in rows:
+        position = bisect.bisect_left(removed, row)
+        if position == len(removed) or removed[position] != row:
+            left.append(row - position)
+    return left
+
+
+def _row_norms(matrix: matrix_t) -> np.ndarray:
+    if issparse(matrix):
+        sparse = cast(spmatrix, matrix)
+        return np.sqrt(np.ravel(sparse.multiply(sparse).sum(axis=1)))
+    return np.asarray(np.linalg.norm(matrix, axis=1))
+
+
+def _chebyshev_center(a: matrix_t, b: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Find a point deep inside a polytope.
+
+    The point is the center of a largest ball of radius at most one contained
+    in the polytope.
+
+    Args:
+        a: Matrix of the polytope.
+        b: Vector of the polytope.
+
+    Returns:
+        The center of the ball, or None if the polytope has no interior point.
+    """
+    res = _chebyshev_ball(a, b)
+    if res["status"] != 0 or -res["fun"] <= INTERIOR_RADIUS_TOLERANCE:
+        return None
+    return np.asarray(res["x"][: a.shape[1]])
+
+
+def _chebyshev_ball(a: matrix_t, b: np.ndarray) -> Any:
+    """
+    Find a largest ball of radius at most one contained in a polytope.
+
+    The LP is infeasible exactly when the polytope is empty.
+
+    Args:
+        a: Matrix of the polytope.
+        b: Vector of the polytope.
+
+    Returns:
+        The result of the LP. Its solution is the center of the ball followed
+            by its radius, and its optimal value is the opposite of the radius.
+    """
+    m = a.shape[1]
+    norms = _row_norms(a).reshape(-1, 1)
+    if issparse(a):
+        a_ball = sparse_hstack([a, csr_matrix(norms)], format="csr")
+    else:
+        a_ball = np.concatenate((a, norms), axis=1)
+    objective = np.zeros(m + 1)
+    objective[m] = -1
+    bounds = [(None, None)] * m + [(0, 1)]
+    return solve_lp(c=objective, a_ub=a_ball, b_ub=b, bounds=bounds, site="chebyshev_center")
+
+
+def _sample_polytope(a: matrix_t, b: np.ndarray, start: np.ndarray, samples: int) -> np.ndarray:
+    """
+    Sample points of a polytope with a hit-and-run walk.
+
+    Each step draws a random direction, computes the chord of the polytope
+    through the current point along it, keeps two points just inside both
+    ends of the chord, and moves to a random point of the chord. The walk is seeded, so the samples
+    are reproducible.
+
+    Args:
+        a: Matrix of the polytope.
+        b: Vector of the polytope.
+        start: A point of the polytope.
+        samples: The number of steps of the walk.
+
+    Returns:
+        A matrix whose columns are the sampled points, starting with the given one.
+    """
+    rng = np.random.default_rng(0)
+    max_step = REFUTATION_MAX_STEP * (1 + np.linalg.norm(start))
+    points = [start]
+    point = start
+    for _ in range(samples):
+        direction = rng.normal(size=len(start))
+        rates = np.asarray(a @ direction).reshape(-1)
+        slack = np.maximum(b - np.asarray(a @ point).reshape(-1), 0)
+        upper = min(np.min(slack[rates > 0] / rates[rates > 0], initial=max_step), max_step)
+        lower = max(np.max(slack[rates < 0] / rates[rates < 0], initial=-max_step), -max_step)
+        inward = 1 - REFUTATION_CHORD_MARGIN
+        points.extend([point + inward * lower * direction, point + inward * upper * direction])
+        point = point + rng.uniform(lower, upper) * direction
+        points.append(point)
+    return np.array(points).T
+
+
+def _refutes_containment(a_l: matrix_t, b_l: np.ndarray, a_r: matrix_t, b_r: np.ndarray, points: np.ndarray) -> bool:
+    """
+    Tell whether some point of the left polytope lies outside the right one.
+
+    Args:
+        a_l: Matrix of the left polytope.
+        b_l: Vector of the left polytope.
+        a_r: Matrix of the right polytope.
+        b_r: Vector of the right polytope.
+        points: Candidate points, one per column.
+
+    Returns:
+        True if a candidate satisfies the left constraints and violates a right
+            constraint, both by a margin of REFUTATION_TOLERANCE relative to
+            the bound and to the norms of the row and of the candidate. The
+            candidates on the boundary of the left polytope are thus ignored.
+    """
+    point_norms = np.linalg.norm(points, axis=0)
+    margin_l = REFUTATION_TOLERANCE * (np.abs(b_l)[:, None] + np.outer(_row_norms(a_l), point_norms))
+    inside = np.all(np.asarray(a_l @ points) <= b_l[:, None] - margin_l, axis=0)
+    margin_r = REFUTATION_TOLERANCE * (np.abs(b_r)[:, None] + np.outer(_row_norms(a_r), point_norms[inside]))
+    outside = np.asarray(a_r @ points[:, inside]) > b_r[:, None] + margin_r
+    return bool(np.any(outside))
+
+
+def _first_hit_row(
+    a: matrix_t, b: np.ndarray, origin: np.ndarray, target: np.ndarray, candidates: np.ndarray
+) -> Optional[int]:
+    """
+    Shoot a ray from an interior point and find the first constraint it crosses.
+
+    Args:
+        a: Matrix of the polytope.
+        b: Vector of the polytope.
+        origin: An interior point of the polytope.
+        target: The point towards which the ray is shot.
+        candidates: The indices of the rows to consider.
+
+    Returns:
+        The index of the row crossed first, or None if no row is crossed or
+            if several rows are crossed at about the same point.
+    """
+    if candidates.size == 0:
+        return None
+    a_cand = a[candidates]
+    speeds = np.ravel(a_cand @ (target - origin))
+    slacks = b[candidates] - np.ravel(a_cand @ origin)
+    moving = speeds > 0
+    if not np.any(moving):
+        return None
+    times = slacks[moving] / speeds[moving]
+    order = np.argsort(times, kind="stable")
+    first = times[order[0]]
+    if order.size > 1 and times[order[1]] - first <= RAY_TIE_TOLERANCE * max(1, abs(first)):
+        return None
+    return int(candidates[moving][order[0]])
+
+
+def _near_ties(values: np.ndarray, bounds: np.ndarray) -> np.ndarray:
+    """
+    Tell which optimal values are too close to their bounds to be compared reliably.
+
+    Args:
+        values: Optimal values, NaN when there is no optimum.
+        bounds: The bounds the values are compared with.
+
+    Returns:
+        A boolean mask of the values within SMALL_LP_TIE_TOLERANCE of their bounds.
+    """
+    with np.errstate(invalid="ignore"):
+        return np.asarray(np.abs(values - bounds) <= SMALL_LP_TIE_TOLERANCE * (1 + np.abs(bounds)))
+
+
+def _relaxed_and_restored(bounds: np.ndarray) -> np.ndarray:
+    """
+    Round bounds as the row-by-row LP tests do.
+
+    To test a row, _is_row_redundant and the sequential containment check
+    add one to its bound, solve an LP and subtract one again. In floating
+    point, `(b + 1) - 1` loses the bits of b below the precision of `b + 1`:
+    0.1 becomes 0.10000000000000009. The LP-free and batched tests round the
+    bounds in the same way, so the bounds they return and compare against
+    are those of the row-by-row tests.
+
+    Args:
+        bounds: The bounds of the tested rows.
+
+    Returns:
+        The bounds after being relaxed by one and restored.
+    """
+    return (bounds + 1) - 1
+
+
+def _reindex_columns(matrix: matrix_t, old_columns: List[Var], new_columns: List[Var]) -> matrix_t:
+    index = {var: col for col, var in enumerate(new_columns)}
+    col_map = np.array([index.get(var, -1) for var in old_columns], dtype=int)
+    n = matrix.shape[0]
+    if issparse(matrix):
+        coo = cast(spmatrix, matrix).tocoo()
+        new_cols = col_map[coo.col]
+        valid = new_cols >= 0
+        return csr_matrix((coo.data[valid], (coo.row[valid], new_cols[valid])), shape=(n, len(new_columns)))
+    reindexed = np.zeros((n, len(new_columns)))
+    valid = col_map >= 0
+    reindexed[:, col_map[valid]] = matrix[:, valid]
+    return reindexed
+
 
 class PolyhedralTerm(Term):
-    """Polyhedral terms are linear inequalities over a list of variables."""
+    """
+    Polyhedral terms are linear inequalities over a list of variables.
+
+    Polyhedral terms are immutable: operations on terms return new terms, and
+    terms can be shared freely between term lists.
+    """
 
     # Constructor: get (i) a dictionary whose keys are variables and whose
     # values are the coefficients of those variables in the term, and (b) a
@@ -62,8 +878,38 @@ class PolyhedralTerm(Term):
                     raise ValueError("Unsupported argument type")
                 else:
                     variable_dict[key] = float(value)
-        self.variables = variable_dict
-        self.constant = float(constant)
+        self._variables: Dict[Var, numeric] = variable_dict
+        self._constant = float(constant)
+        self._hash: Optional[int] = None
+        self._fingerprint: Optional[bytes] = None
+
+    @classmethod
+    def _make(cls, variables: Dict[Var, numeric], constant: float) -> PolyhedralTerm:
+        # build a term from a dictionary we own, without validation
+        that = cls.__new__(cls)
+        that._variables = variables  # noqa: WPS437
+        that._constant = constant  # noqa: WPS437
+        that._hash = None  # noqa: WPS437
+        that._fingerprint = None  # noqa: WPS437
+        return that
+
+    @property
+    def variables(self) -> Mapping[Var, numeric]:
+        """Read-only map from the variables of the term to their coefficients.
+
+        Returns:
+            The coefficients of the term.
+        """
+        return MappingProxyType(self._variables)
+
+    @property
+    def constant(self) -> float:
+        """The constant of the term.
+
+        Returns:
+            The constant on the right of the inequality.
+        """
+        return self._constant
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
@@ -82,7 +928,31 @@ class PolyhedralTerm(Term):
         return res
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        if self._hash is None:
+            self._hash = int.from_bytes(self.fingerprint[:8], "little", signed=True)
+        return self._hash
+
+    @property
+    def fingerprint(self) -> bytes:
+        """
+        A digest of the term that is the same in every process.
+
+        The digest covers the names of the variables in sorted order, their
+        coefficients, and the constant. Terms that are equal have the same
+        digest.
+
+        Returns:
+            A digest of FINGERPRINT_BYTES bytes.
+        """
+        if self._fingerprint is None:
+            names = sorted(var.name for var in self._variables)  # noqa: VNE002
+            values = [self._variables[Var(name)] for name in names] + [self._constant]
+            digest = hashlib.blake2b(digest_size=FINGERPRINT_BYTES)
+            digest.update("\0".join(names).encode())
+            # adding 0.0 turns negative zeros into positive ones, which compare equal
+            digest.update((np.array(values, dtype=float) + 0.0).tobytes())
+            self._fingerprint = digest.digest()
+        return self._fingerprint
 
     def __repr__(self) -> str:
         return "<Term {0}>".format(self)
@@ -100,10 +970,12 @@ class PolyhedralTerm(Term):
         """
         Generates copy of polyhedral term.
 
+        Since terms are immutable, the term itself is returned.
+
         Returns:
             Copy of term.
         """
-        return PolyhedralTerm(self.variables, self.constant)
+        return self
 
     def rename_variable(self, source_var: Var, target_var: Var) -> PolyhedralTerm:
         """
@@ -116,13 +988,32 @@ class PolyhedralTerm(Term):
         Returns:
             A term with `source_var` replaced by `target_var`.
         """
-        new_term = self.copy()
-        if source_var in self.vars:
-            if target_var not in self.vars:
-                new_term.variables[target_var] = 0
-            new_term.variables[target_var] += new_term.variables[source_var]
-            new_term = new_term.remove_variable(source_var)
-        return new_term
+        if source_var not in self._variables:
+            return self
+        variables = dict(self._variables)
+        variables[target_var] = variables.get(target_var, 0) + variables[source_var]
+        variables.pop(source_var)
+        return PolyhedralTerm._make(variables, self._constant)
+
+    def rename_variables(self, renaming: Mapping[Var, Var]) -> PolyhedralTerm:
+        """
+        Rename several variables of a term simultaneously.
+
+        Variables renamed into the same variable have their coefficients added.
+
+        Args:
+            renaming: Map from the variables to be replaced to their new names.
+
+        Returns:
+            A term in which every variable `v` is replaced by `renaming[v]`.
+        """
+        if not any(var in renaming for var in self._variables):
+            return self
+        variables: Dict[Var, numeric] = {}
+        for var, coeff in self._variables.items():  # noqa: VNE002
+            target_var = renaming.get(var, var)
+            variables[target_var] = variables.get(target_var, 0) + coeff
+        return PolyhedralTerm._make(variables, self._constant)
 
     @property
     def vars(self) -> List[Var]:  # noqa: A003
@@ -261,10 +1152,9 @@ class PolyhedralTerm(Term):
             A new term with the variable eliminated.
         """
         if self.contains_var(var):
-            that = self.copy()
-            that.variables.pop(var)
-            return that
-        return self.copy()
+            variables = {key: coeff for key, coeff in self._variables.items() if key != var}
+            return PolyhedralTerm._make(variables, self._constant)
+        return self
 
     def multiply(self, factor: numeric) -> PolyhedralTerm:
         """Multiplies a term by a constant factor.
@@ -305,7 +1195,7 @@ class PolyhedralTerm(Term):
             that = self.remove_variable(var)
             logging.debug(that)
             return that + term
-        return self.copy()
+        return self
 
     def isolate_variable(self, var_to_isolate: Var) -> PolyhedralTerm:
         """
@@ -459,6 +1349,77 @@ class PolyhedralTerm(Term):
         logging.debug("GetVals: %s Vars: %s", context, vars_to_elim)
         vars_to_solve = list_intersection(context.vars, vars_to_elim)
         assert len(context.terms) == len(vars_to_solve)
+        solution = PolyhedralTerm._solve_numerically(context, vars_to_solve)
+        if solution is not None:
+            return solution
+        return PolyhedralTerm._solve_symbolically(context, vars_to_solve)
+
+    @staticmethod
+    def _solve_numerically(
+        context: PolyhedralTermList, vars_to_solve: List[Var]
+    ) -> Optional[Dict[Var, PolyhedralTerm]]:
+        """
+        Solve a square system of equations with a dense LU factorization.
+
+        The solution is checked by computing its residual exactly, with
+        fractions. It is only returned when the residual is zero, that is,
+        when it is the exact solution of the system, and when neither the
+        system nor the solution have more significant digits than sympy
+        keeps. Otherwise, sympy is left to solve the system, so both solvers
+        give the same terms.
+
+        Args:
+            context: The equations, one per term.
+            vars_to_solve: The variables to solve for.
+
+        Returns:
+            The solutions as in solve_for_variables, or None if the system is
+                singular, too ill-conditioned to be solved in floating point, or
+                has no exact solution in floating point that sympy would give.
+        """
+        if not vars_to_solve:
+            return None
+        parameters = list_diff(context.vars, vars_to_solve)
+        a_solve = np.array([[term.get_coefficient(var) for var in vars_to_solve] for term in context.terms])
+        a_param = np.array([[term.get_coefficient(var) for var in parameters] for term in context.terms])
+        a_param = a_param.reshape(len(context.terms), len(parameters))
+        b = np.array([term.constant for term in context.terms], dtype=float)
+        rhs = np.column_stack((b, -a_param))
+        if not _has_significant_digits(a_solve) or not _has_significant_digits(rhs):
+            logging.debug("Coefficients beyond %s digits: solving symbolically", SOLVE_SIGNIFICANT_DIGITS)
+            return None
+        condition = np.linalg.cond(a_solve)
+        if not np.isfinite(condition) or condition > SOLVE_MAX_CONDITION:
+            logging.debug("Condition number %s: solving symbolically", condition)
+            return None
+        # each solution is an affine function of the parameters: x = A^-1 b - A^-1 A_p p
+        sols = np.linalg.solve(a_solve, rhs)
+        if not _has_significant_digits(sols):
+            logging.debug("Solution beyond %s digits: solving symbolically", SOLVE_SIGNIFICANT_DIGITS)
+            return None
+        for k in range(rhs.shape[1]):
+            if any(_exact_residuals(a_solve, rhs[:, k], sols[:, k])):
+                logging.debug("Inexact solution: solving symbolically")
+                return None
+        # the constants are subtracted from zero so that a zero solution does not give a negative zero
+        solutions = {
+            var: PolyhedralTerm(dict(zip(parameters, sols[i, 1:])), 0 - sols[i, 0])  # noqa: VNE002
+            for i, var in enumerate(vars_to_solve)  # noqa: VNE002
+        }
+        return solutions
+
+    @staticmethod
+    def _solve_symbolically(context: PolyhedralTermList, vars_to_solve: List[Var]) -> Dict[Var, PolyhedralTerm]:
+        """
+        Solve a system of equations with sympy.
+
+        Args:
+            context: The equations, one per term.
+            vars_to_solve: The variables to solve for.
+
+        Returns:
+            The solutions as in solve_for_variables.
+        """
         exprs = [PolyhedralTerm.to_symbolic(term) for term in context.terms]
         logging.debug("Solving %s", exprs)
         vars_to_solve_symb = [sympy.symbols(var.name) for var in vars_to_solve]
@@ -494,12 +1455,461 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         Raises:
             ValueError: incorrect argument type provided.
         """
-        if terms is None:
-            self.terms = []
-        elif all(isinstance(t, PolyhedralTerm) for t in terms):
-            self.terms = terms.copy()
-        else:
+        # The constraints can be stored as a list of terms, as a matrix-vector
+        # pair whose columns are indexed by self._variables, or both. Terms
+        # are materialized from the matrix only when they are requested.
+        if terms is not None and not all(isinstance(t, PolyhedralTerm) for t in terms):
             raise ValueError("PolyhedralTermList constructor argument must be a list of PolyhedralTerms.")
+        super().__init__(terms)
+        # None while the terms of a matrix-backed termlist are not materialized
+        self._terms: Optional[List[PolyhedralTerm]]  # type: ignore[assignment]
+        self._variables: Optional[List[Var]] = None
+        self._a: Optional[matrix_t] = None
+        self._b: Optional[np.ndarray] = None
+        # digests of the termlist, by whether they depend on the order of the terms
+        self._fingerprints: Dict[bool, bytes] = {}
+        # rows of the terms with a positive and with a negative coefficient for each variable
+        self._var_rows: Optional[Dict[Var, Tuple[List[int], List[int]]]] = None
+        # index of the rows of a termlist and the rows removed from it to obtain this one
+        self._left_out: Optional[Tuple[Dict[Var, Tuple[List[int], List[int]]], List[int]]] = None
+        # pairs of rows holding opposite terms, which together state an equality
+        self._equalities: Optional[List[Tuple[int, int]]] = None
+        # compressed rows of the termlist and the data derived from them to key the query cache
+        self._row_view: Optional[row_view_t] = None
+        self._canonical_data: Dict[Any, Any] = {}
+
+    @property
+    def terms(self) -> List[PolyhedralTerm]:
+        """
+        The terms contained in the termlist.
+
+        If the termlist is stored as a matrix-vector pair, the terms are
+        generated the first time they are requested.
+
+        Returns:
+            The list of terms.
+        """
+        if self._terms is None:
+            assert self._a is not None and self._b is not None and self._variables is not None
+            if issparse(self._a):
+                a = cast(spmatrix, self._a).tocsr()
+                a.sort_indices()
+                terms = []
+                for i in range(a.shape[0]):
+                    row = slice(a.indptr[i], a.indptr[i + 1])
+                    variables = {self._variables[col]: coeff for col, coeff in zip(a.indices[row], a.data[row])}
+                    terms.append(PolyhedralTerm(variables, self._b[i]))
+            else:
+                terms = [
+                    PolyhedralTerm.polytope_to_term(list(row), const, self._variables)
+                    for row, const in zip(self._a, self._b)
+                ]
+            self._terms = ReadOnlyList(terms)
+        return self._terms
+
+    @terms.setter
+    def terms(self, terms: List[PolyhedralTerm]) -> None:  # noqa: WPS440
+        self._terms = ReadOnlyList(terms)
+        self._terms_changed()
+
+    def _terms_changed(self) -> None:
+        super()._terms_changed()
+        self._variables = None
+        self._a = None
+        self._b = None
+        self._fingerprints = {}
+        self._var_rows = None
+        self._left_out = None
+        self._equalities = None
+        self._row_view = None
+        self._canonical_data = {}
+
+    def _compute_vars(self) -> List[Var]:
+        if self._terms is not None:
+            return super()._compute_vars()
+        assert self._a is not None and self._variables is not None
+        n, m = self._a.shape
+        if n == 0 or m == 0:
+            return []
+        # order the columns by first appearance, as if we had traversed the terms
+        if issparse(self._a):
+            coo = cast(spmatrix, self._a).tocoo()
+            nonzero = coo.data != 0
+            first_rows = np.full(m, n)
+            np.minimum.at(first_rows, coo.col[nonzero], coo.row[nonzero])
+        else:
+            nonzero = self._a != 0
+            first_rows = np.where(np.any(nonzero, axis=0), np.argmax(nonzero, axis=0), n)
+        used_cols = np.flatnonzero(first_rows < n)
+        order = np.lexsort((used_cols, first_rows[used_cols]))
+        return [self._variables[col] for col in used_cols[order]]
+
+    def copy(self) -> PolyhedralTermList:
+        """
+        Makes copy of termlist.
+
+        The copy shares its (immutable) terms with the original termlist.
+
+        Returns:
+            Copy of termlist.
+        """
+        if self._terms is None:
+            assert self._a is not None and self._b is not None and self._variables is not None
+            that = PolyhedralTermList.polytope_to_termlist(self._a, self._b, self._variables)
+            that._vars_cache = self._vars_cache  # noqa: WPS437
+            that._fingerprints = dict(self._fingerprints)  # noqa: WPS437
+            that._row_view = self._row_view  # noqa: WPS437
+            that._canonical_data = dict(self._canonical_data)  # noqa: WPS437
+            return that
+        # terms and cached arrays are never modified in place, so they can be shared
+        that = PolyhedralTermList(self._terms)
+        that._vars_cache = self._vars_cache  # noqa: WPS437
+        that._variables = self._variables  # noqa: WPS437
+        that._a = self._a  # noqa: WPS437
+        that._b = self._b  # noqa: WPS437
+        that._fingerprints = dict(self._fingerprints)  # noqa: WPS437
+        that._var_rows = self._var_rows  # noqa: WPS437
+        that._left_out = self._left_out  # noqa: WPS437
+        that._equalities = self._equalities  # noqa: WPS437
+        that._row_view = self._row_view  # noqa: WPS437
+        that._canonical_data = dict(self._canonical_data)  # noqa: WPS437
+        return that
+
+    def rename_variables(self, renaming: Mapping[Var, Var]) -> PolyhedralTermList:
+        """
+        Rename several variables of a termlist simultaneously.
+
+        Args:
+            renaming: Map from the variables to be replaced to their new names.
+
+        Returns:
+            A termlist in which every variable `v` is replaced by `renaming[v]`.
+        """
+        if self._terms is None:
+            assert self._a is not None and self._b is not None and self._variables is not None
+            new_variables = [renaming.get(var, var) for var in self._variables]
+            if len(set(new_variables)) == len(new_variables):
+                # no two columns are merged: relabel the columns of the matrix
+                return PolyhedralTermList.polytope_to_termlist(self._a, self._b, new_variables)
+        return PolyhedralTermList([term.rename_variables(renaming) for term in self.terms])
+
+    def _rows(self) -> row_view_t:
+        """
+        The rows of the termlist in compressed sparse row format.
+
+        The rows are taken from the matrix of the termlist when it has one,
+        so matrix-backed termlists do not materialize their terms.
+
+        Returns:
+            A tuple consisting of (i) the variables of the columns, (ii) the
+                index pointers of the rows, (iii) the columns of the nonzero
+                coefficients, in increasing order within each row, (iv) the
+                nonzero coefficients and (v) the constants of the rows.
+        """
+        if self._row_view is None:
+            if self._terms is None:
+                assert self._a is not None and self._b is not None and self._variables is not None
+                a = csr_matrix(self._a, dtype=float, copy=True)
+                a.eliminate_zeros()
+                a.sort_indices()
+                columns = list(self._variables)
+                indptr, indices, data = a.indptr, a.indices, a.data
+                constants = np.asarray(self._b, dtype=float)
+            else:
+                columns = self.vars
+                index = self.var_index
+                entries = [sorted((index[var], coeff) for var, coeff in term.variables.items()) for term in self._terms]
+                indptr = np.cumsum([0] + [len(row) for row in entries])
+                indices = np.array([col for row in entries for col, _ in row], dtype=np.int64)
+                data = np.array([coeff for row in entries for _, coeff in row], dtype=float)
+                constants = np.array([term.constant for term in self._terms], dtype=float)
+            self._row_view = (columns, indptr, indices, data, constants)
+        return self._row_view
+
+    def _occurrences(self, ordered: bool) -> Dict[Var, Tuple[Tuple[Any, ...], ...]]:
+        """
+        Describe where each variable occurs, independently of the names of the variables.
+
+        Args:
+            ordered: Whether the description includes the positions of the rows.
+
+        Returns:
+            For each variable, the sorted tuples of the position of each row
+                containing it (zero if not ordered), its coefficient, and the
+                shape of the row: its constant and its sorted coefficients.
+        """
+        key = ("occurrences", ordered)
+        if key not in self._canonical_data:
+            columns, indptr, indices, data, constants = self._rows()
+            occurrences: Dict[Var, List[Tuple[Any, ...]]] = {}
+            for row, constant in enumerate(constants.tolist()):
+                coeffs = data[indptr[row] : indptr[row + 1]].tolist()
+                shape = (constant, tuple(sorted(coeffs)))
+                for col, coeff in zip(indices[indptr[row] : indptr[row + 1]].tolist(), coeffs):
+                    occurrences.setdefault(columns[col], []).append((row if ordered else 0, coeff, shape))
+            self._canonical_data[key] = {var: tuple(sorted(occ)) for var, occ in occurrences.items()}  # noqa: VNE002
+        sorted_occurrences: Dict[Var, Tuple[Tuple[Any, ...], ...]] = self._canonical_data[key]
+        return sorted_occurrences
+
+    def _slot_fingerprint(self, slot_index: Mapping[Var, int], ordered: bool) -> bytes:
+        """
+        A digest of the termlist with its variables replaced by slots.
+
+        The digest equals the fingerprint of the termlist renamed to the slots
+        in structure, but it is computed from the rows without renaming them.
+
+        Args:
+            slot_index: The slot of each variable of the termlist.
+            ordered: Whether the digest should depend on the order of the terms.
+
+        Returns:
+            A digest of FINGERPRINT_BYTES bytes.
+        """
+        columns, indptr, indices, data, constants = self._rows()
+        column_slots = np.array([slot_index.get(var, -1) for var in columns], dtype=np.int64)  # noqa: VNE002
+        key = ("slots", ordered, column_slots.tobytes())
+        if key not in self._canonical_data:
+            entry_slots = column_slots[indices]
+            entry_rows = np.repeat(np.arange(len(constants)), np.diff(indptr))
+            order = np.lexsort((entry_slots, entry_rows))
+            slot_bytes = entry_slots[order].tobytes()
+            # adding 0.0 turns negative zeros into positive ones, which compare equal
+            coeff_bytes = (data[order] + 0.0).tobytes()
+            constant_bytes = (constants + 0.0).tobytes()
+            width = FINGERPRINT_WORD_BYTES
+            row_digests = []
+            for row in range(len(constants)):
+                begin, end = indptr[row] * width, indptr[row + 1] * width
+                digest = hashlib.blake2b(slot_bytes[begin:end], digest_size=FINGERPRINT_BYTES)
+                digest.update(coeff_bytes[begin:end])
+                digest.update(constant_bytes[row * width : (row + 1) * width])
+                row_digests.append(digest.digest())
+            if not ordered:
+                row_digests.sort()
+            # the digests of previous slot assignments are rarely useful again
+            self._canonical_data = {
+                cached: value for cached, value in self._canonical_data.items() if cached[0] != "slots"
+            }
+            self._canonical_data[key] = hashlib.blake2b(b"".join(row_digests), digest_size=FINGERPRINT_BYTES).digest()
+        fingerprint: bytes = self._canonical_data[key]
+        return fingerprint
+
+    def _rows_by_var(self) -> Dict[Var, Tuple[List[int], List[int]]]:
+        if self._var_rows is None and self._left_out is not None:
+            full_rows, removed = self._left_out
+            left_rows = {
+                var: (_rows_left(positive, removed), _rows_left(negative, removed))
+                for var, (positive, negative) in full_rows.items()  # noqa: VNE002
+            }
+            self._var_rows = {var: sides for var, sides in left_rows.items() if sides[0] or sides[1]}  # noqa: VNE002
+        elif self._var_rows is None:
+            var_rows: Dict[Var, Tuple[List[int], List[int]]] = {}
+            for row, term in enumerate(self.terms):
+                for var, coeff in term.variables.items():  # noqa: VNE002
+                    var_rows.setdefault(var, ([], []))[0 if coeff > 0 else 1].append(row)
+            self._var_rows = var_rows
+        return self._var_rows
+
+    def _equality_rows(self) -> List[Tuple[int, int]]:
+        """
+        Find the pairs of opposite terms of the termlist, which together state an equality.
+
+        Returns:
+            The pairs of positions of opposite terms, as found by _equality_pairs.
+                The list must not be modified.
+        """
+        if self._equalities is None:
+            self._equalities = _equality_pairs(self.terms)
+        return self._equalities
+
+    def _elimination_fingerprint(self, vars_to_elim: List[Var], left_out: Set[int]) -> bytes:
+        """
+        A digest of the terms that the local tactics read to eliminate variables.
+
+        Args:
+            vars_to_elim: The variables to eliminate.
+            left_out: The positions of the terms to leave out.
+
+        Returns:
+            A digest of FINGERPRINT_BYTES bytes of the terms, in order, that
+                contain a variable to eliminate or no variable.
+        """
+        terms = self.terms
+        rows = {row for row, term in enumerate(terms) if not term.variables}
+        for var in vars_to_elim:  # noqa: VNE002
+            rows.update(self._rows_with_var(var))
+        digest = hashlib.blake2b(digest_size=FINGERPRINT_BYTES)
+        for row in sorted(rows - left_out):
+            digest.update(terms[row].fingerprint)
+        return digest.digest()
+
+    def _rows_with_var(self, var: Var, sign: int = 0) -> List[int]:  # noqa: VNE002
+        """
+        Find the terms that contain a variable.
+
+        Args:
+            var: The variable.
+            sign: If positive or negative, only terms in which the coefficient
+                of the variable has this sign are returned.
+
+        Returns:
+            The positions of the terms in increasing order. The list must not be modified.
+        """
+        if self._var_rows is None and self._left_out is not None:
+            # only the rows of this variable are renumbered
+            full_rows, removed = self._left_out
+            positive, negative = (_rows_left(rows, removed) for rows in full_rows.get(var, ([], [])))
+        else:
+            positive, negative = self._rows_by_var().get(var, ([], []))
+        if sign > 0:
+            return positive
+        if sign < 0:
+            return negative
+        return sorted(positive + negative)
+
+    def _extended(self, terms: List[PolyhedralTerm]) -> PolyhedralTermList:
+        """
+        Append terms to a copy of the termlist, reusing its index of the rows of each variable.
+
+        Args:
+            terms: The terms to append.
+
+        Returns:
+            A termlist with the terms of self followed by the given terms.
+        """
+        that = PolyhedralTermList(self.terms + terms)
+        var_rows = dict(self._rows_by_var())
+        extended: Dict[Var, Tuple[List[int], List[int]]] = {}
+        for row, term in enumerate(terms, len(self.terms)):
+            for var, coeff in term.variables.items():  # noqa: VNE002
+                if var not in extended:
+                    positive, negative = var_rows.get(var, ([], []))
+                    extended[var] = (list(positive), list(negative))
+                extended[var][0 if coeff > 0 else 1].append(row)
+        var_rows.update(extended)
+        that._var_rows = var_rows  # noqa: WPS437
+        return that
+
+    def _leave_out(self, rows: List[int]) -> PolyhedralTermList:
+        """
+        Remove terms from a copy of the termlist, reusing its index of the rows of each variable.
+
+        Args:
+            rows: The positions of the terms to remove, in increasing order.
+
+        Returns:
+            A termlist with the other terms of self, in the same order.
+        """
+        terms = self.terms
+        kept: List[PolyhedralTerm] = []
+        start = 0
+        for row in rows:
+            kept.extend(terms[start:row])
+            start = row + 1
+        kept.extend(terms[start:])
+        that = PolyhedralTermList([])
+        that._terms = ReadOnlyList(kept)  # noqa: WPS437
+        that._left_out = (self._rows_by_var(), list(rows))  # noqa: WPS437
+        return that
+
+    def replace_term(self, index: int, term: PolyhedralTerm) -> None:  # type: ignore[override]
+        """
+        Replace the term at a given position of the termlist.
+
+        The index of the rows of each variable is updated instead of rebuilt.
+
+        Args:
+            index: The position of the term to replace.
+            term: The new term.
+        """
+        var_rows = None if self._var_rows is None else dict(self._var_rows)
+        old_term = self.terms[index]
+        super().replace_term(index, term)
+        if var_rows is None:
+            return
+        # the lists of rows may be shared with copies of the termlist, so they are replaced
+        for var, coeff in old_term.variables.items():  # noqa: VNE002
+            sides = list(var_rows[var])
+            side = 0 if coeff > 0 else 1
+            sides[side] = [row for row in sides[side] if row != index]
+            var_rows[var] = (sides[0], sides[1])
+        for var, coeff in term.variables.items():  # noqa: VNE002
+            sides = list(var_rows.get(var, ([], [])))
+            side = 0 if coeff > 0 else 1
+            sides[side] = list(sides[side])
+            bisect.insort(sides[side], index)
+            var_rows[var] = (sides[0], sides[1])
+        self._var_rows = {var: sides for var, sides in var_rows.items() if sides[0] or sides[1]}  # noqa: VNE002
+
+    def get_terms_with_vars(self, variable_list: List[Var]) -> PolyhedralTermList:
+        """
+        Returns the list of terms which contain any of the variables indicated.
+
+        Args:
+            variable_list: a list of variables being sought in current TermList.
+
+        Returns:
+            The list of terms which contain any of the variables indicated.
+        """
+        rows = set()
+        for var in variable_list:  # noqa: VNE002
+            rows.update(self._rows_with_var(var))
+        terms = self.terms
+        return PolyhedralTermList([terms[row] for row in sorted(rows)])
+
+    def _num_rows(self) -> int:
+        if self._terms is not None:
+            return len(self._terms)
+        assert self._b is not None
+        return len(self._b)
+
+    def _count_nonzero(self) -> int:
+        if self._terms is not None:
+            return sum(len(term.variables) for term in self._terms)
+        assert self._a is not None
+        if issparse(self._a):
+            return int(cast(spmatrix, self._a).count_nonzero())
+        return int(np.count_nonzero(self._a))
+
+    def _get_polytope(self, variables: List[Var], sparse: bool = False) -> Tuple[matrix_t, np.ndarray]:
+        """
+        Matrix-vector representation of the termlist with a given column order.
+
+        Args:
+            variables: The variables indexing the columns of the matrix.
+            sparse: Whether the matrix should be returned in CSR format.
+
+        Returns:
+            A new matrix-vector pair representing the constraints of the termlist.
+        """
+        if self._a is None or self._b is None or self._variables is None:
+            index = self.var_index
+            if self.vars != variables:
+                index = {var: col for col, var in enumerate(variables)}  # noqa: VNE002
+            rows = []
+            cols = []
+            coeffs = []
+            for i, term in enumerate(self.terms):
+                for var, coeff in term.variables.items():  # noqa: VNE002
+                    rows.append(i)
+                    cols.append(index[var])
+                    coeffs.append(coeff)
+            shape = (len(self.terms), len(variables))
+            if sparse:
+                a = csr_matrix((coeffs, (rows, cols)), shape=shape)
+            else:
+                a = np.zeros(shape)
+                a[rows, cols] = coeffs
+            # cache the representation for future queries
+            self._variables = list(variables)
+            self._a = a
+            self._b = np.array([term.constant for term in self.terms], dtype=float)
+            return a.copy(), np.copy(self._b)
+        if self._variables == variables:
+            a = self._a.copy()
+        else:
+            a = _reindex_columns(self._a, self._variables, variables)
+        return _to_format(a, sparse), np.copy(self._b)
 
     def __str__(self) -> str:
         res = "[\n  "
@@ -508,7 +1918,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         return res
 
     def __hash__(self) -> int:
-        return hash(tuple(self.terms))
+        return int.from_bytes(self.fingerprint()[:8], "little", signed=True)
 
     def to_str_list(self) -> List[str]:
         """
@@ -517,13 +1927,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         Returns:
             A list of strings corresponding to the terms of the termlist.
         """
-        str_list = []
-        ts = self.terms.copy()
-        while ts:
-            s, rest = serializer.polyhedral_term_list_to_strings(ts)
-            str_list.append(s)
-            ts = rest
-        return str_list
+        return serializer.polyhedral_term_list_to_str_list(self.terms)
 
     def evaluate(self, var_values: Dict[Var, numeric]) -> PolyhedralTermList:  # noqa: WPS231
         """
@@ -542,7 +1946,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         """
         new_list = []
         for term in self.terms:
-            new_term = term.copy()
+            new_term = term
             for var, val in var_values.items():  # noqa: VNE002
                 new_term = new_term.substitute_variable(
                     var=var, subst_with_term=PolyhedralTerm(variables={}, constant=-val)
@@ -611,7 +2015,8 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
             A tuple of (a) a list of terms not containing any variables in `vars_to_elim`
                 and which, in the context provided, imply the terms contained in the
                 calling termlist; and (b) the list of tuples, for each processed term, of
-                the tactic used, time spend, and tactic invocation count.
+                the tactic used, time spend, and tactic invocation count. Results
+                found in the query cache report the statistics of their computation.
 
         Raises:
             ValueError: Self has empty intersection with its context.
@@ -621,6 +2026,63 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         logging.debug("Vars to elim: %s", vars_to_elim)
         if tactics_order is None:
             tactics_order = TACTICS_ORDER
+        return self._cached_elimination(
+            "elim_vars_by_refining",
+            context,
+            vars_to_elim,
+            (simplify, tuple(tactics_order)),
+            lambda: self._elim_vars_by_refining(context, vars_to_elim, simplify, tactics_order),
+        )
+
+    def _cached_elimination(
+        self,
+        kind: str,
+        context: PolyhedralTermList,
+        vars_to_elim: List[Var],
+        options: Tuple[Any, ...],
+        compute: Callable[[], Tuple[PolyhedralTermList, TacticStatistics]],
+    ) -> Tuple[PolyhedralTermList, TacticStatistics]:
+        """
+        Answer a variable elimination from the query cache.
+
+        Args:
+            kind: The kind of the elimination.
+            context: The context of the elimination.
+            vars_to_elim: The variables to eliminate.
+            options: Further arguments of the elimination.
+            compute: Computes the elimination.
+
+        Returns:
+            The result of the elimination. A cached result comes with the
+                statistics of the tactics that computed it.
+        """
+        termlist, tactics_data = _cached_query_up_to_renaming(
+            kind, (self, context), compute, ordered=True, extra=tuple(vars_to_elim), options=options
+        )
+        return termlist, list(tactics_data)
+
+    def _elim_vars_by_refining(
+        self, context: PolyhedralTermList, vars_to_elim: List[Var], simplify: bool, tactics_order: List[int]
+    ) -> Tuple[PolyhedralTermList, TacticStatistics]:
+        """
+        Eliminate variables by refining the termlist without looking up the query cache.
+
+        Args:
+            context:
+                The TermList providing the context for the transformation.
+            vars_to_elim:
+                Variables that should not appear in the resulting terms.
+            simplify:
+                Whether to perform simplifications.
+            tactics_order:
+                The order of tactics to invoke during transformation.
+
+        Returns:
+            The transformed termlist and the statistics of the tactics used.
+
+        Raises:
+            ValueError: Constraints have empty intersection with context.
+        """
         if simplify:
             try:
                 termlist = self.simplify(context)
@@ -649,7 +2111,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         Returns:
             True if empty. False otherwise.
         """
-        return len(self.terms) == 0
+        return self._num_rows() == 0
 
     def elim_vars_by_relaxing(
         self,
@@ -683,6 +2145,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
                 and which, in the context provided, are implied by the terms
                 contained in the calling termlist; and (b) the list of tuples, for each
                 processed term, of the tactic used, time spend, and tactic invocation count.
+                Results found in the query cache report the statistics of their computation.
 
         Raises:
             ValueError: Constraints have empty intersection with context.
@@ -691,9 +2154,38 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         logging.debug("Relaxing from terms %s", self)
         logging.debug("Context: %s", context)
         logging.debug("Vars to elim: %s", vars_to_elim)
-
         if tactics_order is None:
             tactics_order = TACTICS_ORDER
+        return self._cached_elimination(
+            "elim_vars_by_relaxing",
+            context,
+            vars_to_elim,
+            (simplify, tuple(tactics_order)),
+            lambda: self._elim_vars_by_relaxing(context, vars_to_elim, simplify, tactics_order),
+        )
+
+    def _elim_vars_by_relaxing(
+        self, context: PolyhedralTermList, vars_to_elim: List[Var], simplify: bool, tactics_order: List[int]
+    ) -> Tuple[PolyhedralTermList, TacticStatistics]:
+        """
+        Eliminate variables by relaxing the termlist without looking up the query cache.
+
+        Args:
+            context:
+                The TermList providing the context for the transformation.
+            vars_to_elim:
+                Variables that should not appear in the resulting terms.
+            simplify:
+                Whether to perform simplifications.
+            tactics_order:
+                The order of tactics to invoke during transformation.
+
+        Returns:
+            The transformed termlist and the statistics of the tactics used.
+
+        Raises:
+            ValueError: Constraints have empty intersection with context.
+        """
         if simplify:
             try:
                 termlist = self.simplify(context)
@@ -717,8 +2209,137 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         # eliminate terms containing the variables to be eliminated
         terms_to_elim = termlist.get_terms_with_vars(vars_to_elim)
         termlist.terms = list_diff(termlist.terms, terms_to_elim.terms)
+        if terms_to_elim.terms and PROJECTION_TACTIC in tactics_order:
+            # relax at once the terms that the other tactics could not transform
+            ta = time.time()
+            try:
+                projected = terms_to_elim._project(context, vars_to_elim)
+            except ValueError:
+                logging.debug("Could not project %s", terms_to_elim)
+                return termlist, tactics_data
+            tactics_data.append((PROJECTION_TACTIC, time.time() - ta, 1))
+            termlist.terms = termlist.terms + projected.terms
+            if simplify:
+                termlist = termlist.simplify(context)
         return termlist, tactics_data
 
+    def _substitute_equalities(
+        self, context: PolyhedralTermList, vars_to_elim: List[Var], refine: bool
+    ) -> Tuple[PolyhedralTermList, PolyhedralTermList, int]:
+        """
+        Eliminate variables by substitution from equalities.
+
+        An equality is a pair of opposite terms. Each variable to eliminate is
+        solved from the equality in which its coefficient is largest, and the
+        solution is substituted in all the other terms of the termlist and the
+        context. The equality is then dropped. When refining, only equalities
+        of the context are used, because the result must imply the terms of
+        the termlist. The equalities are found once per termlist: substituting
+        a solution in two opposite terms yields opposite terms, so the
+        remaining pairs stay equalities.
+
+        Args:
+            context:
+                The TermList providing the context for the transformation.
+            vars_to_elim:
+                Variables that should not appear in the resulting terms.
+            refine:
+                Whether the transformation is a refinement.
+
+        Returns:
+            A tuple consisting of (i) the termlist and (ii) the context after
+                the substitutions, and (iii) the number of variables eliminated.
+        """
+        pools = [list(self.terms), list(context.terms)]
+        equalities = [self._equality_rows(), context._equality_rows()]
+        substituted = 0
+        for var in vars_to_elim:  # noqa: VNE002
+            candidates = [
+                (abs(pools[k][pair[0]].get_coefficient(var)), k, pair)
+                for k in ([1] if refine else [0, 1])
+                for pair in equalities[k]
+                if pools[k][pair[0]].contains_var(var)
+            ]
+            if not candidates:
+                continue
+            _, k, pair = max(candidates, key=lambda candidate: candidate[0])
+            pool = pools[k]
+            equality = pool[pair[0]]
+            for index in sorted(pair, reverse=True):
+                del pool[index]  # noqa: WPS420
+            # shift the positions of the remaining equalities past the dropped terms
+            equalities[k] = [
+                (first - sum(index < first for index in pair), second - sum(index < second for index in pair))
+                for first, second in equalities[k]
+                if (first, second) != pair
+            ]
+            coeff = equality.get_coefficient(var)
+            # var = sum(-a_k / a x_k) + c / a, where the constant of the term is subtracted
+            solution = PolyhedralTerm(
+                {other: -value / coeff for other, value in equality.variables.items() if other != var},
+                -equality.constant / coeff,
+            )
+            pools = [[term.substitute_variable(var, solution) for term in terms] for terms in pools]
+            substituted += 1
+        if not substituted:
+            return self, context, 0
+        # drop the terms left without variables, which hold trivially
+        terms, context_terms = [[term for term in terms if term.vars or term.constant < 0] for terms in pools]
+        return PolyhedralTermList(terms), PolyhedralTermList(context_terms), substituted
+
+    def _project(self, context: PolyhedralTermList, vars_to_elim: List[Var]) -> PolyhedralTermList:
+        """
+        Relax the termlist in its context by projecting out variables.
+
+        The terms of the termlist and the context are combined by Fourier-Motzkin
+        elimination. Combinations using only terms of the context are discarded.
+
+        Args:
+            context:
+                The TermList providing the context for the relaxation.
+            vars_to_elim:
+                Variables that should not appear in the resulting terms.
+
+        Returns:
+            Terms without the variables in `vars_to_elim` that are implied by
+                the termlist in its context.
+        """
+        variables, a, b, a_ctx, b_ctx = PolyhedralTermList.termlist_to_polytope(self, context, sparse=False)
+        if not len(b_ctx):
+            a_ctx = np.zeros((0, len(variables)))
+        column = {var: j for j, var in enumerate(variables)}  # noqa: VNE002
+        columns = [column[var] for var in vars_to_elim if var in column]  # noqa: VNE002
+        a_proj, b_proj, histories = _fourier_motzkin(
+            np.concatenate((a, a_ctx)), np.concatenate((b, b_ctx)), columns, PROJECTION_MAX_TERMS
+        )
+        own_rows = [i for i, history in enumerate(histories) if min(history) < len(b)]
+        kept_columns = [j for j in range(len(variables)) if j not in columns]
+        return PolyhedralTermList.polytope_to_termlist(
+            a_proj[np.ix_(own_rows, kept_columns)], b_proj[own_rows], [variables[j] for j in kept_columns]
+        )
+
+    def fingerprint(self, ordered: bool = False) -> bytes:
+        """
+        A digest of the terms of the termlist that is the same in every process.
+
+        The digest is computed from the digests of the terms and cached until
+        the terms change.
+
+        Args:
+            ordered: Whether the digest should depend on the order of the terms.
+
+        Returns:
+            A digest of FINGERPRINT_BYTES bytes. Unordered digests are equal
+                for termlists that contain the same terms in any order.
+        """
+        if ordered not in self._fingerprints:
+            term_digests = [term.fingerprint for term in self.terms]
+            if not ordered:
+                term_digests.sort()
+            digest = hashlib.blake2b(b"".join(term_digests), digest_size=FINGERPRINT_BYTES)
+            self._fingerprints[ordered] = digest.digest()
+        return self._fingerprints[ordered]
+
     def simplify(self, context: Optional[PolyhedralTermList] = None) -> PolyhedralTermList:
         """
         Remove redundant terms in the PolyhedralTermList using the provided context.
@@ -728,6 +2349,21 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
             the context is $\\{x + y \\le 0\\}$. Then the TermList could be
             simplified to $\\{x - y \\le 0\\}$.
 
+        Args:
+            context:
+                The TermList providing the context for the simplification.
+
+        Returns:
+            A new PolyhedralTermList with redundant terms removed using the provided context.
+        """
+        # the result follows the order of the terms, so the key does too
+        operands = (self,) if context is None else (self, context)
+        return _cached_query_up_to_renaming("simplify", operands, lambda: self._simplify(context), ordered=True)
+
+    def _simplify(self, context: Optional[PolyhedralTermList]) -> PolyhedralTermList:
+        """
+        Remove redundant terms without looking up the query cache.
+
         Args:
             context:
                 The TermList providing the context for the simplification.
@@ -743,15 +2379,13 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         logging.debug("Context: %s", context)
         if context:
             new_self = self - context
-            result = PolyhedralTermList.termlist_to_polytope(new_self, context)
+            helpers = context
         else:
-            result = PolyhedralTermList.termlist_to_polytope(self, PolyhedralTermList())
-
-        variables = result[0]
-        self_mat = result[1]
-        self_cons = result[2]
-        ctx_mat = result[3]
-        ctx_cons = result[4]
+            new_self = self
+            helpers = PolyhedralTermList()
+        variables, self_mat, self_cons, ctx_mat, ctx_cons = PolyhedralTermList.termlist_to_polytope(  # noqa: WPS236
+            new_self, helpers
+        )
         # logging.debug("Polytope is \n%s", self_mat)
         try:
             a_red, b_red = PolyhedralTermList.reduce_polytope(self_mat, self_cons, ctx_mat, ctx_cons)
@@ -760,6 +2394,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
                 "The constraints \n{}\n".format(self) + "are unsatisfiable in context \n{}".format(context)
             ) from e
         logging.debug("Reduction: \n%s", a_red)
+        # the result keeps the matrix representation; terms are built only if requested
         simplified = PolyhedralTermList.polytope_to_termlist(a_red, b_red, variables)
         logging.debug("Back to terms: \n%s", simplified)
         return simplified
@@ -768,6 +2403,19 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         """
         Tells whether the argument is a larger specification.
 
+        Args:
+            other:
+                TermList against which we are comparing self.
+
+        Returns:
+            self <= other
+        """
+        return _cached_query_up_to_renaming("refines", (self, other), lambda: self._refines(other))
+
+    def _refines(self, other: PolyhedralTermList) -> bool:
+        """
+        Tell whether the argument is a larger specification without looking up the query cache.
+
         Args:
             other:
                 TermList against which we are comparing self.
@@ -792,6 +2440,15 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         """
         Tell whether the argument has no satisfying assignments.
 
+        Returns:
+            True if constraints cannot be satisfied.
+        """
+        return _cached_query_up_to_renaming("is_empty", (self,), self._is_empty)
+
+    def _is_empty(self) -> bool:
+        """
+        Tell whether the argument has no satisfying assignments without looking up the query cache.
+
         Returns:
             True if constraints cannot be satisfied.
         """
@@ -817,34 +2474,68 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         logging.debug("Variables to eliminate: %s", vars_to_elim)
         if tactics_order is None:
             tactics_order = TACTICS_ORDER
-        term_list = list(self.terms)
-        new_terms = self.copy()
+        that = self
 
         # List to store the tuples of the tactic used, time spent, and invocation count
         tactics_used: TacticStatistics = []
 
+        if EQUALITY_TACTIC in tactics_order:
+            ta = time.time()
+            that, context, substituted = self._substitute_equalities(context, vars_to_elim, refine)
+            if substituted:
+                tactics_used.append((EQUALITY_TACTIC, time.time() - ta, substituted))
+        term_list = list(that.terms)
+        new_terms = list(term_list)
+        # the helpers of each term are the context followed by the other terms not in the context;
+        # they are kept in a single termlist, from which the term itself and those in the context are left out
+        context_terms = set(context.terms)
+        n_context = len(context.terms)
+        all_helpers = context._extended(term_list)
+        in_context = {n_context + k for k, new_term in enumerate(new_terms) if new_term in context_terms}
+        query = (tuple(vars_to_elim), refine, tuple(tactics_order), _query_settings())
+
         for i, term in enumerate(term_list):
-            if list_intersection(term.vars, vars_to_elim):
-                copy_new_terms = new_terms.copy()
-                copy_new_terms.terms.remove(term)
-                helpers = context | copy_new_terms
+            if not list_intersection(term.vars, vars_to_elim):
+                continue
+            ta = time.time()
+            left_out = in_context | {n_context + i}
+            key = None
+            hit, cached = False, None
+            if transform_cache.enabled:
+                key = (term.fingerprint, all_helpers._elimination_fingerprint(vars_to_elim, left_out), query)
+                hit, cached = transform_cache.lookup(key)
+            if hit:
+                # a repeated transformation reports the tactic that first computed it
+                new_term, tactic_num, tactic_count = cast(Tuple[PolyhedralTerm, int, int], cached)
+                tactics_used.append((tactic_num, time.time() - ta, tactic_count))
+            else:
+                helpers = all_helpers._leave_out(sorted(left_out))
                 try:
                     (new_term, tactic_num, tactic_time, tactic_count) = PolyhedralTermList._transform_term(
                         term, helpers, vars_to_elim, refine, tactics_order
                     )
                 except ValueError:
-                    new_term = term.copy()
+                    new_term = term
                     tactic_num = 0
                     tactic_time = 0
                     tactic_count = 0
+                # the tactics tried are those up to the successful one
+                tried = tactics_order[: tactics_order.index(tactic_num) + 1] if tactic_num > 0 else tactics_order
+                if key is not None and LOCAL_TACTICS.issuperset(
+                    tactic for tactic in tried if tactic in PolyhedralTermList.TACTICS
+                ):
+                    transform_cache.store(key, (new_term, tactic_num, tactic_count))
                 tactics_used.append((tactic_num, tactic_time, tactic_count))
 
-            else:
-                new_term = term.copy()
-
-            new_terms.terms[i] = new_term
+            if tactic_num > 0:
+                new_terms[i] = new_term
+                all_helpers.replace_term(n_context + i, new_term)
+                if new_term in context_terms:
+                    in_context.add(n_context + i)
+                else:
+                    in_context.discard(n_context + i)
 
-        that = PolyhedralTermList(new_terms.terms)
+        that = PolyhedralTermList(new_terms)
 
         # the last step needs to be a simplification
         logging.debug("Ending transformation with simplification")
@@ -856,6 +2547,27 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         """
         Optimizes a linear expression in the feasible region of the termlist.
 
+        Args:
+            objective:
+                The objective to optimize.
+            maximize:
+                If true, the routine maximizes; it minimizes otherwise.
+
+        Returns:
+            The optimal value of the objective. If the objective is unbounded, None is returned.
+
+        Raises:
+            ValueError: Constraints are likely unfeasible.
+        """
+        objective_termlist = PolyhedralTermList([PolyhedralTerm(objective, 0)])
+        return _cached_query_up_to_renaming(
+            "optimize", (self, objective_termlist), lambda: self._optimize(objective, maximize), options=(maximize,)
+        )
+
+    def _optimize(self, objective: Dict[Var, numeric], maximize: bool) -> Optional[numeric]:
+        """
+        Optimize a linear expression without looking up the query cache.
+
         Args:
             objective:
                 The objective to optimize.
@@ -873,7 +2585,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         polarity = 1
         if maximize:
             polarity = -1
-        res = linprog(c=polarity * obj_mat[0], A_ub=self_mat, b_ub=self_cons, bounds=(None, None))
+        res = solve_lp(c=polarity * _dense_row(obj_mat, 0), a_ub=self_mat, b_ub=self_cons, site="optimize")
         # Linprog's status values
         # 0 : Optimization proceeding nominally.
         # 1 : Iteration limit reached.
@@ -887,10 +2599,40 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
             return polarity * fun_val
         raise ValueError("Constraints are unfeasible")
 
+    def get_variable_bounds(self, var: Var) -> Tuple[Optional[numeric], Optional[numeric]]:  # noqa: VNE002
+        """
+        Obtain the bounds of a variable in the feasible region of the termlist.
+
+        Both bounds are computed in the same LP session.
+
+        Args:
+            var: The variable whose bounds are sought.
+
+        Returns:
+            The minimum and maximum values of the variable. An unbounded side is returned as None.
+
+        Raises:
+            ValueError: Constraints are likely unfeasible.
+        """
+        obj = PolyhedralTermList([PolyhedralTerm(variables={var: 1}, constant=0)])
+        _, self_mat, self_cons, obj_mat, _ = PolyhedralTermList.termlist_to_polytope(self, obj)  # noqa: WPS236
+        session = LpSession(self_mat, self_cons, site="get_variable_bounds")
+        bounds: List[Optional[numeric]] = []
+        for polarity in (1, -1):
+            session.set_objective(polarity * _dense_row(obj_mat, 0))
+            res = session.solve()
+            if res["status"] == 3:
+                bounds.append(None)
+            elif res["status"] == 0:
+                bounds.append(polarity * res["fun"])
+            else:
+                raise ValueError("Constraints are unfeasible")
+        return bounds[0], bounds[1]
+
     @staticmethod
     def termlist_to_polytope(
-        terms: PolyhedralTermList, context: PolyhedralTermList
-    ) -> Tuple[List[Var], np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        terms: PolyhedralTermList, context: PolyhedralTermList, sparse: Optional[bool] = None
+    ) -> Tuple[List[Var], matrix_t, np.ndarray, matrix_t, np.ndarray]:
         """
         Converts a list of terms with its context into matrix-vector pairs.
 
@@ -912,35 +2654,33 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
                 list of terms to convert to matrix-vector form.
             context:
                 Context terms to convert to matrix-vector form.
+            sparse:
+                Whether the matrices should be returned in CSR format. If not
+                provided, the sparse format is used for large matrices with few
+                nonzero entries.
 
         Returns:
             A tuple `variables, A, b, a_h, b_h` consisting of the variable
                 order and the matrix-vector pairs for the terms and the context.
         """
         variables = list(list_union(terms.vars, context.vars))
-        a = []
-        b = []
-        for term in terms.terms:
-            pol, coeff = PolyhedralTerm.term_to_polytope(term, variables)
-            a.append(pol)
-            b.append(coeff)
-
-        a_h = []
-        b_h = []
-        for term in context.terms:
-            pol, coeff = PolyhedralTerm.term_to_polytope(term, variables)
-            a_h.append(pol)
-            b_h.append(coeff)
-
-        if len(context.terms) == 0:
-            a_h_ret = np.array([[]])
+        if sparse is None:
+            n_entries = (terms._num_rows() + context._num_rows()) * len(variables)  # noqa: WPS437
+            sparse = _use_sparse_format(n_entries, terms._count_nonzero() + context._count_nonzero())  # noqa: WPS437
+        if terms.lacks_constraints():
+            a, b = np.array([]), np.array([])
+        else:
+            a, b = terms._get_polytope(variables, sparse)  # noqa: WPS437
+
+        if context.lacks_constraints():
+            a_h, b_h = np.array([[]]), np.array([])
         else:
-            a_h_ret = np.array(a_h)
+            a_h, b_h = context._get_polytope(variables, sparse)  # noqa: WPS437
         # logging.debug("a is \n%s", a)
-        return variables, np.array(a), np.array(b), a_h_ret, np.array(b_h)
+        return variables, a, b, a_h, b_h
 
     @staticmethod
-    def polytope_to_termlist(matrix: np.ndarray, vector: np.ndarray, variables: List[Var]) -> PolyhedralTermList:
+    def polytope_to_termlist(matrix: matrix_t, vector: np.ndarray, variables: List[Var]) -> PolyhedralTermList:
         """
         Transforms a matrix-vector pair into a PolyhedralTermList.
 
@@ -956,29 +2696,36 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         Returns:
             The PolyhedralTermList corresponding to the given data.
         """
-        term_list = []
-        # logging.debug("Poly is " + str(polytope))
         # logging.debug("matrix is %s", matrix)
         if len(matrix.shape) > 1:
             n, m = matrix.shape
             assert m == len(variables)
         else:
             n = matrix.shape[0]
-            m = 0
-        for i in range(n):
-            row = list(matrix[i])
-            const = vector[i]
-            term = PolyhedralTerm.polytope_to_term(row, const, variables)
-            term_list.append(term)
-        return PolyhedralTermList(list(term_list))
+            matrix = np.reshape(matrix, (n, 0))
+            variables = []
+        vector = np.reshape(np.asarray(vector, dtype=float), (-1,))
+        assert n == len(vector)
+        # the terms are materialized only when requested
+        that = PolyhedralTermList([])
+        that._terms = None  # noqa: WPS437
+        that._variables = list(variables)  # noqa: WPS437
+        if issparse(matrix):
+            that._a = csr_matrix(matrix, dtype=float)  # noqa: WPS437
+        else:
+            that._a = np.asarray(matrix, dtype=float)  # noqa: WPS437
+        that._b = vector  # noqa: WPS437
+        return that
 
     @staticmethod
     def reduce_polytope(  # noqa: WPS231
-        a: np.ndarray, b: np.ndarray, a_help: Optional[np.ndarray] = None, b_help: Optional[np.ndarray] = None
-    ) -> Tuple[np.ndarray, np.ndarray]:
+        a: matrix_t, b: np.ndarray, a_help: Optional[matrix_t] = None, b_help: Optional[np.ndarray] = None
+    ) -> Tuple[matrix_t, np.ndarray]:
         """
         Eliminate redundant constraints from a given polytope.
 
+        The matrices can be given either as dense arrays or in sparse format.
+
         Args:
             a:
                 Matrix of H-representation of polytope to reduce.
@@ -996,9 +2743,39 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
             a_temp: Matrix of H-representation of reduced polytope.
             b_temp: Vector of H-representation of reduced polytope.
         """
-        if not isinstance(a_help, np.ndarray):
+        kept_rows, b_temp = PolyhedralTermList._reduce_polytope_rows(a, b, a_help, b_help)
+        if len(a.shape) < 2:
+            return a, b
+        return a[kept_rows, :], b_temp[kept_rows]
+
+    @staticmethod
+    def _reduce_polytope_rows(  # noqa: WPS231
+        a: matrix_t, b: np.ndarray, a_help: Optional[matrix_t] = None, b_help: Optional[np.ndarray] = None
+    ) -> Tuple[List[int], np.ndarray]:
+        """
+        Identify the rows of a polytope which are not redundant.
+
+        Args:
+            a:
+                Matrix of H-representation of polytope to reduce.
+            b:
+                Vector of H-representation of polytope to reduce.
+            a_help:
+                Matrix of H-representation of context polytope.
+            b_help:
+                Vector of H-representation of context polytope.
+
+        Raises:
+            ValueError: The intersection of given polytope with its context is empty.
+
+        Returns:
+            A tuple consisting of (i) the indices, in increasing order, of the
+                rows of the reduced polytope and (ii) the vector of the
+                H-representation of the polytope.
+        """
+        if a_help is None:
             a_help = np.array([[]])
-        if not isinstance(b_help, np.ndarray):
+        if b_help is None:
             b_help = np.array([])
         if len(a.shape) > 1:
             n, m = a.shape
@@ -1014,53 +2791,262 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
             assert len(b_help) == 0
         if helper_present and m > 0:
             assert m_h == m
-        if n == 0:
-            return a, b
-        if n == 1 and not helper_present:
-            return a, b
+        if n == 0 or (n == 1 and not helper_present):
+            return list(range(n)), b
 
-        i = 0
-        a_temp = np.copy(a)
-        b_temp = np.copy(b)
-        while i < n:
-            objective = a_temp[i, :] * -1
-            b_temp[i] += 1
-            if helper_present:
-                a_opt = np.concatenate((a_temp, a_help), axis=0)
-                b_opt = np.concatenate((b_temp, b_help))
-            else:
-                a_opt = a_temp
-                b_opt = b_temp
-            # Linprog's status values
-            # 0 : Optimization proceeding nominally.
-            # 1 : Iteration limit reached.
-            # 2 : Problem appears to be infeasible.
-            # 3 : Problem appears to be unbounded.
-            # 4 : Numerical difficulties encountered.
-            res = linprog(c=objective, A_ub=a_opt, b_ub=b_opt, bounds=(None, None))  # ,options={'tol':0.000001})
-            b_temp[i] -= 1
-            if res["status"] == 3 or (res["status"] == 0 and -res["fun"] <= b_temp[i]):  # noqa: WPS309
+        if helper_present:
+            a_all = _stack_rows(a, a_help)
+            b_all = np.concatenate((b, b_help))
+        else:
+            a_all = a
+            b_all = np.copy(b)
+        keep_all = np.ones(len(b_all), dtype=bool)
+        # rows implied by a parallel row do not need an LP
+        if m > 0 and helper_present:
+            keep_all[:n] = ~_parallel_redundant_rows(a, b, a_help, b_help)
+        elif m > 0:
+            keep_all[:n] = ~_parallel_redundant_rows(a, b)
+        start = 0
+        if not issparse(a_all) and small_lps_supported(int(np.count_nonzero(keep_all)), m):
+            start = PolyhedralTermList._reduce_rows_batched(a_all, b_all, keep_all, n)
+        if start == 0 and executor_workers() > 1 and np.count_nonzero(keep_all[:n]) >= PARALLEL_MIN_LPS:
+            PolyhedralTermList._reduce_rows_parallel(a_all, b_all, keep_all, n)
+            return [i for i in range(n) if keep_all[i]], b_all[:n]
+        interior = None
+        if start == 0 and np.count_nonzero(keep_all[:n]) >= OUTPUT_SENSITIVE_REDUCTION_MIN_ROWS:
+            interior = _chebyshev_center(a_all[keep_all], b_all[keep_all])
+        if interior is None:
+            session = LpSession(a_all, b_all, keep_all, site="reduce_polytope")
+            for i in range(start, n):
+                if not keep_all[i]:
+                    continue
+                redundant, b_all[i] = PolyhedralTermList._is_row_redundant(session, _dense_row(a_all, i), i, b_all[i])
+                if redundant:
+                    logging.debug("Can remove")
+                    keep_all[i] = False
+                    session.set_active(i, False)
+        else:
+            PolyhedralTermList._reduce_rows_output_sensitive(a_all, b_all, keep_all, n, interior)
+            b_all[:n] = _relaxed_and_restored(b_all[:n])
+
+        return [i for i in range(n) if keep_all[i]], b_all[:n]
+
+    @staticmethod
+    def _is_row_redundant(session: LpSession, row: np.ndarray, i: int, bound: float) -> Tuple[bool, float]:
+        """
+        Tell whether a row of a polytope is implied by the other active rows of a session.
+
+        Args:
+            session: LP session whose active rows include row i.
+            row: The coefficients of row i.
+            i: The row to test.
+            bound: The bound of row i.
+
+        Raises:
+            ValueError: The rows are unsatisfiable.
+
+        Returns:
+            A tuple consisting of (i) whether the constraint of row i is implied
+                by the other rows and (ii) the bound of row i after the test.
+        """
+        session.set_objective(row * -1)
+        bound += 1
+        session.set_bound(i, bound)
+        # Linprog's status values
+        # 0 : Optimization proceeding nominally.
+        # 1 : Iteration limit reached.
+        # 2 : Problem appears to be infeasible.
+        # 3 : Problem appears to be unbounded.
+        # 4 : Numerical difficulties encountered.
+        res = session.solve()
+        bound -= 1
+        session.set_bound(i, bound)
+        if res["status"] == 2:
+            raise ValueError("The constraints are unsatisfiable")
+        return res["status"] == 3 or (res["status"] == 0 and -res["fun"] <= bound), bound  # noqa: WPS309
+
+    @staticmethod
+    def _reduce_rows_batched(a_all: np.ndarray, b_all: np.ndarray, keep_all: np.ndarray, n: int) -> int:
+        """
+        Remove redundant rows by solving the row tests of small polytopes in batches.
+
+        The sequential reduction tests each row against the rows kept so far.
+        Removing rows only makes the remaining ones less likely to be
+        redundant, so all the pending rows are tested at once against the
+        current rows. The first redundant row is removed exactly as in the
+        sequential reduction, and the rows after it are tested again. Rows
+        whose optimum ties with their bound are tested with an LP.
+
+        Args:
+            a_all: Matrix of the polytope followed by its context.
+            b_all: Vector of the polytope followed by its context. The bounds
+                of the tested rows are rounded by _relaxed_and_restored.
+            keep_all: Boolean mask of the rows not yet removed. It is updated.
+            n: The number of rows of the polytope.
+
+        Raises:
+            ValueError: The rows are unsatisfiable.
+
+        Returns:
+            The index of the first row that remains to be tested, which is
+                n unless the batched solver could not handle the rows.
+        """
+        # bounds of the rows once they have been tested
+        tested = _relaxed_and_restored(b_all)
+        start = 0
+        while start < n:
+            pending = np.flatnonzero(keep_all[start:n]) + start
+            if len(pending) == 0:
+                return n
+            rows = np.flatnonzero(keep_all)
+            b_batch = np.where(rows < pending[:, None], tested[rows], b_all[rows])
+            b_batch[rows == pending[:, None]] = b_all[pending] + 1
+            a_batch = np.broadcast_to(a_all[rows], (len(pending),) + (len(rows), a_all.shape[1]))
+            solution = solve_small_lps(a_batch, b_batch, -a_all[pending], site="reduce_polytope")
+            if solution is None:
+                return start
+            status, fun = solution
+            ties = (status == 0) & _near_ties(-fun, tested[pending])
+            for k, i in enumerate(pending.tolist()):
+                if status[k] == 2:
+                    raise ValueError("The constraints are unsatisfiable")
+                start = i + 1
+                if ties[k]:
+                    session = LpSession(a_all, b_all, keep_all, site="reduce_polytope")
+                    row = _dense_row(a_all, i)
+                    redundant, b_all[i] = PolyhedralTermList._is_row_redundant(session, row, i, b_all[i])
+                else:
+                    b_all[i] = tested[i]
+                    redundant = status[k] == 3 or -fun[k] <= tested[i]  # noqa: WPS309
+                if redundant:
+                    logging.debug("Can remove")
+                    keep_all[i] = False
+                    break
+        return n
+
+    @staticmethod
+    def _reduce_rows_parallel(a_all: matrix_t, b_all: np.ndarray, keep_all: np.ndarray, n: int) -> None:
+        """
+        Remove redundant rows by testing all the rows at once with the LP executor.
+
+        Each row is first tested against all the other rows, in parallel.
+        Rows which are not redundant in this test are not redundant against
+        any subset of the rows, so they are kept. The others are then tested
+        in order against the rows kept so far, as in the sequential reduction.
+
+        Args:
+            a_all: Matrix of the polytope followed by its context.
+            b_all: Vector of the polytope followed by its context. The bounds
+                of the tested rows are rounded by _relaxed_and_restored.
+            keep_all: Boolean mask of the rows not yet removed. It is updated.
+            n: The number of rows of the polytope.
+        """
+        # bounds of the rows once they have been tested
+        tested = _relaxed_and_restored(b_all)
+        pending = np.flatnonzero(keep_all[:n])
+        positions = np.arange(len(b_all))
+        tasks = []
+        for i in pending.tolist():
+            b_task = np.where(positions < i, tested, b_all)
+            b_task[i] = b_all[i] + 1
+            tasks.append((_dense_row(a_all, i) * -1, keep_all, b_task))
+        results = solve_lps(a_all, tasks, site="reduce_polytope")
+        status = np.array([res["status"] for res in results])
+        fun = np.array([res["fun"] if res["status"] == 0 else np.nan for res in results], dtype=float)
+        with np.errstate(invalid="ignore"):
+            kept = (status == 0) & (-fun > tested[pending]) & ~_near_ties(-fun, tested[pending])
+        session = LpSession(a_all, b_all, keep_all, site="reduce_polytope")
+        for k, i in enumerate(pending.tolist()):
+            if kept[k]:
+                b_all[i] = tested[i]
+                session.set_bound(i, tested[i])
+                continue
+            redundant, b_all[i] = PolyhedralTermList._is_row_redundant(session, _dense_row(a_all, i), i, b_all[i])
+            if redundant:
                 logging.debug("Can remove")
-                a_temp = np.delete(a_temp, i, 0)
-                b_temp = np.delete(b_temp, i)
-                n -= 1
-            else:
-                i += 1
-            if res["status"] == 2:
-                raise ValueError("The constraints are unsatisfiable")
+                keep_all[i] = False
+                session.set_active(i, False)
 
-        return a_temp, b_temp
+    @staticmethod
+    def _reduce_rows_output_sensitive(  # noqa: WPS231
+        a_all: matrix_t, b_all: np.ndarray, keep_all: np.ndarray, n: int, interior: np.ndarray
+    ) -> None:
+        """
+        Clarkson's redundancy removal.
+
+        Each row is tested against the rows already known to be irredundant.
+        If the test fails, the LP solution is a witness outside the polytope,
+        and the first constraint crossed by the ray from the interior point to
+        the witness is irredundant. LP sizes thus depend on the size of the
+        irredundant description instead of the number of rows.
+
+        Args:
+            a_all: Matrix of the polytope followed by the context.
+            b_all: Vector of the polytope followed by the context.
+            keep_all: Boolean mask of the rows still present. Redundant rows
+                among the first n are removed from the mask.
+            n: The number of rows of the polytope. The remaining rows are
+                context rows, which are never removed.
+            interior: A point in the interior of the polytope.
+
+        Raises:
+            ValueError: The constraints are unsatisfiable.
+        """
+        b_lp = np.copy(b_all)
+        irredundant = np.zeros(len(b_all), dtype=bool)
+        # LPs against the irredundant rows found so far and against all rows
+        session = LpSession(a_all, b_lp, irredundant, site="reduce_polytope")
+        full_session: Optional[LpSession] = None
+        for i in range(n):
+            row = _dense_row(a_all, i)
+            session.set_objective(row * -1)
+            while keep_all[i] and not irredundant[i]:
+                session.set_active(i, True)
+                session.set_bound(i, b_lp[i] + 1)
+                res = session.solve()
+                session.set_bound(i, b_lp[i])
+                session.set_active(i, False)
+                if res["status"] == 2:
+                    raise ValueError("The constraints are unsatisfiable")
+                if res["status"] == 3 or (res["status"] == 0 and -res["fun"] <= b_lp[i]):  # noqa: WPS309
+                    keep_all[i] = False
+                    break
+                hit = None
+                if res["status"] == 0:
+                    candidates = np.flatnonzero(keep_all & ~irredundant)
+                    hit = _first_hit_row(a_all, b_lp, interior, res["x"], candidates)
+                if hit is None:
+                    # degenerate witness: test the row against all remaining rows
+                    if full_session is None:
+                        full_session = LpSession(a_all, b_lp, keep_all, site="reduce_polytope")
+                    redundant, _ = PolyhedralTermList._is_row_redundant(full_session, row, i, b_lp[i])
+                    if redundant:
+                        keep_all[i] = False
+                        full_session.set_active(i, False)
+                    irredundant[i] = keep_all[i]
+                    session.set_active(i, keep_all[i])
+                    break
+                irredundant[hit] = True
+                session.set_active(hit, True)
+            if full_session is not None and not keep_all[i]:
+                full_session.set_active(i, False)
 
     @staticmethod
     def verify_polytope_containment(  # noqa: WPS231
-        a_l: Optional[np.ndarray] = None,
+        a_l: Optional[matrix_t] = None,
         b_l: Optional[np.ndarray] = None,
-        a_r: Optional[np.ndarray] = None,
+        a_r: Optional[matrix_t] = None,
         b_r: Optional[np.ndarray] = None,
     ) -> bool:
         """
         Tell whether a polytope is contained in another.
 
+        The matrices can be given either as dense arrays or in sparse format.
+        Rows of the RHS implied by a single row of the LHS are discharged
+        before any LP is solved. Then points sampled inside the LHS are
+        checked against the RHS, and the LPs are solved only if none of them
+        refutes the containment.
+
         Args:
             a_l:
                 Matrix of H-representation of polytope on LHS of inequality.
@@ -1074,16 +3060,34 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         Returns:
             True if left polytope is contained in right polytope. False otherwise.
         """
-        if not isinstance(a_l, np.ndarray):
+        if a_l is None:
             a_l = np.array([[]])
-        if not isinstance(a_r, np.ndarray):
+        if a_r is None:
             a_r = np.array([[]])
-        if not isinstance(b_l, np.ndarray):
+        if b_l is None:
             b_l = np.array([])
-        if not isinstance(b_r, np.ndarray):
+        if b_r is None:
             b_r = np.array([])
+        # RHS rows implied by a single LHS row hold without solving an LP
+        if a_l.shape[1] > 0 and a_r.shape[0] > 0 and a_l.shape[1] == a_r.shape[1] and issparse(a_l) == issparse(a_r):
+            dominated = _dominated_rows(a_r, b_r, a_l, b_l)
+            if np.all(dominated):
+                return True
+            a_r = a_r[~dominated]
+            b_r = b_r[~dominated]
         # If the LHS is empty, it is a refinement
-        if PolyhedralTermList.is_polytope_empty(a_l, b_l):
+        if a_l.shape[0] * a_l.shape[1] > 0 and a_r.shape[0] * a_r.shape[1] > 0:
+            ball = _chebyshev_ball(a_l, b_l)
+            if ball["status"] == 2:
+                return True
+            # a point of the LHS outside the RHS refutes the containment
+            if ball["status"] == 0:
+                points = _sample_polytope(a_l, b_l, ball["x"][: a_l.shape[1]], REFUTATION_SAMPLES)
+                if _refutes_containment(a_l, b_l, a_r, b_r, points):
+                    return False
+            elif PolyhedralTermList.is_polytope_empty(a_l, b_l):
+                return True
+        elif PolyhedralTermList.is_polytope_empty(a_l, b_l):
             return True
         # If the RHS is empty, but not the LHS, not a refinement
         if PolyhedralTermList.is_polytope_empty(a_r, b_r):
@@ -1096,10 +3100,46 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         assert n_l == len(b_l)
         assert n_r == len(b_r)
 
+        if not issparse(a_l) and not issparse(a_r) and small_lps_supported(n_l + 1, m_l):
+            a_batch = np.concatenate((np.broadcast_to(a_l, (n_r, n_l, m_l)), a_r[:, None, :]), axis=1)
+            b_batch = np.concatenate((np.broadcast_to(b_l, (n_r, n_l)), b_r[:, None] + 1), axis=1)
+            solution = solve_small_lps(a_batch, b_batch, -a_r, site="verify_polytope_containment")
+            if solution is not None:
+                status, fun = solution
+                tested = _relaxed_and_restored(b_r)
+                contained = (status == 0) & (-fun <= tested)
+                if not np.all(contained | (status == 2)):
+                    return False
+                if not np.any((status == 2) | _near_ties(-fun, tested)):
+                    return True
+
+        if executor_workers() > 1 and n_r >= PARALLEL_MIN_LPS:
+            a_all = _stack_rows(a_l, a_r)
+            b_all = np.concatenate((b_l, b_r + 1))
+            tasks = []
+            for i in range(n_r):
+                rows = np.arange(n_l + n_r) < n_l
+                rows[n_l + i] = True
+                tasks.append((_dense_row(a_r, i) * -1, rows, b_all))
+
+            def refutes(i: int, res: Any) -> bool:  # noqa: WPS430
+                if res["status"] == 2 or res["fun"] is None:
+                    return True
+                return not -res["fun"] <= b_all[n_l + i] - 1  # noqa: WPS309
+
+            results = solve_lps(a_all, tasks, site="verify_polytope_containment", stop=refutes)
+            return not any(refutes(i, res) for i, res in enumerate(results))
+
         is_refinement = True
+        # the rows of the RHS are activated one at a time
+        session = LpSession(
+            _stack_rows(a_l, a_r),
+            np.concatenate((b_l, b_r)),
+            np.arange(n_l + n_r) < n_l,
+            site="verify_polytope_containment",
+        )
         for i in range(n_r):
-            constraint = a_r[[i], :]
-            objective = constraint * -1
+            objective = _dense_row(a_r, i) * -1
             b_temp = b_r[i] + 1
             logging.debug("Optimization objective: \n%s", objective)
             logging.debug("a_l is \n%s", a_l)
@@ -1107,10 +3147,11 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
             logging.debug("b_l is \n%s", b_l)
             logging.debug("b_r is \n%s", b_r)
 
-            a_opt = np.concatenate((a_l, constraint), axis=0)
-            b_opt = np.concatenate((b_l, np.array([b_temp])))
-
-            res = linprog(c=objective, A_ub=a_opt, b_ub=b_opt, bounds=(None, None))  # ,options={'tol':0.000001})
+            session.set_objective(objective)
+            session.set_bound(n_l + i, b_temp)
+            session.set_active(n_l + i, True)
+            res = session.solve()
+            session.set_active(n_l + i, False)
             b_temp -= 1
             if res["status"] == 2:
                 is_refinement = False
@@ -1126,7 +3167,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         return is_refinement
 
     @staticmethod
-    def is_polytope_empty(a: np.ndarray, b: np.ndarray) -> bool:
+    def is_polytope_empty(a: matrix_t, b: np.ndarray) -> bool:
         """
         Say whether a polytope is empty.
 
@@ -1143,14 +3184,14 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
             ValueError: Numerical difficulties encountered.
         """
         logging.debug("Verifying polytope emptiness: a is %s a.shape is %s, b is %s", a, a.shape, b)
-        if len(a) == 0:
+        if a.shape[0] == 0:
             return False
         n, m = a.shape
         if n * m == 0:
             return False
         assert n == len(b)
         objective = np.zeros((1, m))
-        res = linprog(c=objective, A_ub=a, b_ub=b, bounds=(None, None))  # ,options={'tol':0.000001})
+        res = solve_lp(c=objective, a_ub=a, b_ub=b, site="is_polytope_empty")
         # Linprog's status values
         # 0 : Optimization proceeding nominally.
         # 1 : Iteration limit reached.
@@ -1176,23 +3217,22 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         if refine:
             transform_coeff = 1
         matrix_contains_others = False
+        # context terms including other forbidden variables cannot be used
+        invalid_rows = set()
+        for var in other_forbibben_vars:  # noqa: VNE002
+            invalid_rows.update(context._rows_with_var(var))
+        context_terms = context.terms
         # We add a row to the matrix in each iteration
         for i, i_var in enumerate(forbidden_vars):
             row_found = False
             logging.debug("Iterating for variable %s", i_var)
-            for context_term in list_diff(context.terms, matrix_row_terms):
-                logging.debug("Analyzing context term %s", context_term)
-                if context_term == term:
+            # 2. Verify Kaykobad pair: matrix diagonal terms, whose sign is checked in 1.
+            for row in context._rows_with_var(i_var, transform_coeff * term.get_sign(i_var)):
+                context_term = context_terms[row]
+                if row in invalid_rows or context_term in matrix_row_terms or context_term == term:
                     continue
+                logging.debug("Analyzing context term %s", context_term)
                 term_is_invalid = False
-                # make sure the term does not include other forbidden variables
-                for var in other_forbibben_vars:  # noqa: VNE002
-                    if context_term.get_coefficient(var) != 0:
-                        term_is_invalid = True
-                        logging.debug("Term contains other forbidden vars")
-                        break
-                if term_is_invalid:
-                    continue
                 # 1. Verify Kaykobad pair: sign of nonzero matrix terms
                 for var in forbidden_vars:  # noqa: VNE002
                     if context_term.get_coefficient(var) != 0:
@@ -1200,9 +3240,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
                             term_is_invalid = True
                             # logging.debug("Failed first matrix-vector verification")
                             break
-                # 2. Verify Kaykobad pair: matrix diagonal terms
-                if context_term.get_coefficient(i_var) == 0 or term_is_invalid:
-                    # logging.debug("Failed second matrix-vector verification")
+                if term_is_invalid:
                     continue
                 # 3. Verify Kaykobad pair: relation between matrix and vector
                 residuals = [float(0) for i in range(n)]
@@ -1261,7 +3299,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         sols = PolyhedralTerm.solve_for_variables(matrix_row_terms_tl, list(forbidden_vars))
         # logging.debug("Sols %s", sols)
 
-        result = term.copy()
+        result = term
         # logging.debug("Result is %s", result)
         for var in sols.keys():  # noqa: VNE002
             result = result.substitute_variable(var, sols[var])
@@ -1283,12 +3321,15 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         logging.debug("************ Tactic 2")
         logging.debug("Vars_to_elim %s \nTerm %s \nContext %s " % (vars_to_elim, term, context))
         conflict_vars = list_intersection(vars_to_elim, term.vars)
-        new_context_list = []
         # Extract from context the terms that only contain forbidden vars
-        for context_term in context.terms:
-            if not list_diff(context_term.vars, vars_to_elim):
-                if context_term != term:
-                    new_context_list.append(context_term.copy())
+        other_rows = set()
+        for var in list_diff(context.vars, vars_to_elim):  # noqa: VNE002
+            other_rows.update(context._rows_with_var(var))
+        new_context_list = [
+            context_term
+            for row, context_term in enumerate(context.terms)
+            if row not in other_rows and context_term != term
+        ]
         logging.debug("This is what we kept")
         for el in new_context_list:
             logging.debug(el)
@@ -1304,24 +3345,24 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         polarity = 1
         if refine:
             polarity = -1
-        objective = [polarity * term.get_coefficient(var) for var in variables]
+        objective = np.array([polarity * term.get_coefficient(var) for var in variables])
         logging.debug(new_context_mat)
         logging.debug(new_context_cons)
         logging.debug(objective)
-        res = linprog(c=objective, A_ub=new_context_mat, b_ub=new_context_cons, bounds=(None, None))
+        res = solve_lp(c=objective, a_ub=new_context_mat, b_ub=new_context_cons, site="tactic_2")
         if res["status"] in {2, 3}:
             # unbounded
             # return term.copy()
             raise ValueError("Tactic 2 did not succeed")
         replacement = polarity * res["fun"]
         # replace the irrelevant variables with new findings in term
-        result = term.copy()
+        result = term
         for var in vars_to_elim:  # noqa: VNE002
             result = result.remove_variable(var)
-        result.constant -= replacement
+        result = PolyhedralTerm._make(dict(result.variables), result.constant - replacement)  # noqa: WPS437
         # check vacuity
         if not result.vars:
-            return term.copy(), 1
+            return term, 1
         return result, 1
 
     @staticmethod
@@ -1332,10 +3373,10 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         logging.debug("Vars_to_elim %s \nTerm %s \nContext %s " % (vars_to_elim, term, context))
         conflict_vars = list_intersection(vars_to_elim, term.vars)
         conflict_coeff = {var: term.get_coefficient(var) for var in conflict_vars}
-        new_term = term.copy()
+        new_term = term
         for var in conflict_vars:  # noqa: VNE002 variable name 'var' should be clarified
             new_term = new_term.remove_variable(var)
-        new_term.variables[Var("_")] = 1
+        new_term = PolyhedralTerm._make({**new_term.variables, Var("_"): 1}, new_term.constant)  # noqa: WPS437
         # modify the context
         subst_term_vars = {Var("_"): 1.0 / conflict_coeff[conflict_vars[0]]}
         for var in conflict_vars:  # noqa: VNE002 variable name 'var' should be clarified
@@ -1343,7 +3384,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
                 subst_term_vars[var] = -conflict_coeff[var] / conflict_coeff[conflict_vars[0]]
         subst_term = PolyhedralTerm(variables=subst_term_vars, constant=0)
         new_context = PolyhedralTermList(
-            [el.copy().substitute_variable(conflict_vars[0], subst_term) for el in context.terms]
+            [el.substitute_variable(conflict_vars[0], subst_term) for el in context.terms]
         )
         # now we use tactic 1
         new_elims = list_diff(list_union(vars_to_elim, [Var("_")]), [conflict_vars[0]])
@@ -1376,16 +3417,16 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         if refine:
             polarity = 1
 
-        for context_term in context.terms:
+        # only terms in which the coefficient of the variable has the sign of polarity * coefficient in term
+        for row in context._rows_with_var(var_to_elim, polarity * term.get_sign(var_to_elim)):
+            context_term = context.terms[row]
             if list_intersection(context_term.vars, no_vars):
                 continue
-            coeff = context_term.get_coefficient(var_to_elim)
-            if coeff != 0 and polarity * coeff * term.get_coefficient(var_to_elim) > 0:
-                temp_conflict_vars = list_intersection(context_term.vars, vars_to_elim)
-                if len(temp_conflict_vars) == 1:
-                    goal_context.append(context_term.copy())
-                if len(temp_conflict_vars) == 2:
-                    useful_context.append(context_term.copy())
+            temp_conflict_vars = list_intersection(context_term.vars, vars_to_elim)
+            if len(temp_conflict_vars) == 1:
+                goal_context.append(context_term)
+            if len(temp_conflict_vars) == 2:
+                useful_context.append(context_term)
 
         if not useful_context and not goal_context:
             raise ValueError("Tactic 4 unsuccessful")
@@ -1397,8 +3438,9 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
 
         ############
         for useful_term in useful_context:
-            new_context = context.copy()
-            new_context.terms.remove(useful_term)
+            new_context_terms = list(context.terms)
+            new_context_terms.remove(useful_term)
+            new_context = PolyhedralTermList(new_context_terms)
             new_term = useful_term.isolate_variable(var_to_elim)
             new_no_vars = no_vars.copy()
             new_no_vars.append(var_to_elim)
@@ -1429,7 +3471,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         if refine:
             objective *= -1
 
-        res = linprog(c=objective, A_ub=B, b_ub=b, bounds=(None, None))
+        res = solve_lp(c=objective, a_ub=B, b_ub=b, site="get_tlp_context")
         # Linprog's status values
         # 0 : Optimization proceeding nominally.
         # 1 : Iteration limit reached.
@@ -1471,7 +3513,7 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
     def _tactic_trivial(  # noqa: WPS231
         term: PolyhedralTerm, context: PolyhedralTermList, vars_to_elim: list, refine: bool
     ) -> Tuple[Optional[PolyhedralTerm], int]:
-        return term.copy(), 1
+        return term, 1
 
     TACTICS = {  # noqa: WPS115
         1: _tactic_1.__func__,  # type: ignore
@@ -1506,6 +3548,9 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
         logging.debug("Context: %s", context)
 
         for tactic_num in tactics_order:  # noqa WPS327
+            if tactic_num in {EQUALITY_TACTIC, PROJECTION_TACTIC}:
+                # these tactics transform whole termlists
+                continue
             try:  # noqa: WPS229
                 ta = time.time()
                 result, count = PolyhedralTermList.TACTICS[tactic_num](term, context, vars_to_elim, refine)
@@ -1515,4 +3560,4 @@ class PolyhedralTermList(TermList):  # noqa: WPS338
             except ValueError:
                 continue
 
-        return term.copy(), -1, 0, 0
+        return term, -1, 0, 0
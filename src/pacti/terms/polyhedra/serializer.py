@@ -1,10 +1,11 @@
 """Transformations between polyhedral structures and strings."""
-from typing import Dict, List, Tuple, Union
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union
 
 import numpy as np
 import pyparsing as pp
 import sympy
 
+from pacti.iocontract.iocontract import Var
 from pacti.terms.polyhedra.polyhedra import PolyhedralTerm
 from pacti.terms.polyhedra.syntax.data import (
     PolyhedralSyntaxAbsoluteTerm,
@@ -162,43 +163,89 @@ def polyhedral_term_list_to_strings(  # noqa: WPS231 too much cognitive complexi
 
     ts = terms[1:]
     for tn in ts:
-        if _are_polyhedral_terms_opposite(tp, tn):
-            # tp has the form: LHS
-            # tn has the form: -(LHS)
-            if _are_numbers_approximatively_equal(tp.constant, -tn.constant):
-                # inverse of rule 4
-                # rewrite as 2 terms given input match: LHS = RHS
-                # pos: LHS <= RHS
-                # neg: -(LHS) <= -(RHS)
-                s = _lhs_str(tp) + " = " + _number_to_string(tp.constant)
-                ts.remove(tn)
-                return s, ts
-
-            else:
-                condition = _are_numbers_approximatively_equal(
-                    tp.constant, float(0)
-                ) and _are_numbers_approximatively_equal(tn.constant, float(0))
-                if condition:
-                    # inverse of rule 3
-                    # rewrite as 2 terms given input match: | LHS | = 0
-                    # pos: LHS <= 0
-                    # neg: -(LHS) <= 0
-                    s = "|" + _lhs_str(tp) + "| = 0"
-                    ts.remove(tn)
-                    return s, ts
-                elif _are_numbers_approximatively_equal(tp.constant, tn.constant):
-                    # inverse of rule 2
-                    # rewrite as 2 terms given input match: | LHS | <= RHS
-                    # pos: LHS <= RHS
-                    # neg: -(LHS) <= RHS
-                    s = "|" + _lhs_str(tp) + "| <= " + _number_to_string(tp.constant)
-                    ts.remove(tn)
-                    return s, ts
+        s = _opposite_terms_to_string(tp, tn)
+        if s is not None:
+            ts.remove(tn)
+            return s, ts
 
     s = _lhs_str(tp) + " <= " + _number_to_string(tp.constant)
     return s, ts
 
 
+def polyhedral_term_list_to_str_list(terms: List[PolyhedralTerm]) -> List[str]:
+    """
+    Convert a list of polyhedral terms into a list of strings.
+
+    Terms are paired as in polyhedral_term_list_to_strings. Only terms over the
+    same variables can be opposite, so each term is compared only with those.
+
+    Args:
+        terms: the list of terms.
+
+    Returns:
+        The string representation of the constraints.
+    """
+    same_vars: Dict[FrozenSet[Var], List[int]] = {}
+    for i, term in enumerate(terms):
+        same_vars.setdefault(frozenset(term.variables), []).append(i)
+    serialized = [False] * len(terms)
+    strings = []
+    for i, tp in enumerate(terms):
+        if serialized[i]:
+            continue
+        serialized[i] = True
+        s = None
+        for j in same_vars[frozenset(tp.variables)]:
+            if not serialized[j]:
+                s = _opposite_terms_to_string(tp, terms[j])
+                if s is not None:
+                    serialized[j] = True
+                    break
+        if s is None:
+            s = _lhs_str(tp) + " <= " + _number_to_string(tp.constant)
+        strings.append(s)
+    return strings
+
+
+def _opposite_terms_to_string(tp: PolyhedralTerm, tn: PolyhedralTerm) -> Optional[str]:
+    """
+    Convert a pair of terms into a single constraint, if possible.
+
+    Args:
+        tp: the first term.
+        tn: a later term.
+
+    Returns:
+        The string representation of both terms, or None if they are not opposite.
+    """
+    if not _are_polyhedral_terms_opposite(tp, tn):
+        return None
+    # tp has the form: LHS
+    # tn has the form: -(LHS)
+    if _are_numbers_approximatively_equal(tp.constant, -tn.constant):
+        # inverse of rule 4
+        # rewrite as 2 terms given input match: LHS = RHS
+        # pos: LHS <= RHS
+        # neg: -(LHS) <= -(RHS)
+        return _lhs_str(tp) + " = " + _number_to_string(tp.constant)
+    condition = _are_numbers_approximatively_equal(tp.constant, float(0)) and _are_numbers_approximatively_equal(
+        tn.constant, float(0)
+    )
+    if condition:
+        # inverse of rule 3
+        # rewrite as 2 terms given input match: | LHS | = 0
+        # pos: LHS <= 0
+        # neg: -(LHS) <= 0
+        return "|" + _lhs_str(tp) + "| = 0"
+    elif _are_numbers_approximatively_equal(tp.constant, tn.constant):
+        # inverse of rule 2
+        # rewrite as 2 terms given input match: | LHS | <= RHS
+        # pos: LHS <= RHS
+        # neg: -(LHS) <= RHS
+        return "|" + _lhs_str(tp) + "| <= " + _number_to_string(tp.constant)
+    return None
+
+
 def _eql_expression_to_polyhedral_terms(e: PolyhedralSyntaxEqlExpression) -> List[PolyhedralTerm]:
     """
     Convert equality expression.
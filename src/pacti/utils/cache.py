@@ -0,0 +1,206 @@
+"""Caches for the results of expensive queries."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import closing
+from typing import Any, Hashable, Optional, Tuple, TypedDict
+
+
+class CacheStatistics(TypedDict):
+    """Usage counters of a cache."""
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class LruCache:
+    """
+    A thread-safe mapping that evicts its least recently used entries.
+
+    Lookups count hits and misses. A disabled cache misses every lookup and
+    stores nothing.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Class constructor.
+
+        Args:
+            maxsize: The maximum number of entries.
+        """
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of entries."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Optional[Any]]:
+        """
+        Obtain the value stored for a key.
+
+        Args:
+            key: The key of the query.
+
+        Returns:
+            A tuple consisting of (i) whether the key was found and (ii) the
+                stored value, or None if it was not found.
+        """
+        with self._lock:
+            if self.enabled and key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def store(self, key: Hashable, value: Any) -> None:
+        """
+        Store the value of a key, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key: The key of the query.
+            value: The value to store.
+        """
+        with self._lock:
+            if not self.enabled:
+                return
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all the entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def statistics(self) -> CacheStatistics:
+        """
+        Usage counters of the cache.
+
+        Returns:
+            The hits and misses since the last clear, and the current and maximum number of entries.
+        """
+        with self._lock:
+            return CacheStatistics(hits=self.hits, misses=self.misses, size=len(self._entries), maxsize=self._maxsize)
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+class PersistentCache:
+    """
+    A key-value store in an SQLite file, shared by processes and runs.
+
+    Keys are strings, and values are stored as JSON, so reading the file
+    never runs code from it. The file records the version given when opening
+    it. Opening the file with a different version discards all the entries, so
+    results computed by another release of the library are never returned.
+
+    Each operation opens its own connection, so the cache can be used from
+    several threads and forked processes. SQLite serializes the writers.
+    """
+
+    def __init__(self, path: str, version: str, timeout: float = 30):
+        """
+        Class constructor.
+
+        Args:
+            path: The file of the cache. It is created if needed.
+            version: The version of the stored results.
+            timeout: Seconds to wait for a lock held by another process.
+        """
+        self.path = path
+        self.version = version
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        with closing(self._connect()) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            # the version is checked and updated while holding the write lock
+            connection.isolation_level = None
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+                connection.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB)")
+                row = connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+                if row is None or row[0] != version:
+                    connection.execute("DELETE FROM entries")
+                    connection.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (version,))
+            except sqlite3.Error:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def lookup(self, key: str) -> Tuple[bool, Optional[Any]]:
+        """
+        Obtain the value stored for a key.
+
+        Args:
+            key: The key of the query.
+
+        Returns:
+            A tuple consisting of (i) whether the key was found and (ii) the
+                stored value, or None if it was not found.
+        """
+        with closing(self._connect()) as connection:
+            row = connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            try:
+                value = json.loads(row[0])
+            except ValueError:
+                row = None
+        if row is None:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, value
+
+    def store(self, key: str, value: Any) -> None:
+        """
+        Store the value of a key.
+
+        Args:
+            key: The key of the query.
+            value: The value to store, made of the types that JSON represents.
+                Tuples are read back as lists.
+        """
+        text = json.dumps(value)
+        with closing(self._connect()) as connection:
+            with connection:
+                connection.execute("INSERT OR REPLACE INTO entries VALUES (?, ?)", (key, text))
+
+    def clear(self) -> None:
+        """Remove all the entries and reset the counters."""
+        with closing(self._connect()) as connection:
+            with connection:
+                connection.execute("DELETE FROM entries")
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with closing(self._connect()) as connection:
+            return int(connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0])
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=self.timeout)
@@ -1,6 +1,182 @@
 """Some list operations."""
 
-from typing import Any, List
+from typing import Any, Dict, Generic, Hashable, Iterable, Iterator, List, Optional, TypeVar, Union
+
+T = TypeVar("T", bound=Hashable)
+
+
+class OrderedSet(Generic[T]):
+    """
+    A set that remembers the order in which its elements were inserted.
+
+    The elements are stored as the keys of a dictionary, so membership tests
+    take constant time and iteration follows insertion order. The set algebra
+    operations return new sets whose elements are ordered as in the left
+    operand, followed by the new elements of the right operand.
+    """
+
+    def __init__(self, elements: Optional[Iterable[T]] = None):
+        """
+        Class constructor.
+
+        Args:
+            elements: The initial elements of the set.
+        """
+        self._elements: Dict[T, None] = dict.fromkeys(elements) if elements is not None else {}
+
+    def __contains__(self, element: object) -> bool:
+        return element in self._elements
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._elements)
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def __bool__(self) -> bool:
+        return bool(self._elements)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, OrderedSet):
+            return NotImplemented
+        return self._elements.keys() == other._elements.keys()  # noqa: WPS437
+
+    def __repr__(self) -> str:
+        return "OrderedSet({0})".format(list(self._elements))
+
+    def __or__(self, other: Iterable[T]) -> "OrderedSet[T]":
+        return self.union(other)
+
+    def __and__(self, other: Iterable[T]) -> "OrderedSet[T]":
+        return self.intersection(other)
+
+    def __sub__(self, other: Iterable[T]) -> "OrderedSet[T]":
+        return self.difference(other)
+
+    def add(self, element: T) -> None:
+        """
+        Insert an element at the end of the set if it is not already present.
+
+        Args:
+            element: The element to insert.
+        """
+        self._elements[element] = None
+
+    def update(self, elements: Iterable[T]) -> None:
+        """
+        Insert elements at the end of the set, skipping those already present.
+
+        Args:
+            elements: The elements to insert.
+        """
+        self._elements.update(dict.fromkeys(elements))
+
+    def discard(self, element: T) -> None:
+        """
+        Remove an element from the set if it is present.
+
+        Args:
+            element: The element to remove.
+        """
+        self._elements.pop(element, None)
+
+    def union(self, other: Iterable[T]) -> "OrderedSet[T]":
+        """
+        Compute the union with another collection.
+
+        Args:
+            other: The second argument.
+
+        Returns:
+            The elements of self followed by the new elements of the argument.
+        """
+        result = OrderedSet(self._elements)
+        result.update(other)
+        return result
+
+    def intersection(self, other: Iterable[T]) -> "OrderedSet[T]":
+        """
+        Compute the intersection with another collection.
+
+        Args:
+            other: The second argument.
+
+        Returns:
+            The elements of self which belong to the argument.
+        """
+        lookup = _as_lookup(other)
+        return OrderedSet(el for el in self._elements if el in lookup)
+
+    def difference(self, other: Iterable[T]) -> "OrderedSet[T]":
+        """
+        Compute the difference with another collection.
+
+        Args:
+            other: The second argument.
+
+        Returns:
+            The elements of self which do not belong to the argument.
+        """
+        lookup = _as_lookup(other)
+        return OrderedSet(el for el in self._elements if el not in lookup)
+
+    def to_list(self) -> List[T]:
+        """
+        The elements of the set in insertion order.
+
+        Returns:
+            A list with the elements of the set.
+        """
+        return list(self._elements)
+
+
+class ReadOnlyList(List[Any]):
+    """
+    A list that cannot be modified in place.
+
+    Reading, comparing, slicing and concatenating behave as for lists, and the
+    latter two return ordinary lists. The methods that modify the list in
+    place raise a TypeError.
+    """
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("This list cannot be modified in place")
+
+    append = _read_only
+    extend = _read_only
+    insert = _read_only
+    remove = _read_only
+    pop = _read_only
+    clear = _read_only
+    sort = _read_only
+    reverse = _read_only
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __iadd__ = _read_only  # type: ignore
+    __imul__ = _read_only  # type: ignore
+
+    def __reduce__(self) -> Any:
+        # the default reduction of list subclasses appends the elements after creating the list
+        return type(self), (list(self),)
+
+    def copy(self) -> List[Any]:
+        """
+        Copy the list.
+
+        Returns:
+            An ordinary list with the same elements.
+        """
+        return list(self)
+
+
+def _as_lookup(elements: Iterable[Any]) -> Union[OrderedSet[Any], Dict[Any, None], List[Any]]:
+    # constant-time membership tests for hashable elements; list scans otherwise
+    if isinstance(elements, OrderedSet):
+        return elements
+    try:
+        return dict.fromkeys(elements)
+    except TypeError:
+        return list(elements)
 
 
 def list_intersection(list1: List[Any], list2: List[Any]) -> List[Any]:
@@ -14,7 +190,8 @@ def list_intersection(list1: List[Any], list2: List[Any]) -> List[Any]:
     Returns:
         A list containing the intersection of both lists.
     """
-    return [el for el in list1 if el in list2]
+    lookup = _as_lookup(list2)
+    return [el for el in list1 if el in lookup]
 
 
 def list_diff(list1: List[Any], list2: List[Any]) -> List[Any]:
@@ -28,7 +205,8 @@ def list_diff(list1: List[Any], list2: List[Any]) -> List[Any]:
     Returns:
         A list containing the elements of the first argument which do not belong to the second.
     """
-    return [el for el in list1 if (el not in list2)]
+    lookup = _as_lookup(list2)
+    return [el for el in list1 if (el not in lookup)]
 
 
 def list_union(list1: List[Any], list2: List[Any]) -> List[Any]:
@@ -42,7 +220,8 @@ def list_union(list1: List[Any], list2: List[Any]) -> List[Any]:
     Returns:
         A list containing the elements that at least one list contains.
     """
-    return list1 + [el for el in list2 if (el not in list1)]
+    lookup = _as_lookup(list1)
+    return list1 + [el for el in list2 if (el not in lookup)]
 
 
 def lists_equal(list1: List[Any], list2: List[Any]) -> bool:
@@ -0,0 +1,825 @@
+"""
+Linear programming backends.
+
+All the linear programs solved by pacti go through this module. The solver
+is selected by name among the registered backends:
+
+- `highs` (default): scipy's linprog, letting HiGHS choose the algorithm.
+- `highs-ds`: scipy's linprog with the HiGHS dual simplex solver.
+- `highs-ipm`: scipy's linprog with the HiGHS interior-point solver.
+- `highspy`: direct calls to the HiGHS bindings. Available when the optional
+  highspy package is installed (`pip install pacti[highs]`). Sequences of
+  linear programs over a common set of constraints warm-start from the
+  previous basis.
+
+Only the `highspy` backend supports the incremental solves of LpSession.
+scipy's linprog takes no starting basis, so with the scipy backends each
+solve of a session is a fresh linear program over the active rows.
+
+Every call records its running time and status under the backend and the
+call site that issued it.
+
+Independent linear programs can be fanned out to a pool of threads or
+processes with set_executor. Results are always returned in submission order.
+"""
+
+from __future__ import annotations
+
+import importlib
+import itertools
+import os
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from math import ceil, comb
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypedDict, Union
+
+import numpy as np
+from scipy.optimize import OptimizeResult, linprog
+from scipy.sparse import csr_matrix, spmatrix
+
+# the optional module is typed as Any, so that type checking does not depend on whether it is installed
+highspy: Any
+try:
+    highspy = importlib.import_module("highspy")
+except ImportError:
+    highspy = None
+
+matrix_t = Union[np.ndarray, spmatrix]
+bounds_t = Union[Tuple[Optional[float], Optional[float]], Sequence[Tuple[Optional[float], Optional[float]]]]
+# objective, mask of the active rows and constraint vector of a linear program over a shared matrix
+lp_task_t = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+DEFAULT_BACKEND = "highs"
+
+# Name under which the batched solves of small linear programs are recorded
+SMALL_LP_ENGINE = "vertex-enumeration"
+# Largest linear programs solved by vertex enumeration
+SMALL_LP_MAX_VARIABLES = 10  # noqa: WPS432
+SMALL_LP_MAX_BASES = 1000  # noqa: WPS432
+# Relative tolerances of the primal and dual feasibility tests of the vertex enumeration
+SMALL_LP_FEASIBILITY_TOLERANCE = 1e-9  # noqa: WPS432
+SMALL_LP_SINGULARITY_TOLERANCE = 1e-10  # noqa: WPS432
+
+EXECUTOR_KINDS = ("serial", "thread", "process")
+# Number of chunks submitted per worker, which bounds the work done after a cancellation
+EXECUTOR_CHUNKS_PER_WORKER = 4
+
+
+class LpCallStatistics(TypedDict):
+    """Statistics of the linear programs issued by one call site to one backend."""
+
+    calls: int
+    time: float
+    statuses: Dict[int, int]
+
+
+class LpBackend(ABC):
+    """
+    Interface of the linear programming solvers.
+
+    Backends minimize $c^T x$ subject to $A x \\le b$ and return results with
+    the fields and status codes of scipy's linprog:
+
+    - 0: Optimization proceeding nominally.
+    - 1: Iteration limit reached.
+    - 2: Problem appears to be infeasible.
+    - 3: Problem appears to be unbounded.
+    - 4: Numerical difficulties encountered.
+    """
+
+    def __init__(self, name: str):
+        """
+        Class constructor.
+
+        Args:
+            name: The name under which the backend is registered.
+        """
+        self.name = name
+
+    @property
+    def available(self) -> bool:
+        """Whether the dependencies of the backend are installed."""
+        return True
+
+    @property
+    def incremental(self) -> bool:
+        """Whether the backend implements load_model and the other methods of incremental solves."""
+        return False
+
+    @abstractmethod
+    def solve(self, c: np.ndarray, a_ub: matrix_t, b_ub: np.ndarray, bounds: bounds_t) -> OptimizeResult:
+        """
+        Solve a linear program.
+
+        Args:
+            c: The cost of each variable.
+            a_ub: Matrix of the constraints.
+            b_ub: Vector of the constraints.
+            bounds: Bounds of the variables, either one pair for all the
+                variables or one pair per variable. None means unbounded.
+        """
+
+    def load_model(self, c: np.ndarray, a_ub: matrix_t, b_ub: np.ndarray, active: np.ndarray) -> Any:
+        """
+        Load constraints to be shared by a sequence of linear programs.
+
+        Args:
+            c: The initial cost of each variable.
+            a_ub: Matrix of the constraints.
+            b_ub: Vector of the constraints.
+            active: Boolean mask of the rows that are initially active.
+
+        Raises:
+            NotImplementedError: The backend does not support incremental solves.
+        """
+        raise NotImplementedError
+
+    def set_model_objective(self, model: Any, c: np.ndarray) -> None:
+        """
+        Replace the objective of a model.
+
+        Args:
+            model: A model returned by load_model.
+            c: The cost of each variable.
+
+        Raises:
+            NotImplementedError: The backend does not support incremental solves.
+        """
+        raise NotImplementedError
+
+    def set_model_bound(self, model: Any, row: int, bound: Optional[float]) -> None:
+        """
+        Change the bound of a row of a model.
+
+        Args:
+            model: A model returned by load_model.
+            row: The index of the row.
+            bound: The new bound of the row, or None to deactivate it.
+
+        Raises:
+            NotImplementedError: The backend does not support incremental solves.
+        """
+        raise NotImplementedError
+
+    def solve_model(self, model: Any, b_ub: np.ndarray, active: np.ndarray) -> OptimizeResult:
+        """
+        Solve a model.
+
+        Args:
+            model: A model returned by load_model.
+            b_ub: Vector of the constraints of the model.
+            active: Boolean mask of the active rows of the model.
+
+        Raises:
+            NotImplementedError: The backend does not support incremental solves.
+        """
+        raise NotImplementedError
+
+
+class ScipyBackend(LpBackend):
+    """Backend calling scipy's linprog."""
+
+    def __init__(self, name: str, method: str):
+        """
+        Class constructor.
+
+        Args:
+            name: The name under which the backend is registered.
+            method: The algorithm passed to linprog.
+        """
+        super().__init__(name)
+        self.method = method
+
+    def solve(self, c: np.ndarray, a_ub: matrix_t, b_ub: np.ndarray, bounds: bounds_t) -> OptimizeResult:
+        """
+        Solve a linear program.
+
+        Args:
+            c: The cost of each variable.
+            a_ub: Matrix of the constraints.
+            b_ub: Vector of the constraints.
+            bounds: Bounds of the variables, either one pair for all the
+                variables or one pair per variable. None means unbounded.
+
+        Returns:
+            The result of linprog.
+        """
+        return linprog(c=c, A_ub=a_ub, b_ub=b_ub, bounds=bounds, method=self.method)
+
+
+class HighspyBackend(LpBackend):
+    """Backend calling the HiGHS bindings directly."""
+
+    @property
+    def available(self) -> bool:
+        """Whether highspy is installed."""
+        return highspy is not None
+
+    @property
+    def incremental(self) -> bool:
+        """Whether the backend implements load_model and the other methods of incremental solves."""
+        return True
+
+    def solve(self, c: np.ndarray, a_ub: matrix_t, b_ub: np.ndarray, bounds: bounds_t) -> OptimizeResult:
+        """
+        Solve a linear program.
+
+        Args:
+            c: The cost of each variable.
+            a_ub: Matrix of the constraints.
+            b_ub: Vector of the constraints.
+            bounds: Bounds of the variables, either one pair for all the
+                variables or one pair per variable. None means unbounded.
+
+        Returns:
+            The result of the optimization.
+        """
+        b_ub = np.asarray(b_ub, dtype=float).reshape(-1)
+        active = np.ones(len(b_ub), dtype=bool)
+        model = self._build_model(np.asarray(c, dtype=float), a_ub, b_ub, active, bounds)
+        return self.solve_model(model, b_ub, active)
+
+    def load_model(self, c: np.ndarray, a_ub: matrix_t, b_ub: np.ndarray, active: np.ndarray) -> Any:
+        """
+        Load constraints to be shared by a sequence of linear programs.
+
+        Args:
+            c: The initial cost of each variable.
+            a_ub: Matrix of the constraints.
+            b_ub: Vector of the constraints.
+            active: Boolean mask of the rows that are initially active.
+
+        Returns:
+            A HiGHS model with free variables.
+        """
+        return self._build_model(c, a_ub, b_ub, active, (None, None))
+
+    def set_model_objective(self, model: Any, c: np.ndarray) -> None:
+        """
+        Replace the objective of a model.
+
+        Args:
+            model: A model returned by load_model.
+            c: The cost of each variable.
+        """
+        model.changeColsCost(len(c), np.arange(len(c), dtype=np.int32), c)
+
+    def set_model_bound(self, model: Any, row: int, bound: Optional[float]) -> None:
+        """
+        Change the bound of a row of a model.
+
+        Args:
+            model: A model returned by load_model.
+            row: The index of the row.
+            bound: The new bound of the row, or None to deactivate it.
+        """
+        model.changeRowBounds(row, -highspy.kHighsInf, highspy.kHighsInf if bound is None else bound)
+
+    def solve_model(self, model: Any, b_ub: np.ndarray, active: np.ndarray) -> OptimizeResult:
+        """
+        Solve a model.
+
+        Args:
+            model: A model returned by load_model.
+            b_ub: Vector of the constraints of the model.
+            active: Boolean mask of the active rows of the model.
+
+        Returns:
+            The result of the optimization.
+        """
+        model.run()
+        statuses = {
+            highspy.HighsModelStatus.kOptimal: 0,
+            highspy.HighsModelStatus.kIterationLimit: 1,
+            highspy.HighsModelStatus.kTimeLimit: 1,
+            highspy.HighsModelStatus.kInfeasible: 2,
+            highspy.HighsModelStatus.kUnbounded: 3,
+        }
+        status = statuses.get(model.getModelStatus(), 4)
+        if status != 0:
+            return OptimizeResult(status=status, fun=None, x=None, slack=None, success=False)
+        solution = model.getSolution()
+        row_values = np.array(solution.row_value)
+        return OptimizeResult(
+            status=status,
+            fun=model.getInfo().objective_function_value,
+            x=np.array(solution.col_value),
+            slack=b_ub[active] - row_values[active],
+            success=True,
+        )
+
+    @staticmethod
+    def _build_model(c: np.ndarray, a_ub: matrix_t, b_ub: np.ndarray, active: np.ndarray, bounds: bounds_t) -> Any:
+        n, m = a_ub.shape
+        inf = highspy.kHighsInf
+        # missing bounds are None, which becomes NaN in a float array
+        pairs = np.broadcast_to(np.array(bounds, dtype=float).reshape(-1, 2), (m, 2))
+        lp = highspy.HighsLp()
+        lp.num_col_ = m
+        lp.num_row_ = n
+        lp.col_cost_ = c
+        lp.col_lower_ = np.where(np.isnan(pairs[:, 0]), -inf, pairs[:, 0])
+        lp.col_upper_ = np.where(np.isnan(pairs[:, 1]), inf, pairs[:, 1])
+        lp.row_lower_ = np.full(n, -inf)
+        lp.row_upper_ = np.where(active, b_ub, inf)
+        a_csr = csr_matrix(a_ub, dtype=float)
+        lp.a_matrix_.format_ = highspy.MatrixFormat.kRowwise
+        lp.a_matrix_.num_col_ = m
+        lp.a_matrix_.num_row_ = n
+        lp.a_matrix_.start_ = a_csr.indptr
+        lp.a_matrix_.index_ = a_csr.indices
+        lp.a_matrix_.value_ = a_csr.data
+        model = highspy.Highs()
+        model.setOptionValue("output_flag", False)
+        model.passModel(lp)
+        return model
+
+
+_backends: Dict[str, LpBackend] = {}
+_current_backend = DEFAULT_BACKEND
+_statistics: Dict[str, Dict[str, LpCallStatistics]] = {}
+_statistics_lock = threading.Lock()
+_executor_kind = "serial"
+_executor_workers = 1
+_executor: Optional[Executor] = None
+
+
+def register_backend(backend: LpBackend) -> None:
+    """
+    Make a backend selectable by its name.
+
+    Args:
+        backend: The backend to register. It replaces any backend registered
+            under the same name.
+    """
+    _backends[backend.name] = backend
+
+
+def available_backends() -> List[str]:
+    """
+    The names of the backends whose dependencies are installed.
+
+    Returns:
+        The names of the available backends.
+    """
+    return [name for name, backend in _backends.items() if backend.available]
+
+
+def get_backend(name: Optional[str] = None) -> LpBackend:
+    """
+    Obtain a registered backend.
+
+    Args:
+        name: The name of the backend. The selected backend by default.
+
+    Returns:
+        The backend.
+
+    Raises:
+        ValueError: The backend is not registered or not available.
+    """
+    name = _current_backend if name is None else name
+    if name not in _backends:
+        raise ValueError("Unknown LP backend {0}. Registered backends: {1}".format(name, list(_backends)))
+    backend = _backends[name]
+    if not backend.available:
+        raise ValueError("LP backend {0} is not available".format(name))
+    return backend
+
+
+def set_backend(name: str) -> None:
+    """
+    Select the backend that solves the linear programs of pacti.
+
+    Args:
+        name: The name of a registered backend.
+    """
+    global _current_backend  # noqa: WPS420
+    get_backend(name)
+    _current_backend = name  # noqa: WPS442
+
+
+@contextmanager
+def use_backend(name: str) -> Iterator[LpBackend]:
+    """
+    Select a backend for the duration of a block.
+
+    Args:
+        name: The name of a registered backend.
+
+    Yields:
+        The selected backend.
+    """
+    previous = _current_backend
+    set_backend(name)
+    try:
+        yield get_backend()
+    finally:
+        set_backend(previous)
+
+
+def solver_settings() -> Tuple[Any, ...]:
+    """
+    The settings that the results of the linear programs depend on.
+
+    Returns:
+        The name of the selected backend followed by the limits and
+            tolerances of the batched solves of small linear programs.
+    """
+    return (
+        _current_backend,
+        SMALL_LP_MAX_VARIABLES,
+        SMALL_LP_MAX_BASES,
+        SMALL_LP_FEASIBILITY_TOLERANCE,
+        SMALL_LP_SINGULARITY_TOLERANCE,
+    )
+
+
+def get_statistics() -> Dict[str, Dict[str, LpCallStatistics]]:
+    """
+    Statistics of the linear programs solved since the last reset.
+
+    Returns:
+        For each backend and each call site, the number of calls, their total
+            running time in seconds, and the number of calls per status.
+    """
+    with _statistics_lock:
+        return {
+            backend: {
+                site: LpCallStatistics(calls=stats["calls"], time=stats["time"], statuses=dict(stats["statuses"]))
+                for site, stats in sites.items()
+            }
+            for backend, sites in _statistics.items()
+        }
+
+
+def reset_statistics() -> None:
+    """Discard the statistics of the linear programs solved so far."""
+    with _statistics_lock:
+        _statistics.clear()
+
+
+def _record(backend: str, site: str, status: int, elapsed: float) -> None:
+    with _statistics_lock:
+        sites = _statistics.setdefault(backend, {})
+        stats = sites.setdefault(site, LpCallStatistics(calls=0, time=0, statuses={}))
+        stats["calls"] += 1
+        stats["time"] += elapsed
+        stats["statuses"][status] = stats["statuses"].get(status, 0) + 1
+
+
+def solve_lp(
+    c: np.ndarray, a_ub: matrix_t, b_ub: np.ndarray, bounds: bounds_t = (None, None), site: str = ""
+) -> OptimizeResult:
+    """
+    Minimize $c^T x$ subject to $A x \\le b$ with the selected backend.
+
+    Args:
+        c: The cost of each variable.
+        a_ub: Matrix of the constraints.
+        b_ub: Vector of the constraints.
+        bounds: Bounds of the variables, either one pair for all the
+            variables or one pair per variable. None means unbounded.
+        site: The call site under which the call is recorded.
+
+    Returns:
+        The result of the optimization, with the same fields and status
+            codes as the results of scipy's linprog.
+    """
+    backend = get_backend()
+    start = time.perf_counter()
+    res = backend.solve(c, a_ub, b_ub, bounds)
+    _record(backend.name, site, res["status"], time.perf_counter() - start)
+    return res
+
+
+def small_lps_supported(n_rows: int, n_vars: int) -> bool:
+    """
+    Tell whether linear programs of a given size can be solved by solve_small_lps.
+
+    Args:
+        n_rows: The number of constraints.
+        n_vars: The number of variables.
+
+    Returns:
+        True if the number of candidate vertices is small enough for a batched solve.
+    """
+    return 0 < n_vars <= min(n_rows, SMALL_LP_MAX_VARIABLES) and comb(n_rows, n_vars) <= SMALL_LP_MAX_BASES
+
+
+def solve_small_lps(
+    a: np.ndarray, b: np.ndarray, c: np.ndarray, site: str = ""
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Solve a batch of small linear programs by vertex enumeration.
+
+    Problem $k$ minimizes $c_k^T x$ subject to $A_k x \\le b_k$ over free
+    variables. The routine solves the square subsystems of all the problems
+    at once. A basis whose solution satisfies all the constraints is a
+    vertex of the polyhedron, and a basis whose dual multipliers are
+    nonnegative certifies that the objective is bounded. When every problem
+    has a nonsingular basis, a problem is infeasible if it has no vertex,
+    unbounded if it has no dual feasible basis, and its optimum is the best
+    value attained at a vertex otherwise.
+
+    Args:
+        a: Matrices of the constraints, with shape (problems, rows, variables).
+        b: Vectors of the constraints, with shape (problems, rows).
+        c: Costs of the variables, with shape (problems, variables).
+        site: The call site under which the solve is recorded.
+
+    Returns:
+        The status of each problem, with the codes of scipy's linprog, and
+            the optimal value of each problem, which is NaN when the status
+            is not 0. None is returned when the problems are too large or some
+            problem has no nonsingular basis; those problems are left to an LP
+            backend.
+    """
+    k, n, m = a.shape
+    if k == 0 or not small_lps_supported(n, m):
+        return None
+    start = time.perf_counter()
+    subsets = np.array(list(itertools.combinations(range(n), m)))
+    a_bases = a[:, subsets]
+    b_bases = b[:, subsets]
+    singular_values = np.linalg.svd(a_bases, compute_uv=False)
+    nonsingular = singular_values[..., -1] > SMALL_LP_SINGULARITY_TOLERANCE * singular_values[..., 0]
+    if not np.all(np.any(nonsingular, axis=1)):
+        return None
+    # singular bases are replaced by the identity to solve all the systems at once
+    a_bases = np.where(nonsingular[..., None, None], a_bases, np.eye(m))
+    x = np.linalg.solve(a_bases, b_bases[..., None])[..., 0]
+    y = np.linalg.solve(np.swapaxes(a_bases, -1, -2), -c[:, None, :, None])[..., 0]
+    slack = b[:, None, :] - np.einsum("knd,ksd->ksn", a, x)
+    # the tolerances scale with the norms of the rows, so that a vertex
+    # slightly outside a row with a large norm is not taken as feasible
+    row_norms = np.linalg.norm(a, axis=2)
+    x_norms = np.linalg.norm(x, axis=2)
+    primal_tolerance = SMALL_LP_FEASIBILITY_TOLERANCE * (
+        np.abs(b[:, None, :]) + row_norms[:, None, :] * x_norms[..., None]
+    )
+    primal = nonsingular & np.all(slack >= -primal_tolerance, axis=2)
+    # a multiplier times the norm of its row is commensurate with the cost
+    dual_tolerance = SMALL_LP_FEASIBILITY_TOLERANCE * np.linalg.norm(c, axis=1)[:, None, None]
+    dual = nonsingular & np.all(y * row_norms[:, subsets] >= -dual_tolerance, axis=2)
+    values = np.where(primal, np.einsum("kd,ksd->ks", c, x), np.inf)
+    feasible = np.any(primal, axis=1)
+    bounded = np.any(dual, axis=1)
+    status = np.where(feasible, np.where(bounded, 0, 3), 2)
+    fun = np.where(status == 0, np.min(values, axis=1), np.nan)
+    elapsed = (time.perf_counter() - start) / k
+    for problem_status in status:
+        _record(SMALL_LP_ENGINE, site, int(problem_status), elapsed)
+    return status, fun
+
+
+def set_executor(kind: str = "serial", max_workers: Optional[int] = None) -> None:
+    """
+    Select how batches of independent linear programs are solved.
+
+    Args:
+        kind: "serial" to solve them in the calling thread, "thread" to use
+            a pool of threads, or "process" to use a pool of processes.
+        max_workers: The size of the pool. By default, the number of CPUs.
+
+    Raises:
+        ValueError: Unknown kind of executor.
+    """
+    global _executor_kind, _executor_workers, _executor  # noqa: WPS420
+    if kind not in EXECUTOR_KINDS:
+        raise ValueError("Unknown executor {0}. Supported executors: {1}".format(kind, EXECUTOR_KINDS))
+    if _executor is not None:
+        # cancel_futures is only accepted from Python 3.9
+        if sys.version_info >= (3, 9):
+            _executor.shutdown(cancel_futures=True)
+        else:
+            _executor.shutdown()
+    _executor_kind = kind  # noqa: WPS442
+    _executor_workers = 1 if kind == "serial" else max_workers or os.cpu_count() or 1  # noqa: WPS442
+    _executor = None  # noqa: WPS442
+
+
+def executor_workers() -> int:
+    """
+    The number of workers solving batches of linear programs.
+
+    Returns:
+        One for the serial executor, the size of the pool otherwise.
+    """
+    return _executor_workers
+
+
+def _get_executor() -> Optional[Executor]:
+    global _executor  # noqa: WPS420
+    if _executor_kind == "serial":
+        return None
+    if _executor is None:
+        pool = ThreadPoolExecutor if _executor_kind == "thread" else ProcessPoolExecutor
+        _executor = pool(max_workers=_executor_workers)  # noqa: WPS442
+    return _executor
+
+
+def _solve_chunk(backend_name: str, a: matrix_t, tasks: List[lp_task_t]) -> List[Tuple[OptimizeResult, float]]:
+    backend = get_backend(backend_name)
+    results = []
+    for c, rows, b in tasks:
+        start = time.perf_counter()
+        res = backend.solve(c, a[rows], b[rows], (None, None))
+        results.append((res, time.perf_counter() - start))
+    return results
+
+
+def solve_lps(
+    a: matrix_t,
+    tasks: Sequence[lp_task_t],
+    site: str = "",
+    stop: Optional[Callable[[int, OptimizeResult], bool]] = None,
+) -> List[OptimizeResult]:
+    """
+    Solve independent linear programs over a shared constraint matrix with the selected executor.
+
+    Task $k$ is a triple $(c, r, b)$ and minimizes $c^T x$ subject to
+    $A_r x \\le b_r$, where $r$ is a boolean mask of the rows of $A$.
+
+    Args:
+        a: The shared matrix of the constraints.
+        tasks: The linear programs to solve.
+        site: The call site under which the solves are recorded.
+        stop: Predicate on the index and the result of a task. Once a result
+            satisfies it, the tasks after it are cancelled.
+
+    Returns:
+        The results of the tasks in submission order. When stop is given,
+            the results end at the first task, in submission order, whose
+            result satisfies it. The returned results do not depend on the
+            executor.
+    """
+    backend = get_backend()
+    pool = _get_executor()
+    results: List[Tuple[OptimizeResult, float]] = []
+    if pool is None:
+        for task in tasks:
+            results.extend(_solve_chunk(backend.name, a, [task]))
+            if stop is not None and stop(len(results) - 1, results[-1][0]):
+                break
+    else:
+        size = max(1, ceil(len(tasks) / (executor_workers() * EXECUTOR_CHUNKS_PER_WORKER)))
+        chunks = [list(tasks[i : i + size]) for i in range(0, len(tasks), size)]
+        results = _solve_chunks(pool, backend.name, a, chunks, size, stop)
+    for res, elapsed in results:
+        _record(backend.name, site, res["status"], elapsed)
+    return [res for res, _ in results]
+
+
+def _any_stop(
+    stop: Callable[[int, OptimizeResult], bool], start: int, results: List[Tuple[OptimizeResult, float]]
+) -> bool:
+    return any(stop(start + j, res) for j, (res, _) in enumerate(results))
+
+
+def _solve_chunks(
+    pool: Executor,
+    backend_name: str,
+    a: matrix_t,
+    chunks: List[List[lp_task_t]],
+    size: int,
+    stop: Optional[Callable[[int, OptimizeResult], bool]],
+) -> List[Tuple[OptimizeResult, float]]:
+    futures: Dict[Future[List[Tuple[OptimizeResult, float]]], int] = {}
+    for k, chunk in enumerate(chunks):
+        futures[pool.submit(_solve_chunk, backend_name, a, chunk)] = k
+    chunk_results: Dict[int, List[Tuple[OptimizeResult, float]]] = {}
+    # index of the first chunk known to contain a stopping result
+    first_stop = len(chunks)
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, return_when="FIRST_COMPLETED")
+        for future in done:
+            k = futures[future]
+            if future.cancelled() or k > first_stop:
+                continue
+            chunk_results[k] = future.result()
+            if stop is not None and k < first_stop and _any_stop(stop, k * size, chunk_results[k]):
+                first_stop = k
+                for other in pending:
+                    if futures[other] > k:
+                        other.cancel()
+        pending = {future for future in pending if futures[future] < first_stop}
+    results: List[Tuple[OptimizeResult, float]] = []
+    for k in range(min(first_stop + 1, len(chunks))):
+        for res, elapsed in chunk_results[k]:
+            results.append((res, elapsed))
+            if stop is not None and stop(len(results) - 1, res):
+                return results
+    return results
+
+
+register_backend(ScipyBackend("highs", "highs"))
+register_backend(ScipyBackend("highs-ds", "highs-ds"))
+register_backend(ScipyBackend("highs-ipm", "highs-ipm"))
+register_backend(HighspyBackend("highspy"))
+
+
+class LpSession:
+    """
+    A sequence of linear programs over a common set of constraints.
+
+    The session holds constraints $Ax \\le b$ over free variables. Between two
+    solves, the objective can be replaced, the bound of any row can be
+    changed, and rows can be deactivated or activated again. Each solve
+    minimizes the objective subject to the active rows.
+
+    When the selected backend supports incremental solves, the constraint
+    matrix is loaded once, and each solve starts from the basis found by the
+    previous one. Otherwise, and in particular with the scipy backends, each
+    solve passes the active rows to the backend and starts from scratch.
+    """
+
+    def __init__(self, a: matrix_t, b: np.ndarray, active: Optional[np.ndarray] = None, site: str = ""):
+        """
+        Class constructor.
+
+        Args:
+            a: Matrix of the constraints.
+            b: Vector of the constraints.
+            active: Boolean mask of the rows that are initially active. All
+                rows are active by default.
+            site: The call site under which the solves are recorded.
+        """
+        n, m = a.shape
+        self._a = a
+        self._b = np.array(b, dtype=float)
+        self._active = np.ones(n, dtype=bool) if active is None else np.array(active, dtype=bool)
+        self._c = np.zeros(m)
+        self._site = site
+        self._backend = get_backend()
+        # matrix of the active rows, for backends without incremental solves
+        self._a_active: Optional[matrix_t] = None
+        self._model: Any = None
+        if n > 0 and m > 0 and self._backend.incremental:
+            self._model = self._backend.load_model(self._c, a, self._b, self._active)
+
+    @property
+    def incremental(self) -> bool:
+        """Whether the solves reuse a model loaded in the backend."""
+        return self._model is not None
+
+    def set_objective(self, objective: np.ndarray) -> None:
+        """
+        Replace the objective to be minimized.
+
+        Args:
+            objective: The cost of each variable.
+        """
+        self._c = np.array(objective, dtype=float)
+        if self._model is not None:
+            self._backend.set_model_objective(self._model, self._c)
+
+    def set_bound(self, row: int, bound: float) -> None:
+        """
+        Change the bound of a row.
+
+        Args:
+            row: The index of the row.
+            bound: The new value of the row in the constraint vector.
+        """
+        self._b[row] = bound
+        if self._model is not None and self._active[row]:
+            self._backend.set_model_bound(self._model, row, bound)
+
+    def set_active(self, row: int, active: bool) -> None:
+        """
+        Activate or deactivate a row.
+
+        Args:
+            row: The index of the row.
+            active: Whether the row should constrain the following solves.
+        """
+        if self._active[row] == active:
+            return
+        self._active[row] = active
+        self._a_active = None
+        if self._model is not None:
+            self._backend.set_model_bound(self._model, row, self._b[row] if active else None)
+
+    def solve(self) -> OptimizeResult:
+        """
+        Minimize the objective subject to the active rows.
+
+        Returns:
+            The result of the optimization, with the same fields and status
+                codes as the results of scipy's linprog.
+        """
+        start = time.perf_counter()
+        if self._model is None:
+            if self._a_active is None:
+                self._a_active = self._a if np.all(self._active) else self._a[self._active]
+            res = self._backend.solve(self._c, self._a_active, self._b[self._active], (None, None))
+        else:
+            res = self._backend.solve_model(self._model, self._b, self._active)
+        _record(self._backend.name, self._site, res["status"], time.perf_counter() - start)
+        return res
@@ -9,13 +9,13 @@ import matplotlib.pyplot as plt  # noqa: WPS301 Found dotted raw import
 import numpy as np
 from matplotlib.figure import Figure as MplFigure
 from matplotlib.patches import Polygon as MplPatchPolygon
-from scipy.optimize import linprog
 from scipy.spatial import HalfspaceIntersection, QhullError
 
 from pacti.contracts import PolyhedralIoContract
 from pacti.iocontract import Var
 from pacti.terms.polyhedra.polyhedra import PolyhedralTerm, PolyhedralTermList
 from pacti.utils.lists import list_diff, list_union
+from pacti.utils.lp import solve_lp
 
 numeric = Union[int, float]
 
@@ -194,7 +194,7 @@ def _get_feasible_point(a_mat: np.ndarray, b: np.ndarray, interior: bool = True)
     obj = np.array([0, 0, 1])
     if interior:
         obj = np.array([0, 0, -1])
-    res = linprog(c=obj, A_ub=a_mat_new, b_ub=b_new, bounds=(None, None))
+    res = solve_lp(c=obj, a_ub=a_mat_new, b_ub=b_new, site="plots")
     if res["status"] == 2:
         raise ValueError("Constraints are unfeasible")
     return np.array(res["x"])[0:-1]  # noqa: WPS349 Found redundant subscript slice
@@ -212,13 +212,13 @@ def _get_bounding_vertices(a_mat: np.ndarray, b: np.ndarray) -> Tuple[tuple, tup
         x, y = zip(*hs.intersections)
     except QhullError:
         # polygon has no interior. optimize four directions
-        res = linprog(c=[0, 1], A_ub=a_mat, b_ub=b, bounds=(None, None))
+        res = solve_lp(c=np.array([0, 1]), a_ub=a_mat, b_ub=b, site="plots")
         p1 = np.array(res["x"])
-        res = linprog(c=[0, -1], A_ub=a_mat, b_ub=b, bounds=(None, None))
+        res = solve_lp(c=np.array([0, -1]), a_ub=a_mat, b_ub=b, site="plots")
         p2 = np.array(res["x"])
-        res = linprog(c=[1, 0], A_ub=a_mat, b_ub=b, bounds=(None, None))
+        res = solve_lp(c=np.array([1, 0]), a_ub=a_mat, b_ub=b, site="plots")
         p3 = np.array(res["x"])
-        res = linprog(c=[-1, 0], A_ub=a_mat, b_ub=b, bounds=(None, None))
+        res = solve_lp(c=np.array([-1, 0]), a_ub=a_mat, b_ub=b, site="plots")
         p4 = np.array(res["x"])
         x = (p1[0], p2[0], p3[0], p4[0])
         y = (p1[1], p2[1], p3[1], p4[1])
@@ -278,7 +278,7 @@ def constraints_to_vertices(
     plot_tl = _substitute_in_termlist(term_list, var_values)
     assert not list_diff(plot_tl.vars, [x_var, y_var]), "termlist vars: %s" % (plot_tl.vars)
     # Now we plot the polygon
-    res_tuple = PolyhedralTermList.termlist_to_polytope(plot_tl, PolyhedralTermList([]))
+    res_tuple = PolyhedralTermList.termlist_to_polytope(plot_tl, PolyhedralTermList([]), sparse=False)
     variables = res_tuple[0]
     a_mat = res_tuple[1]
     b = res_tuple[2]
@@ -1,5 +1,9 @@
+import copy
+import pickle
 from typing import List
 
+import pytest
+
 import pacti.iocontract as iocontract
 from pacti.contracts import PolyhedralIoContract
 
@@ -32,3 +36,41 @@ def test_validate_iocontract() -> None:
 
 def test_contract_equality() -> None:
     pass
+
+
+def test_var_interning() -> None:
+    x = iocontract.Var("x")
+    assert iocontract.Var("x") is x
+    assert iocontract.Var("y") != x
+    assert iocontract.Var("y").id != x.id
+    assert pickle.loads(pickle.dumps(x)) is x
+    assert copy.deepcopy([x])[0] is x
+    [c_1] = [PolyhedralIoContract.from_dict(c) for c in create_contracts(num=1)]
+    assert c_1.inputvars[0] is iocontract.Var("i0")
+
+
+def test_lazy_simplification() -> None:
+    contract = PolyhedralIoContract.from_strings(
+        input_vars=["i"], output_vars=["o"], assumptions=["i <= 1"], guarantees=["o - i <= 0", "o <= 2"]
+    )
+    assert not contract.simplified
+    assert contract.g.to_str_list() == ["-i + o <= 0"]
+    assert contract.simplified
+    assert contract.copy().simplified
+    renamed = contract.rename_variable(iocontract.Var("o"), iocontract.Var("o_new"))
+    assert renamed.simplified
+    assert renamed.g.to_str_list() == ["-i + o_new <= 0"]
+    # contracts created without simplification stay unsimplified when copied
+    unsimplified = PolyhedralIoContract.from_strings(
+        input_vars=["i"], output_vars=["o"], assumptions=["i <= 1"], guarantees=["o - i <= 0", "o <= 2"], simplify=False
+    )
+    assert len(unsimplified.copy().g.terms) == 2
+    # guarantees unsatisfiable under the assumptions are still rejected at construction
+    with pytest.raises(ValueError, match="unsatisfiable in context"):
+        PolyhedralIoContract.from_strings(
+            input_vars=["i"], output_vars=["o"], assumptions=["-i <= -1"], guarantees=["o - i <= 0", "-o <= 0", "i <= 0"]
+        )
+    # unless they are not to be simplified
+    _ = PolyhedralIoContract.from_strings(
+        input_vars=["i"], output_vars=["o"], assumptions=["-i <= -1"], guarantees=["i <= 0"], simplify=False
+    )
@@ -2,7 +2,9 @@ import glob
 
 import pytest
 
-from pacti.contracts import PolyhedralIoContract
+from pacti.contracts import PolyhedralIoContract, polyhedral_iocontract
+from pacti.iocontract import Var
+from pacti.terms.polyhedra import PolyhedralTerm, PolyhedralTermList, polyhedra
 from pacti.utils import read_contracts_from_file
 from pacti.utils.errors import IncompatibleArgsError
 
@@ -13,6 +15,19 @@ import logging
 FORMAT = "%(asctime)s:%(levelname)s:%(name)s:%(message)s"
 logging.basicConfig(filename="../pacti.log", filemode="w", level=logging.DEBUG, format=FORMAT)
 
+
+def relaxed(terms: PolyhedralTermList) -> PolyhedralTermList:
+    # loosen every bound by a relative rounding margin
+    return PolyhedralTermList(
+        [PolyhedralTerm(dict(term.variables), term.constant + 1e-9 * (1 + abs(term.constant))) for term in terms.terms]
+    )
+
+
+def refines_up_to_rounding(left: PolyhedralIoContract, right: PolyhedralIoContract) -> bool:
+    same_vars = left.inputvars == right.inputvars and left.outputvars == right.outputvars
+    return same_vars and left.a.refines(relaxed(right.a)) and (left.a | left.g).refines(relaxed(right.g))
+
+
 composition_test_instances = glob.glob(TEST_DATA_DIR + "**/*composition_success*.json", recursive=True)
 
 
@@ -39,6 +54,17 @@ def test_composition_success(test_instance: str) -> None:
     assert expected == obtained
 
 
+@pytest.mark.parametrize("test_instance", composition_test_instances)
+def test_composition_with_equality_tactic(test_instance: str) -> None:
+    c, _ = read_contracts_from_file(test_instance)
+    # substituting equalities first gives the same composition, up to the rounding of its coefficients
+    expected, _ = c[0].compose_tactics(c[1])
+    tactics_order = [polyhedra.EQUALITY_TACTIC] + polyhedral_iocontract.TACTICS_ORDER
+    obtained, _ = c[0].compose_tactics(c[1], tactics_order=tactics_order)
+    assert refines_up_to_rounding(obtained, expected)
+    assert refines_up_to_rounding(expected, obtained)
+
+
 composition_failure_test_instances = glob.glob(TEST_DATA_DIR + "**/*composition_failure*.json", recursive=True)
 
 
@@ -165,6 +191,40 @@ def test_refinement_1(test_instance: str) -> None:
     assert c[1] == c_r
 
 
+def test_bulk_renaming() -> None:
+    contract = PolyhedralIoContract.from_strings(
+        input_vars=["a", "b"],
+        output_vars=["c"],
+        assumptions=["a <= 1", "b <= 2"],
+        guarantees=["c - a <= 0", "c - 2 b <= 3"],
+    )
+    contract.simplify()
+    mappings = [("a", "x"), ("x", "y"), ("c", "z")]
+    expected = contract
+    for source, target in mappings:
+        expected = expected.rename_variable(Var(source), Var(target))
+    assert contract.rename_variables(mappings) == expected
+    swapped = contract.rename_variables([("a", "b"), ("b", "a")], simultaneous=True)
+    assert swapped.simplified
+    assert swapped.a.to_str_list() == ["b <= 1", "a <= 2"]
+    assert swapped.g.to_str_list() == ["-b + c <= 0", "-2 a + c <= 3"]
+    with pytest.raises(IncompatibleArgsError):
+        contract.rename_variables([("a", "c")])
+
+
+def test_contract_fingerprint() -> None:
+    def make(assumptions: list) -> PolyhedralIoContract:
+        return PolyhedralIoContract.from_strings(
+            input_vars=["a", "b"], output_vars=["c"], assumptions=assumptions, guarantees=["c - a <= 0"]
+        )
+
+    contract = make(["a <= 1", "b <= 2"])
+    assert make(["b <= 2", "a <= 1"]).fingerprint == contract.fingerprint
+    assert make(["a <= 1", "b <= 3"]).fingerprint != contract.fingerprint
+    assert len({contract, contract.copy(), make(["a <= 1", "b <= 3"])}) == 2
+    assert {contract: 1}[make(["a <= 1", "b <= 2"])] == 1
+
+
 if __name__ == "__main__":
     file = r"tests/test_data/polyhedral_contracts/test_composition_success_Sal_lin_dCas9.json"
     test_composition_success(file)
@@ -1,11 +1,21 @@
 import logging
-from typing import List
-
+import pickle  # noqa: S403
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from pathlib import Path
+from typing import Iterator, List
+
+import numpy as np
 import pytest
+from scipy.sparse import issparse
 
 from pacti.iocontract import Var
-from pacti.terms.polyhedra import PolyhedralTermList
+from pacti.terms.polyhedra import PolyhedralTerm, PolyhedralTermList, polyhedra
 from pacti.terms.polyhedra.serializer import polyhedral_termlist_from_string
+from pacti.utils import lp
+from pacti.utils.cache import PersistentCache
+from pacti.utils.lists import OrderedSet
 
 FORMAT = "%(asctime)s:%(levelname)s:%(name)s:%(message)s"
 logging.basicConfig(filename="../pacti.log", filemode="w", level=logging.DEBUG, format=FORMAT)
@@ -15,6 +25,20 @@ def to_pts(str_rep_list: List[str]) -> PolyhedralTermList:
     return PolyhedralTermList([item for el in str_rep_list for item in polyhedral_termlist_from_string(el)])
 
 
+@pytest.fixture(autouse=True)
+def fresh_caches() -> Iterator[None]:
+    # every test starts with empty caches and leaves their settings as it found them
+    caches = [polyhedra.query_cache, polyhedra.transform_cache]
+    settings = [(cache.enabled, cache.maxsize) for cache in caches]
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache, (enabled, maxsize) in zip(caches, settings):
+        cache.enabled = enabled
+        cache.maxsize = maxsize
+        cache.clear()
+
+
 def test_polyhedral_var_elim_by_refinement_1() -> None:
     x = Var("x")
     # the context cannot simplify or transform the reference
@@ -148,5 +172,587 @@ def test_relaxing2() -> None:
     assert expected == transformed2
 
 
+def test_matrix_backed_termlist() -> None:
+    x = Var("x")
+    y = Var("y")
+    # columns are given in an order different from the order of appearance
+    a = np.array([[0, 1], [-2, 0], [0, 1]])
+    b = np.array([1, 4, 2])
+    constraints = PolyhedralTermList.polytope_to_termlist(a, b, [y, x])
+    assert constraints.vars == [x, y]
+    assert not constraints.lacks_constraints()
+    simplified = constraints.simplify()
+    assert simplified.vars == [x, y]
+    assert simplified.terms == to_pts(["x <= 1", "-2*y <= 4"]).terms
+    assert constraints.terms == to_pts(["x <= 1", "-2*y <= 4", "x <= 2"]).terms
+
+
+def test_sparse_termlist() -> None:
+    n = 80
+    variables = [Var(f"x{i}") for i in range(n)]
+    # chain x0 <= x1 <= ... <= x79 <= 1, plus redundant bounds xi <= 2
+    chain = [f"x{i} - x{i + 1} <= 0" for i in range(n - 1)]
+    bounds = [f"x{i} <= 2" for i in range(n)]
+    constraints = to_pts(chain + [f"x{n - 1} <= 1"] + bounds)
+    var_list, a, _, _, _ = PolyhedralTermList.termlist_to_polytope(constraints, PolyhedralTermList())
+    assert var_list == variables
+    assert issparse(a)
+    simplified = constraints.simplify()
+    assert simplified.terms == to_pts(chain + [f"x{n - 1} <= 1"]).terms
+    _, a, _, _, _ = PolyhedralTermList.termlist_to_polytope(constraints, PolyhedralTermList(), sparse=False)
+    assert not issparse(a)
+    assert constraints.refines(to_pts(["x0 <= 1"]))
+    assert not to_pts(["x0 <= 1"]).refines(constraints)
+
+
+def test_termlist_set_operations() -> None:
+    x = Var("x")
+    left = to_pts(["x <= 1", "y <= 2", "x + y <= 3"])
+    # same constraint with an integer coefficient and a negative zero constant
+    right = PolyhedralTermList([PolyhedralTerm({x: 1}, 1), PolyhedralTerm({x: 2}, -0.0)])
+    assert hash(left.terms[0]) == hash(right.terms[0])
+    assert (left | right).terms == left.terms + [right.terms[1]]
+    assert (left & right).terms == [left.terms[0]]
+    assert (left - right).terms == left.terms[1:]
+    assert OrderedSet([x, Var("y"), x]).to_list() == [x, Var("y")]
+
+
+def test_termlist_vars_cache() -> None:
+    x = Var("x")
+    y = Var("y")
+    z = Var("z")
+    constraints = to_pts(["x <= 1", "x + y <= 3"])
+    assert constraints.vars == [x, y]
+    assert constraints.var_index == {x: 0, y: 1}
+    constraints.add_terms(to_pts(["z - x <= 0"]).terms)
+    assert constraints.vars == [x, y, z]
+    assert constraints.var_index == {x: 0, y: 1, z: 2}
+    constraints.remove_term(constraints.terms[1])
+    assert constraints.vars == [x, z]
+    constraints.replace_term(0, to_pts(["y <= 1"]).terms[0])
+    assert constraints.vars == [y, z, x]
+    constraints.terms = to_pts(["x <= 1"]).terms
+    assert constraints.vars == [x]
+    # the terms can only be changed through the termlist, which keeps its caches up to date
+    with pytest.raises(TypeError):
+        constraints.terms.append(to_pts(["y <= 2"]).terms[0])
+    with pytest.raises(TypeError):
+        constraints.terms[0] = to_pts(["y <= 2"]).terms[0]
+    assert constraints.terms == to_pts(["x <= 1"]).terms
+    assert constraints.vars == [x]
+    assert pickle.loads(pickle.dumps(constraints)).terms == constraints.terms
+
+
+def test_terms_are_shared() -> None:
+    x = Var("x")
+    left = to_pts(["x <= 1", "y <= 2"])
+    right = to_pts(["x + y <= 3"])
+    term = left.terms[0]
+    with pytest.raises(TypeError):
+        term.variables[x] = 2  # type: ignore
+    assert term.copy() is term
+    assert (left | right).terms[0] is term
+    assert (left | right).terms[2] is right.terms[0]
+    assert left.copy().terms[1] is left.terms[1]
+    # modifying the result of an operator or a copy leaves the operands alone
+    union = left | right
+    union.replace_term(0, right.terms[0])
+    union.add_terms(to_pts(["z <= 4"]).terms)
+    assert left == to_pts(["x <= 1", "y <= 2"])
+    assert right == to_pts(["x + y <= 3"])
+    assert left._rows_with_var(x) == [0]
+    copied = left.copy()
+    copied.replace_term(0, to_pts(["y <= 5"]).terms[0])
+    assert copied._rows_with_var(x) == []
+    assert left._rows_with_var(x) == [0]
+    assert left._rows_with_var(Var("y")) == [1]
+    renamed = term.rename_variable(x, Var("z"))
+    assert renamed.vars == [Var("z")]
+    assert term.vars == [x]
+
+
+def reduction_calls() -> int:
+    stats = lp.get_statistics().values()
+    return sum(sites["reduce_polytope"]["calls"] for sites in stats if "reduce_polytope" in sites)
+
+
+def test_parallel_rows_removed_without_lp() -> None:
+    lp.reset_statistics()
+    a = np.array([[2, 0], [1, 0], [1, 0], [0, 1], [0, 3]])
+    b = np.array([4, 2, 3, 1, 6])
+    a_red, b_red = PolyhedralTermList.reduce_polytope(a, b)
+    assert np.array_equal(a_red, np.array([[1, 0], [0, 1]]))
+    assert np.array_equal(b_red, np.array([2, 1]))
+    assert reduction_calls() == 2
+    # a context row parallel to a row of the polytope makes it redundant
+    lp.reset_statistics()
+    a_red, b_red = PolyhedralTermList.reduce_polytope(a, b, np.array([[0, 2]]), np.array([1]))
+    assert np.array_equal(a_red, np.array([[1, 0]]))
+    assert reduction_calls() == 1
+
+
+def test_output_sensitive_reduction(monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = np.random.default_rng(0)
+    a = rng.normal(size=(200, 3))
+    b = rng.uniform(0.5, 2, size=200)
+    a_help = rng.normal(size=(20, 3))
+    b_help = np.ones(20)
+    monkeypatch.setattr(polyhedra, "OUTPUT_SENSITIVE_REDUCTION_MIN_ROWS", len(b) + 1)
+    a_seq, b_seq = PolyhedralTermList.reduce_polytope(a, b, a_help, b_help)
+    monkeypatch.setattr(polyhedra, "OUTPUT_SENSITIVE_REDUCTION_MIN_ROWS", 1)
+    a_out, b_out = PolyhedralTermList.reduce_polytope(a, b, a_help, b_help)
+    assert 0 < len(b_out) < len(b)
+    assert np.array_equal(a_seq, a_out)
+    assert np.array_equal(b_seq, b_out)
+
+
+def test_lp_session() -> None:
+    # the scipy backends solve each program of a session from scratch
+    session = lp.LpSession(np.array([[1.0], [-1.0]]), np.array([1.0, 0]))
+    assert not session.incremental
+    session.set_objective(np.array([1.0]))
+    assert session.solve()["fun"] == pytest.approx(0)
+    session.set_bound(1, 1)
+    assert session.solve()["fun"] == pytest.approx(-1)
+    session.set_active(1, False)
+    assert session.solve()["status"] == 3
+
+
+def test_lp_session_with_highs() -> None:
+    pytest.importorskip("highspy")
+    rng = np.random.default_rng(1)
+    a = rng.normal(size=(40, 3))
+    b = rng.uniform(0.5, 2, size=40)
+    a_help = rng.normal(size=(5, 3))
+    b_help = np.ones(5)
+    expected = PolyhedralTermList.reduce_polytope(a, b, a_help, b_help)
+    x, y = Var("x"), Var("y")
+    terms = to_pts(["x <= 2", "-x <= 0", "x - y <= 1"])
+    assert terms.get_variable_bounds(x) == (0, 2)
+    assert terms.get_variable_bounds(y) == (-1, None)
+    with lp.use_backend("highspy"):
+        obtained = PolyhedralTermList.reduce_polytope(a, b, a_help, b_help)
+        low, high = terms.get_variable_bounds(x)
+        assert terms.get_variable_bounds(y)[1] is None
+        # deactivated rows no longer constrain the solves
+        session = lp.LpSession(np.array([[1.0], [-1.0]]), np.array([1.0, 0]))
+        assert session.incremental
+        session.set_objective(np.array([1.0]))
+        assert session.solve()["fun"] == pytest.approx(0)
+        session.set_active(1, False)
+        assert session.solve()["status"] == 3
+    assert np.array_equal(obtained[0], expected[0])
+    assert np.allclose(obtained[1], expected[1])
+    assert low == pytest.approx(0)
+    assert high == pytest.approx(2)
+
+
+def test_small_lps(monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = np.random.default_rng(2)
+    a = rng.normal(size=(30, 6, 3))
+    b = rng.uniform(0.1, 1, size=(30, 6))
+    c = rng.normal(size=(30, 3))
+    status, fun = lp.solve_small_lps(a, b, c)
+    for k in range(30):
+        res = lp.linprog(c=c[k], A_ub=a[k], b_ub=b[k], bounds=(None, None))
+        assert status[k] == res["status"]
+        if res["status"] == 0:
+            assert fun[k] == pytest.approx(res["fun"])
+    # no vertex: the rows do not span the space of the variables
+    assert lp.solve_small_lps(np.array([[[1.0, 0], [-1, 0]]]), np.ones((1, 2)), np.ones((1, 2))) is None
+    assert lp.solve_small_lps(np.zeros((1, 40, 5)), np.ones((1, 40)), np.ones((1, 5))) is None
+    # a batched reduction keeps the rows of the sequential one
+    a = rng.normal(size=(12, 3))
+    b = rng.uniform(0.5, 2, size=12)
+    with monkeypatch.context() as patch:
+        patch.setattr(polyhedra, "small_lps_supported", lambda *args: False)
+        expected = PolyhedralTermList.reduce_polytope(a, b)
+    lp.reset_statistics()
+    obtained = PolyhedralTermList.reduce_polytope(a, b)
+    assert lp.SMALL_LP_ENGINE in lp.get_statistics()
+    assert np.array_equal(obtained[0], expected[0])
+    assert np.array_equal(obtained[1], expected[1])
+    # both round the bounds as the row-by-row test does
+    kept, _ = PolyhedralTermList._reduce_polytope_rows(a, b)
+    assert np.array_equal(obtained[1], polyhedra._relaxed_and_restored(b[kept]))
+    assert polyhedra._relaxed_and_restored(np.array([0.1]))[0] == 0.10000000000000009
+
+
+def test_small_lps_badly_scaled_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    # a vertex 1e-10 outside a box row, on a row with a norm of 1e10
+    box = np.array([[1.0, 0], [0, 1], [-1, 0], [0, -1]])
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        w = rng.uniform(0.1, 1, size=(1, 2)) * 1e10
+        b_box = np.concatenate(([0, 0], rng.uniform(0.5, 2, size=2)))
+        assert PolyhedralTermList.verify_polytope_containment(box, b_box, w, np.zeros(1))
+        a = np.concatenate((w, box))
+        b = np.concatenate(([0], b_box))
+        with monkeypatch.context() as patch:
+            patch.setattr(polyhedra, "small_lps_supported", lambda *args: False)
+            expected = PolyhedralTermList.reduce_polytope(a, b)
+        obtained = PolyhedralTermList.reduce_polytope(a, b)
+        assert np.array_equal(obtained[0], expected[0])
+
+
+def test_containment_without_lp() -> None:
+    lp.reset_statistics()
+    left = to_pts(["x + y <= 1", "2 x - y <= 0", "-x <= 4"])
+    # every row on the right is implied by a parallel row on the left
+    assert left.refines(to_pts(["2 x + 2 y <= 3", "2 x - y <= 0"]))
+    assert left.refines(to_pts(["0 x <= 1"]))
+    assert lp.get_statistics() == {}
+    # only the row without a parallel row on the left needs an LP
+    assert left.refines(to_pts(["x + y <= 1", "y <= 5"]))
+    assert not left.refines(to_pts(["x + y <= 1", "y <= -5"]))
+    calls = [stats["calls"] for sites in lp.get_statistics().values() for stats in sites.values()]
+    assert sum(calls) > 0
+
+
+def test_containment_refuted_by_sampling() -> None:
+    left = to_pts(["x <= 1", "-x <= 1", "y <= 1", "-y <= 1"])
+    lp.reset_statistics()
+    assert not left.refines(to_pts(["x + y <= 1.5"]))
+    sites = {site for stats in lp.get_statistics().values() for site in stats}
+    assert sites == {"chebyshev_center"}
+    assert left.refines(to_pts(["x + y <= 2"]))
+    # an empty LHS is contained in anything
+    assert to_pts(["x <= -1", "-x <= 0"]).refines(to_pts(["y <= -3"]))
+    # a point just outside the LHS does not refute a row with a large norm
+    a_l = np.array([[1.0, 0], [0, 1], [-1, 0], [0, -1]])
+    b_l = np.array([0, 0, 1, 1.0])
+    points = np.array([[5e-10, -0.5], [-0.5, -0.5]]).T
+    assert not polyhedra._refutes_containment(a_l, b_l, np.array([[1e10, 0]]), np.zeros(1), points)
+    assert polyhedra._refutes_containment(a_l, b_l, np.array([[1.0, 1]]), np.array([-1.5]), points)
+
+
+def test_query_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = polyhedra.query_cache
+    left = to_pts(["x <= 1", "-x <= 1", "y - x <= 0"])
+    right = to_pts(["y <= 1"])
+    assert left.refines(right)
+    # the key does not depend on the order of the terms
+    assert to_pts(["y - x <= 0", "x <= 1", "-x <= 1"]).refines(right)
+    assert cache.statistics()["hits"] == 1
+    simplified = left.simplify(right)
+    assert left.simplify(right) == simplified
+    assert left.simplify(right) is not simplified
+    assert left.optimize({Var("y"): 1}) == left.optimize({Var("y"): 1}) == 1
+    assert cache.statistics() == {"hits": 4, "misses": 3, "size": 3, "maxsize": polyhedra.QUERY_CACHE_SIZE}
+    cache.enabled = False
+    assert left.refines(right)
+    assert cache.statistics()["hits"] == 4
+    cache.enabled = True
+    cache.maxsize = 1
+    assert cache.statistics()["size"] == 1
+    assert left.is_empty() is False
+    assert left.is_empty() is False
+    assert cache.statistics()["hits"] == 5
+    cache.clear()
+    assert cache.statistics()["size"] == 0
+    # results computed with another backend or tunables are not reused
+    assert left.optimize({Var("y"): 1}) == 1
+    with lp.use_backend("highs-ds"):
+        assert left.optimize({Var("y"): 1}) == 1
+    assert cache.statistics()["misses"] == 2
+    monkeypatch.setattr(polyhedra, "REFUTATION_SAMPLES", 4)
+    assert left.optimize({Var("y"): 1}) == 1
+    assert cache.statistics()["misses"] == 3
+    # eliminations found in the cache report the tactics that computed them
+    hits = cache.statistics()["hits"]
+    _, computed = left.elim_vars_by_refining(right, [Var("y")])
+    _, tactics_data = left.elim_vars_by_refining(right, [Var("y")])
+    assert cache.statistics()["hits"] == hits + 1
+    assert tactics_data == computed
+
+
+def test_solve_for_variables(monkeypatch: pytest.MonkeyPatch) -> None:
+    x, y, z = Var("x"), Var("y"), Var("z")
+    context = to_pts(["x + y - z <= 3", "x - y <= 1.5"])
+    numeric = PolyhedralTerm.solve_for_variables(context, [x, y])
+    assert numeric == PolyhedralTerm._solve_symbolically(context, [x, y])
+    assert numeric[x] == PolyhedralTerm({z: 0.5}, -2.25)
+    # solutions whose residual is not exactly zero are left to sympy
+    assert PolyhedralTerm._solve_numerically(context, [x, y]) == numeric
+    inexact = to_pts(["0.1x + 0.2y <= 0.3", "0.3x - 0.7y <= 0.1"])
+    assert PolyhedralTerm._solve_numerically(inexact, [x, y]) is None
+    # the LU solve returns y = 2.2e-18 instead of 0
+    assert PolyhedralTerm._solve_numerically(to_pts(["0.3x - 0.5y <= 0.3", "-0.9x - y <= -0.9"]), [x, y]) is None
+    # so are the systems with more significant digits than sympy keeps
+    van = Var("van")
+    long_coefficient = PolyhedralTermList([PolyhedralTerm({van: 0.07190400000000001, x: -1}, -0.069504)])
+    assert PolyhedralTerm._solve_numerically(long_coefficient, [x]) is None
+    assert PolyhedralTerm.solve_for_variables(long_coefficient, [x])[x] == PolyhedralTerm({van: 0.071904}, -0.069504)
+    # singular systems are left to sympy
+    singular = to_pts(["x + y <= 3", "2x + 2y <= 6"])
+    assert PolyhedralTerm._solve_numerically(singular, [x, y]) is None
+    monkeypatch.setattr(polyhedra, "SOLVE_MAX_CONDITION", 1.0)
+    assert PolyhedralTerm._solve_numerically(context, [x, y]) is None
+    assert PolyhedralTerm.solve_for_variables(context, [x, y]) == numeric
+
+
+def test_projection_tactic(monkeypatch: pytest.MonkeyPatch) -> None:
+    terms = to_pts(["x + y + z <= 1", "x - y <= 2", "x - z <= 0"])
+    context = to_pts(["y - z <= 4", "-y <= 3"])
+    vars_to_elim = [Var("y"), Var("z")]
+    # the projection is opt-in: by default, the terms that tactics 1-5 cannot relax are dropped
+    assert polyhedra.PROJECTION_TACTIC not in polyhedra.TACTICS_ORDER
+    relaxed, _ = terms.elim_vars_by_relaxing(context, vars_to_elim)
+    assert relaxed == to_pts(["2x <= 4"])
+    # the projection is exact: the sum of the terms bounds x by 1
+    projected, tactics_data = terms.elim_vars_by_relaxing(
+        context, vars_to_elim, tactics_order=[polyhedra.PROJECTION_TACTIC]
+    )
+    assert projected == to_pts(["3x <= 3"])
+    assert tactics_data[-1][0] == polyhedra.PROJECTION_TACTIC
+    # projections exceeding the size cap are abandoned
+    polyhedra.query_cache.clear()
+    monkeypatch.setattr(polyhedra, "PROJECTION_MAX_TERMS", 0)
+    projected, tactics_data = terms.elim_vars_by_relaxing(
+        context, vars_to_elim, tactics_order=[polyhedra.PROJECTION_TACTIC]
+    )
+    assert projected == PolyhedralTermList([])
+    assert [data[0] for data in tactics_data] == [-1, -1, -1]
+
+
+def test_equality_tactic() -> None:
+    terms = to_pts(["z - y <= 3", "y - 2x = 1"])
+    order = [polyhedra.EQUALITY_TACTIC]
+    relaxed, tactics_data = terms.elim_vars_by_relaxing(PolyhedralTermList([]), [Var("y")], tactics_order=order)
+    assert relaxed == to_pts(["-2x + z <= 4"])
+    assert tactics_data == [(polyhedra.EQUALITY_TACTIC, tactics_data[0][1], 1)]
+    # refinements only use the equalities of the context
+    _, _, substituted = terms._substitute_equalities(PolyhedralTermList([]), [Var("y")], refine=True)
+    assert substituted == 0
+    refined, _ = to_pts(["z - y <= 3"]).elim_vars_by_refining(to_pts(["y - 2x = 1"]), [Var("y")], tactics_order=order)
+    assert refined == to_pts(["-2x + z <= 4"])
+    terms = to_pts(["x + y <= 1", "x <= 2", "-x - y <= -1", "-x <= 3"])
+    assert terms.to_str_list() == ["x + y = 1", "x <= 2", "-x <= 3"]
+    # the equalities are found once and kept through the substitutions
+    terms = to_pts(["y - 2x = 1", "w <= 2", "z - y = 0", "z + w <= 5"])
+    assert terms._equality_rows() == [(0, 1), (3, 4)]
+    vars_to_elim = [Var("y"), Var("z")]
+    substituted_terms, _, substituted = terms._substitute_equalities(PolyhedralTermList([]), vars_to_elim, False)
+    assert substituted == 2
+    assert substituted_terms == to_pts(["w <= 2", "w + 2x <= 4"])
+    # the equality tactic is opt-in: the default tactics keep the equalities and the trivial terms
+    assert polyhedra.EQUALITY_TACTIC not in polyhedra.TACTICS_ORDER
+    constraints = to_pts(["dt0 + t0 <= 0", "-t0 <= 0", "-dt0 - t0 + t1 <= 0", "dt0 + t0 - t1 <= 0"])
+    vars_to_elim = [Var("t0"), Var("dt0")]
+    relaxed, _ = constraints.elim_vars_by_relaxing(PolyhedralTermList([]), vars_to_elim, simplify=False)
+    assert relaxed == to_pts(["t1 <= 0", "0 <= 0"])
+    order = polyhedra.TACTICS_ORDER + [polyhedra.EQUALITY_TACTIC]
+    relaxed, _ = constraints.elim_vars_by_relaxing(PolyhedralTermList([]), vars_to_elim, False, order)
+    assert relaxed == to_pts(["t1 <= 0"])
+
+
+def test_rows_by_variable() -> None:
+    terms = to_pts(["x + y <= 1", "-x + z <= 2", "z <= 3"])
+    assert terms._rows_with_var(Var("x"), 1) == [0]
+    assert terms._rows_with_var(Var("x"), -1) == [1]
+    assert terms._rows_with_var(Var("z")) == [1, 2]
+    assert terms.get_terms_with_vars([Var("z"), Var("y")]) == to_pts(["x + y <= 1", "-x + z <= 2", "z <= 3"])
+    assert terms.get_terms_with_vars([Var("w")]) == PolyhedralTermList([])
+    # the index is extended for the appended terms and rebuilt when the terms change
+    extended = terms._extended(to_pts(["-x - z <= 0"]).terms)
+    assert extended._rows_with_var(Var("x"), -1) == [1, 3]
+    assert terms._rows_with_var(Var("x"), -1) == [1]
+    terms.add_terms(to_pts(["y - x <= 4"]).terms)
+    assert terms._rows_with_var(Var("x"), -1) == [1, 3]
+    assert terms.get_terms_with_vars([Var("y")]) == to_pts(["x + y <= 1", "-x + y <= 4"])
+    # copies leaving terms out renumber the rows of the index
+    left = extended._leave_out([0, 2])
+    assert left == to_pts(["-x + z <= 2", "-x - z <= 0"])
+    assert left._rows_with_var(Var("x"), -1) == [0, 1]
+    assert left._rows_with_var(Var("z"), 1) == [0]
+    assert left._rows_by_var() == to_pts(["-x + z <= 2", "-x - z <= 0"])._rows_by_var()
+    # replacing a term updates the index
+    terms.replace_term(1, to_pts(["x + z <= 2"]).terms[0])
+    assert terms._rows_with_var(Var("x"), 1) == [0, 1]
+    assert terms._rows_by_var() == to_pts(["x + y <= 1", "x + z <= 2", "z <= 3", "y - x <= 4"])._rows_by_var()
+    assert extended._rows_with_var(Var("x"), -1) == [1, 3]
+
+
+def test_transform_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = polyhedra.transform_cache
+    polyhedra.query_cache.enabled = False
+    terms = to_pts(["x + y <= 6", "-x <= 0", "x - 2y <= 1"])
+    context = to_pts(["y <= 5", "x <= 4"])
+    expected, tactics_data = terms.elim_vars_by_refining(context, [Var("y")])
+    assert [(tactic, count) for tactic, _, count in tactics_data] == [(1, 1), (-1, 0)]
+    assert cache.statistics()["hits"] == 0
+    refined, tactics_data = terms.elim_vars_by_refining(context, [Var("y")])
+    assert refined == expected
+    # repeated transformations report the tactic that first computed them and
+    # are counted as hits; failures after tactic 5, which reads all the
+    # helpers, are not cached
+    assert [(tactic, count) for tactic, _, count in tactics_data] == [(1, 1), (-1, 0)]
+    assert cache.statistics()["hits"] == 1
+    # other eliminations reuse the result when the helpers with y are the same
+    other, tactics_data = to_pts(["x - 2y <= 1", "x + y <= 6", "x <= 7"]).elim_vars_by_refining(
+        to_pts(["x <= 4", "y <= 5"]), [Var("y")]
+    )
+    assert (1, 1) in [(tactic, count) for tactic, _, count in tactics_data]
+    assert cache.statistics()["hits"] == 2
+    assert expected.terms[0] in other.terms
+    # but not when a helper with y changes
+    to_pts(["x + y <= 6", "x - 2y <= 2"]).elim_vars_by_refining(context, [Var("y")])
+    assert cache.statistics()["hits"] == 2
+    # nor when the solver settings change
+    monkeypatch.setattr(polyhedra, "SOLVE_MAX_CONDITION", 1e8)
+    terms.elim_vars_by_refining(context, [Var("y")])
+    assert cache.statistics()["hits"] == 2
+
+
+def test_query_cache_up_to_renaming() -> None:
+    cache = polyhedra.query_cache
+    terms = to_pts(["x + y <= 6", "-x <= 0", "x - 2y <= 1"])
+    context = to_pts(["y <= 5", "x <= 4"])
+    renaming = {Var("x"): Var("u"), Var("y"): Var("v")}
+    expected, _ = terms.elim_vars_by_refining(context, [Var("y")])
+    renamed, _ = terms.rename_variables(renaming).elim_vars_by_refining(context.rename_variables(renaming), [Var("v")])
+    assert cache.statistics()["hits"] == 1
+    assert renamed == expected.rename_variables(renaming)
+    # swapping the variables gives an equivalent query
+    swapped = terms.rename_variables({Var("x"): Var("y"), Var("y"): Var("x")})
+    assert swapped.simplify() == terms.simplify().rename_variables({Var("x"): Var("y"), Var("y"): Var("x")})
+    assert cache.statistics()["hits"] == 2
+    assert swapped.optimize({Var("y"): 1}) == terms.optimize({Var("x"): 1})
+    assert cache.statistics()["hits"] == 3
+    # the variables to eliminate are part of the query
+    eliminated, _ = terms.elim_vars_by_refining(context, [Var("x")])
+    assert eliminated != expected
+    # matrix-backed termlists are keyed from their rows, without materializing their terms
+    assert not terms.is_empty()
+    hits = cache.statistics()["hits"]
+    a = np.array([[0, 1.0, 1], [0, -1, 0], [0, 1, -2]])
+    matrix_backed = PolyhedralTermList.polytope_to_termlist(a, np.array([6, 0, 1.0]), [Var("z"), Var("u"), Var("v")])
+    assert not matrix_backed.is_empty()
+    assert cache.statistics()["hits"] == hits + 1
+    assert matrix_backed._terms is None
+    # the cached results refer to slot indices, so no variables are created for the slots
+    assert not [name for name in Var._intern_table if name.startswith("_slot")]
+
+
+def test_fingerprints() -> None:
+    terms = to_pts(["x + 2y <= 1", "-x <= 0", "y - x <= 3"])
+    shuffled = to_pts(["y - x <= 3", "x + 2y <= 1", "-x <= 0"])
+    assert terms.fingerprint() == shuffled.fingerprint()
+    assert terms.fingerprint(ordered=True) != shuffled.fingerprint(ordered=True)
+    assert len(terms.fingerprint()) == polyhedra.FINGERPRINT_BYTES
+    # the digests do not depend on the process
+    assert pickle.loads(pickle.dumps(terms)).fingerprint() == terms.fingerprint()
+    term = PolyhedralTerm({Var("x"): 1, Var("y"): -0.0}, 2)
+    assert term.fingerprint == PolyhedralTerm({Var("x"): 1.0}, 2.0).fingerprint
+    assert hash(term) == hash(PolyhedralTerm({Var("x"): 1.0}, 2.0))
+    assert term.fingerprint != PolyhedralTerm({Var("x"): 1.0}, 2.0 + 1e-15).fingerprint
+    # changing the terms discards the cached digest
+    copied = terms.copy()
+    copied.add_terms([PolyhedralTerm({Var("y"): 1}, 5)])
+    assert copied.fingerprint() != terms.fingerprint()
+    assert terms.copy().fingerprint() == terms.fingerprint()
+    assert len({terms, terms.copy(), copied}) == 2
+
+
+def store_entries(path: str, worker: int) -> None:
+    store = PersistentCache(path, "test")
+    for i in range(20):
+        store.store("{0}-{1}".format(worker, i), i)
+
+
+def test_persistent_cache(tmp_path: Path) -> None:
+    path = str(tmp_path / "queries.sqlite")
+    left = to_pts(["x <= 1", "-x <= 1", "y - x <= 0", "y <= 3"])
+    context = to_pts(["x <= 0"])
+    polyhedra.use_persistent_cache(path)
+    try:
+        polyhedra.query_cache.clear()
+        simplified = left.simplify(context)
+        relaxed, tactics_data = left.elim_vars_by_relaxing(context, [Var("x")])
+        store = polyhedra.persistent_cache
+        assert store is not None
+        assert len(store) == 3
+        # a new process only sees the file
+        polyhedra.query_cache.clear()
+        polyhedra.use_persistent_cache(path)
+        assert left.simplify(context) == simplified
+        assert left.elim_vars_by_relaxing(context, [Var("x")]) == (relaxed, tactics_data)
+        assert polyhedra.persistent_cache.hits == 2
+        # nor does a process with another backend
+        polyhedra.query_cache.clear()
+        with lp.use_backend("highs-ds"):
+            assert left.simplify(context) == simplified
+        assert polyhedra.persistent_cache.hits == 2
+        assert len(polyhedra.persistent_cache) == 4
+    finally:
+        polyhedra.use_persistent_cache(None)
+        polyhedra.query_cache.clear()
+    # another version of the library discards the stored results
+    assert len(PersistentCache(path, "0.0.0")) == 0
+    with ProcessPoolExecutor(4) as pool:
+        list(pool.map(store_entries, [path] * 4, range(4)))
+    store = PersistentCache(path, "test")
+    assert len(store) == 80
+    assert store.lookup("3-19") == (True, 19)
+    # entries that are not JSON data are misses
+    with closing(sqlite3.connect(path)) as connection, connection:
+        connection.execute("UPDATE entries SET value = ? WHERE key = '3-19'", (pickle.dumps(19),))
+    assert store.lookup("3-19") == (False, None)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_lp_executors(executor: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = np.random.default_rng(3)
+    a = rng.normal(size=(40, 12))
+    b = rng.uniform(0.5, 2, size=40)
+    a_small, b_small = a[:20], b[:20] * 2
+    expected = PolyhedralTermList.reduce_polytope(a, b)
+    contained = PolyhedralTermList.verify_polytope_containment(a, b, a_small, b_small)
+    not_contained = PolyhedralTermList.verify_polytope_containment(a_small, b_small, a, b)
+    tasks = [(-a[i], np.arange(40) != i, b) for i in range(40)]
+
+    def facet(i: int, res: dict) -> bool:
+        return res["status"] == 0 and -res["fun"] > b[i]
+
+    serial = lp.solve_lps(a, tasks, stop=facet)
+    lp.set_executor(executor, 2)
+    try:
+        # small problems are not dispatched to the pool
+        assert PolyhedralTermList.verify_polytope_containment(a[:5], b[:5], a_small[:5], b_small[:5])
+        assert lp._executor is None
+        monkeypatch.setattr(polyhedra, "PARALLEL_MIN_LPS", 1)
+        obtained = PolyhedralTermList.reduce_polytope(a, b)
+        assert PolyhedralTermList.verify_polytope_containment(a, b, a_small, b_small) == contained
+        assert PolyhedralTermList.verify_polytope_containment(a_small, b_small, a, b) == not_contained
+        parallel = lp.solve_lps(a, tasks, stop=facet)
+    finally:
+        lp.set_executor("serial")
+    assert np.array_equal(obtained[0], expected[0])
+    assert np.array_equal(obtained[1], expected[1])
+    assert [res["status"] for res in parallel] == [res["status"] for res in serial]
+    assert facet(len(serial) - 1, serial[-1])
+    assert contained
+    assert not not_contained
+    assert len(serial) < 40
+    with pytest.raises(ValueError):
+        lp.set_executor("cluster")
+
+
+@pytest.mark.parametrize("backend", ["highs", "highs-ds", "highs-ipm"])
+def test_lp_backends(backend: str) -> None:
+    terms = to_pts(["x + y <= 3", "-x <= 0", "-y <= 0"])
+    lp.reset_statistics()
+    with lp.use_backend(backend):
+        assert terms.optimize({Var("x"): 1, Var("y"): 2}, maximize=True) == pytest.approx(6)
+        assert not PolyhedralTermList.is_polytope_empty(np.array([[1.0], [-1.0]]), np.array([1, 0]))
+    assert lp.get_backend().name == lp.DEFAULT_BACKEND
+    stats = lp.get_statistics()[backend]
+    assert stats["optimize"]["calls"] == 1
+    assert stats["optimize"]["statuses"] == {0: 1}
+    assert stats["is_polytope_empty"]["time"] >= 0
+    with pytest.raises(ValueError):
+        lp.set_backend("simplex")
+
+
 if __name__ == "__main__":
     test_relaxing2()